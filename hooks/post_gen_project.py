@@ -1,7 +1,45 @@
-"""Post-generation hook: initialize the generated project."""
+"""Post-generation hook: trim and initialize the generated project."""
 
+import shutil
 import subprocess
 import sys
+from pathlib import Path
+
+
+PACKAGE_DIR = Path("src", "{{ cookiecutter.package_name }}")
+
+# Runtime tuning modules and performance tooling, with their tests, left
+# out of the ``minimal`` profile.
+HIGH_THROUGHPUT_MODULES = [
+    "transport",
+    "metrics",
+    "resilience",
+    "ratelimit",
+    "dedup",
+    "keys",
+    "offload",
+    "cache",
+    "coalesce",
+    "response_log",
+    "mock_gateway",
+]
+HIGH_THROUGHPUT_ONLY = [
+    *(PACKAGE_DIR / f"{name}.py" for name in HIGH_THROUGHPUT_MODULES),
+    *(Path("tests", f"test_{name}.py") for name in HIGH_THROUGHPUT_MODULES),
+    PACKAGE_DIR / "loadtest.py",
+    Path("tests", "benchmarks"),
+]
+
+
+def remove_unused_files(profile):
+    """Remove the files the chosen performance profile does not use."""
+    if profile == "high_throughput":
+        return
+    for path in HIGH_THROUGHPUT_ONLY:
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink(missing_ok=True)
 
 
 def init_git():
@@ -26,6 +64,7 @@ def init_git():
         print("Warning: could not initialize git repository.", file=sys.stderr)
 
 
+remove_unused_files("{{ cookiecutter.performance_profile }}")
 init_git()
 
 print(
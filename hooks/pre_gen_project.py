@@ -1,6 +1,7 @@
 """Pre-generation hook: validate cookiecutter inputs."""
 
 import ast
+import json
 import logging
 import re
 import sys
@@ -10,10 +11,17 @@ logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger("pre_gen_project")
 
 SLUG_REGEX = r"^[a-z][a-z0-9_]*$"
+JSON_BACKENDS = ("stdlib", "orjson", "msgspec")
+PERFORMANCE_PROFILES = ("minimal", "high_throughput")
 
 gateway_slug = "{{ cookiecutter.gateway_slug }}"
 package_name = "{{ cookiecutter.package_name }}"
+json_backend = "{{ cookiecutter.json_backend }}"
+performance_profile = "{{ cookiecutter.performance_profile }}"
 accepted_currencies_raw = "{{ cookiecutter.accepted_currencies }}"
+iso4217_minor_units = json.loads(
+    """{{ cookiecutter._iso4217_minor_units | jsonify }}"""
+)
 
 if not re.match(SLUG_REGEX, gateway_slug):
     logger.error(
@@ -53,3 +61,30 @@ if (
         "e.g. ['PLN', 'EUR']."
     )
     sys.exit(1)
+
+unknown_currencies = [
+    code for code in accepted_currencies if code not in iso4217_minor_units
+]
+if unknown_currencies:
+    logger.error(
+        "Unknown currency codes in accepted_currencies: %s. "
+        "Use active ISO 4217 codes in upper case, e.g. ['PLN', 'EUR'].",
+        ", ".join(unknown_currencies),
+    )
+    sys.exit(1)
+
+if json_backend not in JSON_BACKENDS:
+    logger.error(
+        "Invalid json_backend '%s'. Choose one of: %s.",
+        json_backend,
+        ", ".join(JSON_BACKENDS),
+    )
+    sys.exit(1)
+
+if performance_profile not in PERFORMANCE_PROFILES:
+    logger.error(
+        "Invalid performance_profile '%s'. Choose one of: %s.",
+        performance_profile,
+        ", ".join(PERFORMANCE_PROFILES),
+    )
+    sys.exit(1)
@@ -1,18 +1,31 @@
 """Bake tests for the cookiecutter-getpaid-backend template.
 
-These tests use pytest-cookies to bake the cookiecutter template
-and verify the generated project has the expected structure, content,
-and configuration.
+These tests bake the cookiecutter template and verify the generated
+project has the expected structure, content, and configuration.
+
+Each distinct bake context is rendered once per session and shared
+read-only between tests. The variants in ``PREBAKED_CONTEXTS`` are
+baked in parallel up front and linted together by a single ruff run.
 """
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
+import json
+import os
 import re
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
 
 
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent
+
 # -- Default bake context for convenience --
 
 DEFAULT_CONTEXT = {
@@ -23,15 +36,108 @@ DEFAULT_CONTEXT = {
     "accepted_currencies": "['PLN', 'EUR']",
 }
 
+# -- Variants baked in parallel and covered by the ruff checks --
+
+PREBAKED_CONTEXTS = [
+    {},
+    {"gateway_name": "StripeConnect"},
+    {"gateway_name": "Pay Now"},
+    {"open_source_license": "MIT"},
+    {"open_source_license": "BSD-3-Clause"},
+    {"open_source_license": "Apache-2.0"},
+    {"json_backend": "orjson"},
+    {"json_backend": "msgspec"},
+    {"performance_profile": "high_throughput"},
+]
+
+HIGH_THROUGHPUT = {"performance_profile": "high_throughput"}
+JSON_BACKENDS = ["stdlib", "orjson", "msgspec"]
+
 
-def _bake(cookies, extra_context=None):
-    """Bake the template and assert success."""
+@dataclass(frozen=True)
+class BakeResult:
+    """A successfully baked project, shared read-only between tests."""
+
+    project_path: Path
+
+
+def _context_key(extra_context=None):
+    """Return a stable hash of the full bake context."""
     ctx = {**DEFAULT_CONTEXT, **(extra_context or {})}
-    result = cookies.bake(extra_context=ctx)
-    assert result.exit_code == 0, result.exception
-    assert result.exception is None
-    assert result.project_path.is_dir()
-    return result
+    encoded = json.dumps(ctx, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _bake(output_dir, extra_context=None):
+    """Bake the template into ``output_dir`` and assert success."""
+    ctx = {**DEFAULT_CONTEXT, **(extra_context or {})}
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "cookiecutter",
+            "--no-input",
+            "--output-dir",
+            str(output_dir),
+            str(TEMPLATE_DIR),
+            *(f"{key}={value}" for key, value in ctx.items()),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    projects = [path for path in output_dir.iterdir() if path.is_dir()]
+    assert len(projects) == 1
+    return BakeResult(project_path=projects[0])
+
+
+class BakeCache:
+    """Session-wide cache of baked projects keyed by context hash."""
+
+    def __init__(self, root):
+        self._root = root
+        self._results = {}
+
+    def bake_many(self, contexts):
+        """Bake every context not seen yet in parallel; return results."""
+        pending = {
+            _context_key(ctx): ctx
+            for ctx in contexts
+            if _context_key(ctx) not in self._results
+        }
+        with ThreadPoolExecutor() as executor:
+            futures = {
+                key: executor.submit(_bake, self._root / key, ctx)
+                for key, ctx in pending.items()
+            }
+        for key, future in futures.items():
+            self._results[key] = future.result()
+        return [self._results[_context_key(ctx)] for ctx in contexts]
+
+    def bake(self, extra_context=None):
+        """Return the (possibly cached) bake of ``extra_context``."""
+        return self.bake_many([extra_context or {}])[0]
+
+
+@pytest.fixture(scope="session")
+def bake_cache(tmp_path_factory):
+    """Provide the session bake cache, pre-baking ``PREBAKED_CONTEXTS``."""
+    cache = BakeCache(tmp_path_factory.mktemp("bakes"))
+    cache.bake_many(PREBAKED_CONTEXTS)
+    return cache
+
+
+@pytest.fixture(scope="session")
+def bake(bake_cache):
+    """Provide a callable returning the cached bake for a context."""
+    return bake_cache.bake
+
+
+@pytest.fixture(scope="session")
+def projects(bake_cache):
+    """Provide the project paths of every pre-baked variant."""
+    results = bake_cache.bake_many(PREBAKED_CONTEXTS)
+    return [str(result.project_path) for result in results]
 
 
 # ---------------------------------------------------------------
@@ -42,13 +148,13 @@ def _bake(cookies, extra_context=None):
 class TestProjectStructure:
     """Verify the generated project has the expected files."""
 
-    def test_bake_with_defaults(self, cookies):
-        result = _bake(cookies)
+    def test_bake_with_defaults(self, bake):
+        result = bake()
         project = result.project_path
         assert project.name == "python-getpaid-mygateway"
 
-    def test_top_level_files(self, cookies):
-        project = _bake(cookies).project_path
+    def test_top_level_files(self, bake):
+        project = bake().project_path
         expected = [
             "pyproject.toml",
             "README.md",
@@ -61,14 +167,22 @@ class TestProjectStructure:
         for name in expected:
             assert (project / name).is_file(), f"Missing {name}"
 
-    def test_source_layout(self, cookies):
-        project = _bake(cookies).project_path
+    def test_source_layout(self, bake):
+        project = bake().project_path
         pkg = project / "src" / "getpaid_mygateway"
         expected = [
             "__init__.py",
             "processor.py",
             "client.py",
+            "api.py",
             "types.py",
+            "concurrency.py",
+            "currency.py",
+            "signature.py",
+            "streaming.py",
+            "auth.py",
+            "codec.py",
+            "deadline.py",
             "py.typed",
         ]
         for name in expected:
@@ -76,15 +190,49 @@ class TestProjectStructure:
                 f"Missing src/getpaid_mygateway/{name}"
             )
 
-    def test_tests_layout(self, cookies):
-        project = _bake(cookies).project_path
+    def test_tests_layout(self, bake):
+        project = bake().project_path
         tests = project / "tests"
-        expected = ["__init__.py", "conftest.py", "test_processor.py"]
+        expected = [
+            "__init__.py",
+            "conftest.py",
+            "test_processor.py",
+            "test_imports.py",
+            "test_batch.py",
+            "test_signature.py",
+            "test_streaming.py",
+            "test_auth.py",
+            "test_types.py",
+            "test_currency.py",
+            "test_sync.py",
+            "test_codec.py",
+            "test_deadline.py",
+        ]
         for name in expected:
             assert (tests / name).is_file(), f"Missing tests/{name}"
 
-    def test_docs_layout(self, cookies):
-        project = _bake(cookies).project_path
+    def test_benchmarks_layout(self, bake):
+        project = bake(HIGH_THROUGHPUT).project_path
+        benchmarks = project / "tests" / "benchmarks"
+        expected = [
+            "__init__.py",
+            "conftest.py",
+            "test_transport_benchmark.py",
+            "test_signature_benchmark.py",
+            "test_processor_benchmark.py",
+            "test_types_benchmark.py",
+            "test_currency_benchmark.py",
+            "test_sync_benchmark.py",
+            "test_codec_benchmark.py",
+            "test_offload_benchmark.py",
+        ]
+        for name in expected:
+            assert (benchmarks / name).is_file(), (
+                f"Missing tests/benchmarks/{name}"
+            )
+
+    def test_docs_layout(self, bake):
+        project = bake().project_path
         docs = project / "docs"
         expected = [
             "conf.py",
@@ -102,8 +250,8 @@ class TestProjectStructure:
         for name in expected:
             assert (docs / name).is_file(), f"Missing docs/{name}"
 
-    def test_github_issue_template(self, cookies):
-        project = _bake(cookies).project_path
+    def test_github_issue_template(self, bake):
+        project = bake().project_path
         tmpl = project / ".github" / "ISSUE_TEMPLATE.md"
         assert tmpl.is_file()
 
@@ -116,9 +264,8 @@ class TestProjectStructure:
 class TestVariableSubstitution:
     """Verify cookiecutter variables are correctly substituted."""
 
-    def test_custom_gateway_name(self, cookies):
-        result = _bake(
-            cookies,
+    def test_custom_gateway_name(self, bake):
+        result = bake(
             extra_context={"gateway_name": "StripeConnect"},
         )
         project = result.project_path
@@ -126,22 +273,37 @@ class TestVariableSubstitution:
         pkg = project / "src" / "getpaid_stripeconnect"
         assert pkg.is_dir()
 
-    def test_processor_class_name(self, cookies):
-        result = _bake(cookies)
+    def test_processor_class_name(self, bake):
+        result = bake()
         processor = (
             result.project_path / "src" / "getpaid_mygateway" / "processor.py"
         )
         content = processor.read_text()
         assert "class MyGatewayProcessor(BaseProcessor):" in content
 
-    def test_client_class_name(self, cookies):
-        result = _bake(cookies)
+    def test_client_class_name(self, bake):
+        result = bake()
         client = result.project_path / "src" / "getpaid_mygateway" / "client.py"
         content = client.read_text()
-        assert "class MyGatewayClient:" in content
+        assert "class MyGatewayClient(_BaseClient):" in content
+
+    def test_sync_class_names(self, bake):
+        result = bake(extra_context={"gateway_name": "StripeConnect"})
+        pkg = result.project_path / "src" / "getpaid_stripeconnect"
+        client = (pkg / "client.py").read_text()
+        assert "class StripeConnectSyncClient(_BaseClient):" in client
+        assert 'def __enter__(self) -> "StripeConnectSyncClient":' in client
+        processor = (pkg / "processor.py").read_text()
+        assert "class StripeConnectSyncProcessor:" in processor
+        assert "processor_class = StripeConnectProcessor" in processor
+        init = (pkg / "__init__.py").read_text()
+        assert (
+            '"StripeConnectSyncProcessor": "getpaid_stripeconnect.processor"'
+            in init
+        )
 
-    def test_slug_in_processor(self, cookies):
-        result = _bake(cookies)
+    def test_slug_in_processor(self, bake):
+        result = bake()
         processor = (
             result.project_path / "src" / "getpaid_mygateway" / "processor.py"
         )
@@ -149,17 +311,27 @@ class TestVariableSubstitution:
         assert 'slug: ClassVar[str] = "mygateway"' in content
         assert 'display_name: ClassVar[str] = "MyGateway"' in content
 
-    def test_init_exports(self, cookies):
-        result = _bake(cookies)
+    def test_init_exports(self, bake):
+        result = bake()
         init = result.project_path / "src" / "getpaid_mygateway" / "__init__.py"
         content = init.read_text()
         assert "MyGatewayClient" in content
         assert "MyGatewayProcessor" in content
         assert '__version__ = "0.1.0"' in content
 
-    def test_author_in_pyproject(self, cookies):
-        result = _bake(
-            cookies,
+    def test_init_exports_are_lazy(self, bake):
+        result = bake()
+        init = result.project_path / "src" / "getpaid_mygateway" / "__init__.py"
+        content = init.read_text()
+        assert "def __getattr__(name: str)" in content
+        assert '"MyGatewayClient": "getpaid_mygateway.client"' in content
+        assert (
+            "from getpaid_mygateway.client import"
+            not in content.split("if TYPE_CHECKING:")[0]
+        )
+
+    def test_author_in_pyproject(self, bake):
+        result = bake(
             extra_context={
                 "full_name": "Jan Kowalski",
                 "email": "jan@example.com",
@@ -169,18 +341,16 @@ class TestVariableSubstitution:
         assert "Jan Kowalski" in content
         assert "jan@example.com" in content
 
-    def test_urls_use_github_org(self, cookies):
-        result = _bake(
-            cookies,
+    def test_urls_use_github_org(self, bake):
+        result = bake(
             extra_context={"github_org": "my-org"},
         )
         content = (result.project_path / "pyproject.toml").read_text()
         assert "my-org/python-getpaid-mygateway" in content
 
-    def test_gateway_with_underscores(self, cookies):
+    def test_gateway_with_underscores(self, bake):
         """Gateway name with spaces produces underscored slug."""
-        result = _bake(
-            cookies,
+        result = bake(
             extra_context={"gateway_name": "Pay Now"},
         )
         project = result.project_path
@@ -200,60 +370,97 @@ class TestVariableSubstitution:
 class TestPyprojectToml:
     """Verify generated pyproject.toml has correct configuration."""
 
-    def _read_pyproject(self, cookies, extra_context=None):
-        result = _bake(cookies, extra_context=extra_context)
+    def _read_pyproject(self, bake, extra_context=None):
+        result = bake(extra_context=extra_context)
         return (result.project_path / "pyproject.toml").read_text()
 
-    def test_project_name(self, cookies):
-        content = self._read_pyproject(cookies)
+    def test_project_name(self, bake):
+        content = self._read_pyproject(bake)
         assert "name = 'python-getpaid-mygateway'" in content
 
-    def test_build_system(self, cookies):
-        content = self._read_pyproject(cookies)
+    def test_build_system(self, bake):
+        content = self._read_pyproject(bake)
         assert "hatchling" in content
         assert "build-backend = 'hatchling.build'" in content
 
-    def test_python_requires(self, cookies):
-        content = self._read_pyproject(cookies)
+    def test_python_requires(self, bake):
+        content = self._read_pyproject(bake)
         assert "requires-python = '>=3.12'" in content
 
-    def test_dependencies(self, cookies):
-        content = self._read_pyproject(cookies)
+    def test_dependencies(self, bake):
+        content = self._read_pyproject(bake)
         assert "'python-getpaid-core>=3.0.0a3'" in content
         assert "'httpx>=0.27.0'" in content
 
-    def test_entry_point(self, cookies):
-        content = self._read_pyproject(cookies)
+    def test_entry_point(self, bake):
+        content = self._read_pyproject(bake)
         assert '[project.entry-points."getpaid.backends"]' in content
         assert (
             "mygateway = 'getpaid_mygateway.processor:MyGatewayProcessor'"
             in content
         )
 
-    def test_hatch_wheel_packages(self, cookies):
-        content = self._read_pyproject(cookies)
+    def test_loadtest_script(self, bake):
+        content = self._read_pyproject(bake, HIGH_THROUGHPUT)
+        assert "[project.scripts]" in content
+        assert (
+            "getpaid-mygateway-loadtest = 'getpaid_mygateway.loadtest:main'"
+            in content
+        )
+
+    def test_hatch_wheel_packages(self, bake):
+        content = self._read_pyproject(bake)
         assert "packages = ['src/getpaid_mygateway']" in content
 
-    def test_pytest_config(self, cookies):
-        content = self._read_pyproject(cookies)
+    def test_pytest_config(self, bake):
+        content = self._read_pyproject(bake)
         assert "asyncio_mode = 'auto'" in content
 
-    def test_ruff_config(self, cookies):
-        content = self._read_pyproject(cookies)
+    def test_ruff_config(self, bake):
+        content = self._read_pyproject(bake)
         assert "target-version = 'py312'" in content
 
-    def test_ty_config(self, cookies):
-        content = self._read_pyproject(cookies)
+    def test_ty_config(self, bake):
+        content = self._read_pyproject(bake)
         assert "python-version = '3.12'" in content
         assert "error-on-warning = true" in content
 
-    def test_dev_dependencies(self, cookies):
-        content = self._read_pyproject(cookies)
-        for dep in ["pytest", "pytest-asyncio", "ruff", "ty", "respx"]:
+    def test_dev_dependencies(self, bake):
+        content = self._read_pyproject(bake)
+        for dep in [
+            "pytest",
+            "pytest-asyncio",
+            "ruff",
+            "ty",
+            "respx",
+            "hypothesis",
+        ]:
             assert dep in content, f"Missing dev dependency: {dep}"
 
-    def test_docs_dependencies(self, cookies):
-        content = self._read_pyproject(cookies)
+    def test_http2_extra(self, bake):
+        content = self._read_pyproject(bake, HIGH_THROUGHPUT)
+        assert "http2 = [" in content
+        assert "'httpx[http2]>=0.27.0'" in content
+
+    def test_benchmarks_disabled_by_default(self, bake):
+        content = self._read_pyproject(bake, HIGH_THROUGHPUT)
+        assert "--benchmark-disable" in content
+
+    def test_benchmark_baselines_and_regression_threshold(self, bake):
+        content = self._read_pyproject(bake, HIGH_THROUGHPUT)
+        assert "--benchmark-storage=tests/benchmarks/baselines" in content
+        assert "benchmark_max_regression = ['median:20%']" in content
+        project = bake(HIGH_THROUGHPUT).project_path
+        conftest = (project / "tests" / "conftest.py").read_text()
+        assert '"benchmark_max_regression"' in conftest
+
+    def test_slow_tests_deselected_by_default(self, bake):
+        content = self._read_pyproject(bake)
+        assert "-m 'not slow'" in content
+        assert "'slow: " in content
+
+    def test_docs_dependencies(self, bake):
+        content = self._read_pyproject(bake)
         for dep in ["furo", "sphinx", "myst-parser"]:
             assert dep in content, f"Missing docs dependency: {dep}"
 
@@ -283,10 +490,9 @@ class TestLicenseSelection:
         ],
     )
     def test_license_file(
-        self, cookies, license_choice, expected_text, expected_classifier
+        self, bake, license_choice, expected_text, expected_classifier
     ):
-        result = _bake(
-            cookies,
+        result = bake(
             extra_context={"open_source_license": license_choice},
         )
         license_content = (result.project_path / "LICENSE").read_text()
@@ -295,20 +501,230 @@ class TestLicenseSelection:
         pyproject = (result.project_path / "pyproject.toml").read_text()
         assert expected_classifier in pyproject
 
-    def test_license_has_author_name(self, cookies):
-        result = _bake(
-            cookies,
+    def test_license_has_author_name(self, bake):
+        result = bake(
             extra_context={"full_name": "Jan Kowalski"},
         )
         license_content = (result.project_path / "LICENSE").read_text()
         assert "Jan Kowalski" in license_content
 
-    def test_license_in_pyproject(self, cookies):
-        result = _bake(cookies)
+    def test_license_in_pyproject(self, bake):
+        result = bake()
         content = (result.project_path / "pyproject.toml").read_text()
         assert "license = {text = 'MIT'}" in content
 
 
+# ---------------------------------------------------------------
+# JSON backend selection
+# ---------------------------------------------------------------
+
+
+def _can_run_generated_tests():
+    """Return whether this interpreter can run a generated test suite."""
+    return sys.version_info >= (3, 12) and all(
+        importlib.util.find_spec(name) is not None
+        for name in ["getpaid_core", "pytest_asyncio", "respx", "hypothesis"]
+    )
+
+
+def _run_generated_tests(project):
+    """Run a generated project's tests, skipping the unimplemented stubs."""
+    return subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            "--deselect",
+            "tests/test_processor.py::TestImplementationContract",
+        ],
+        cwd=project,
+        env={**os.environ, "PYTHONPATH": _pythonpath(project / "src")},
+        capture_output=True,
+        text=True,
+    )
+
+
+def _pythonpath(*paths):
+    """Return ``PYTHONPATH`` with ``paths`` prepended."""
+    current = os.environ.get("PYTHONPATH")
+    return os.pathsep.join([*map(str, paths), *([current] if current else [])])
+
+
+class TestJsonBackend:
+    """Verify the codec module and extras for each JSON backend."""
+
+    @pytest.mark.parametrize("backend", JSON_BACKENDS)
+    def test_codec_module(self, bake, backend):
+        result = bake(extra_context={"json_backend": backend})
+        codec = (
+            result.project_path / "src" / "getpaid_mygateway" / "codec.py"
+        ).read_text()
+        assert f'BACKEND = "{backend}"' in codec
+        assert "def _stdlib_loads(" in codec
+        for other in JSON_BACKENDS[1:]:
+            assert (f"import {other}" in codec) == (other == backend)
+
+    @pytest.mark.parametrize("backend", JSON_BACKENDS[1:])
+    def test_optional_extra(self, bake, backend):
+        result = bake(extra_context={"json_backend": backend})
+        content = (result.project_path / "pyproject.toml").read_text()
+        dependencies = content.split("[project.optional-dependencies]")[0]
+        assert backend not in dependencies
+        assert "json = [" in content
+        assert f"'{backend}>=" in content
+
+    def test_stdlib_has_no_extra(self, bake):
+        content = (bake().project_path / "pyproject.toml").read_text()
+        assert "json = [" not in content
+        assert "orjson" not in content
+        assert "msgspec" not in content
+
+    def test_msgspec_structs(self, bake):
+        result = bake(extra_context={"json_backend": "msgspec"})
+        content = (
+            result.project_path / "src" / "getpaid_mygateway" / "types.py"
+        ).read_text()
+        assert "class Struct(msgspec.Struct):" in content
+        assert "msgspec.json.Decoder(cls)" in content
+        assert "from .codec import loads" not in content
+        assert "@dataclass(slots=True)" not in content
+
+    def test_codec_used_for_bodies(self, bake):
+        pkg = bake().project_path / "src" / "getpaid_mygateway"
+        for name in ["client.py", "types.py", "processor.py", "streaming.py"]:
+            content = (pkg / name).read_text()
+            assert "from .codec import loads" in content, name
+        assert "import json" not in (pkg / "processor.py").read_text()
+
+    @pytest.mark.skipif(
+        not _can_run_generated_tests(),
+        reason="needs Python 3.12+ with the generated dev dependencies",
+    )
+    @pytest.mark.parametrize("backend", JSON_BACKENDS)
+    def test_generated_tests_pass(self, bake, backend):
+        project = bake(extra_context={"json_backend": backend}).project_path
+        proc = _run_generated_tests(project)
+        assert proc.returncode == 0, proc.stdout[-4000:]
+
+
+# ---------------------------------------------------------------
+# Performance profile selection
+# ---------------------------------------------------------------
+
+
+class TestPerformanceProfile:
+    """Verify the scaffolding generated for each performance profile."""
+
+    HIGH_THROUGHPUT_MODULES = (
+        "transport",
+        "metrics",
+        "resilience",
+        "ratelimit",
+        "dedup",
+        "keys",
+        "offload",
+        "cache",
+        "coalesce",
+        "response_log",
+        "mock_gateway",
+    )
+    HIGH_THROUGHPUT_FILES = (
+        *(
+            f"src/getpaid_mygateway/{name}.py"
+            for name in HIGH_THROUGHPUT_MODULES
+        ),
+        *(f"tests/test_{name}.py" for name in HIGH_THROUGHPUT_MODULES),
+        "src/getpaid_mygateway/loadtest.py",
+        "tests/benchmarks/conftest.py",
+    )
+
+    @pytest.mark.parametrize(
+        ("profile", "expected"), [("high_throughput", True), ("minimal", False)]
+    )
+    def test_performance_tooling(self, bake, profile, expected):
+        project = bake(
+            extra_context={"performance_profile": profile}
+        ).project_path
+        for name in self.HIGH_THROUGHPUT_FILES:
+            assert (project / name).exists() == expected, name
+        pyproject = (project / "pyproject.toml").read_text()
+        assert ("pytest-benchmark" in pyproject) == expected
+        assert ("--benchmark-disable" in pyproject) == expected
+        assert ("-loadtest = " in pyproject) == expected
+        assert ("http2 = [" in pyproject) == expected
+        conftest = (project / "tests" / "conftest.py").read_text()
+        assert ("benchmark_max_regression" in conftest) == expected
+
+    def test_minimal_by_default(self, bake):
+        project = bake().project_path
+        for name in self.HIGH_THROUGHPUT_FILES:
+            assert not (project / name).exists(), name
+
+    @pytest.mark.parametrize(
+        ("profile", "expected"), [("high_throughput", True), ("minimal", False)]
+    )
+    def test_runtime_tuning_only_in_high_throughput(
+        self, bake, profile, expected
+    ):
+        project = bake(
+            extra_context={"performance_profile": profile}
+        ).project_path
+        pkg = project / "src" / "getpaid_mygateway"
+        sources = "".join(path.read_text() for path in pkg.glob("*.py"))
+        for module in self.HIGH_THROUGHPUT_MODULES:
+            imported = re.search(rf"from \.{module} import", sources)
+            assert bool(imported) == expected, module
+        processor = (pkg / "processor.py").read_text()
+        for key in [
+            "max_connections",
+            "request_metrics",
+            "retry_max_attempts",
+            "rate_limit",
+            "callback_dedup",
+            "callback_keys_path",
+            "callback_verify_executor",
+            "response_cache",
+            "status_coalescing",
+            "response_log_size",
+        ]:
+            assert (f'"{key}"' in processor) == expected, key
+        for name in ["README.md", "docs/configuration.md"]:
+            content = (project / name).read_text()
+            assert ("max_connections" in content) == expected, name
+            assert ("callback_dedup" in content) == expected, name
+        reference = (project / "docs" / "reference.md").read_text()
+        for module in self.HIGH_THROUGHPUT_MODULES:
+            documented = f"automodule:: getpaid_mygateway.{module}\n"
+            assert (documented in reference) == expected, module
+
+    def test_minimal_docs_skip_load_testing(self, bake):
+        project = bake(
+            extra_context={"performance_profile": "minimal"}
+        ).project_path
+        for name in [
+            "README.md",
+            "CONTRIBUTING.md",
+            "docs/configuration.md",
+            "docs/reference.md",
+        ]:
+            content = (project / name).read_text()
+            assert "loadtest" not in content, name
+            assert "mock_gateway" not in content, name
+            assert "benchmarks" not in content, name
+
+    @pytest.mark.skipif(
+        not _can_run_generated_tests(),
+        reason="needs Python 3.12+ with the generated dev dependencies",
+    )
+    def test_high_throughput_generated_tests_pass(self, bake):
+        project = bake(HIGH_THROUGHPUT).project_path
+        proc = _run_generated_tests(project)
+        assert proc.returncode == 0, proc.stdout[-4000:]
+
+
 # ---------------------------------------------------------------
 # Source file content
 # ---------------------------------------------------------------
@@ -317,16 +733,16 @@ class TestLicenseSelection:
 class TestSourceContent:
     """Verify the generated source files have correct content."""
 
-    def test_processor_inherits_base_processor(self, cookies):
-        result = _bake(cookies)
+    def test_processor_inherits_base_processor(self, bake):
+        result = bake()
         content = (
             result.project_path / "src" / "getpaid_mygateway" / "processor.py"
         ).read_text()
         assert "from getpaid_core.processor import BaseProcessor" in content
         assert "class MyGatewayProcessor(BaseProcessor):" in content
 
-    def test_processor_has_required_methods(self, cookies):
-        result = _bake(cookies)
+    def test_processor_has_required_methods(self, bake):
+        result = bake()
         content = (
             result.project_path / "src" / "getpaid_mygateway" / "processor.py"
         ).read_text()
@@ -338,9 +754,110 @@ class TestSourceContent:
         ]:
             assert f"async def {method}" in content
 
-    def test_processor_has_sandbox_and_production_urls(self, cookies):
-        result = _bake(
-            cookies,
+    def test_processor_has_batch_status_api(self, bake):
+        result = bake()
+        content = (
+            result.project_path / "src" / "getpaid_mygateway" / "processor.py"
+        ).read_text()
+        assert "async def fetch_payment_statuses(" in content
+        assert "async def fetch_bulk_status(" in content
+        assert "bulk_status_batch_size: ClassVar[int] = 0" in content
+        assert '"status_concurrency"' in content
+
+    def test_processor_has_callback_ingestion_api(self, bake):
+        result = bake()
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        processor = (pkg / "processor.py").read_text()
+        assert "async def ingest_callbacks(" in processor
+        assert "def _get_callback_payment_id(" in processor
+        assert '"callback_max_pending"' in processor
+        concurrency = (pkg / "concurrency.py").read_text()
+        assert "async def ordered_by_key[K, T, R](" in concurrency
+
+    def test_client_response_cache(self, bake):
+        result = bake(HIGH_THROUGHPUT)
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        client = (pkg / "client.py").read_text()
+        assert "cache.lookup(key)" in client
+        cache = (pkg / "cache.py").read_text()
+        assert "class ResponseCache:" in cache
+        assert '"If-None-Match"' in cache
+        processor = (pkg / "processor.py").read_text()
+        assert '"response_cache"' in processor
+
+    def test_operations_accept_a_deadline(self, bake):
+        result = bake()
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        processor = (pkg / "processor.py").read_text()
+        for operation in [
+            "prepare_transaction",
+            "fetch_payment_status",
+            "start_refund",
+        ]:
+            assert re.search(
+                rf"def {operation}\([^)]*deadline: Budget \| None = None",
+                processor,
+            ), operation
+        assert '"operation_deadline"' in processor
+        client = (pkg / "client.py").read_text()
+        assert "current_deadline()" in client
+        assert "deadline.guard()" in client
+
+    def test_status_fetches_are_coalesced(self, bake):
+        result = bake(HIGH_THROUGHPUT)
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        processor = (pkg / "processor.py").read_text()
+        assert "coalescer.do(key" in processor
+        assert "coalescer.do_sync(key" in processor
+        assert '"status_cache_ttl"' in processor
+        coalesce = (pkg / "coalesce.py").read_text()
+        assert "_status_calls_total" in coalesce
+
+    def test_requests_are_rate_limited(self, bake):
+        result = bake(HIGH_THROUGHPUT)
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        resilience = (pkg / "resilience.py").read_text()
+        assert "await self.limiter.acquire()" in resilience
+        assert "self.limiter.observe(response)" in resilience
+        processor = (pkg / "processor.py").read_text()
+        assert '"rate_limit"' in processor
+        assert "request_priority(Priority.BATCH)" in processor
+
+    def test_callback_verification_can_be_offloaded(self, bake):
+        result = bake(HIGH_THROUGHPUT)
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        processor = (pkg / "processor.py").read_text()
+        assert '"callback_verify_executor"' in processor
+        assert "await pool.run(call" in processor
+        assert "pool.compute(" in processor
+        offload = (pkg / "offload.py").read_text()
+        assert "ProcessPoolExecutor" in offload
+        assert "asyncio.Semaphore(self.max_pending)" in offload
+
+    def test_callback_keys_are_cached(self, bake):
+        result = bake(HIGH_THROUGHPUT)
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        processor = (pkg / "processor.py").read_text()
+        assert '"callback_keys_path"' in processor
+        assert 'kwargs["signing_key"] = await store.get(' in processor
+        assert "store.get_sync(" in processor
+        keys = (pkg / "keys.py").read_text()
+        assert "class KeyStore" in keys
+        assert "self._flights.do(_REFRESH" in keys
+        assert "os.replace(tmp_path, path)" in keys
+
+    def test_processor_verifies_raw_body_signature(self, bake):
+        result = bake()
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        processor = (pkg / "processor.py").read_text()
+        assert "def _verify_signature(" in processor
+        assert '"signature_key"' in processor
+        signature = (pkg / "signature.py").read_text()
+        assert "hmac.compare_digest" in signature
+        assert "self._template.copy()" in signature
+
+    def test_processor_has_sandbox_and_production_urls(self, bake):
+        result = bake(
             extra_context={
                 "sandbox_url": "https://sandbox.test.com/",
                 "production_url": "https://api.test.com/",
@@ -352,31 +869,137 @@ class TestSourceContent:
         assert "https://sandbox.test.com/" in content
         assert "https://api.test.com/" in content
 
-    def test_client_uses_httpx(self, cookies):
-        result = _bake(cookies)
+    def test_client_uses_httpx(self, bake):
+        result = bake()
         content = (
             result.project_path / "src" / "getpaid_mygateway" / "client.py"
         ).read_text()
         assert "import httpx" in content
         assert "httpx.AsyncClient" in content
 
-    def test_client_is_async_context_manager(self, cookies):
-        result = _bake(cookies)
+    def test_client_is_async_context_manager(self, bake):
+        result = bake()
         content = (
             result.project_path / "src" / "getpaid_mygateway" / "client.py"
         ).read_text()
         assert "async def __aenter__" in content
         assert "async def __aexit__" in content
 
-    def test_types_has_auto_name_enum(self, cookies):
-        result = _bake(cookies)
+    def test_client_uses_pooled_transport(self, bake):
+        result = bake(HIGH_THROUGHPUT)
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        client = (pkg / "client.py").read_text()
+        assert "self._pool.get(self.api_url" in client
+        transport = (pkg / "transport.py").read_text()
+        assert "class TransportPool:" in transport
+        assert "async def aclose_pooled_clients" in transport
+
+    def test_processor_reads_transport_settings(self, bake):
+        result = bake(HIGH_THROUGHPUT)
+        content = (
+            result.project_path / "src" / "getpaid_mygateway" / "processor.py"
+        ).read_text()
+        for key in [
+            "max_connections",
+            "max_keepalive_connections",
+            "keepalive_expiry",
+            "timeout",
+            "http2",
+        ]:
+            assert f'"{key}"' in content
+
+    def test_client_streams_records(self, bake):
+        result = bake()
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        client = (pkg / "client.py").read_text()
+        assert "async def stream_records(" in client
+        streaming = (pkg / "streaming.py").read_text()
+        assert "class JsonArrayDecoder:" in streaming
+        assert "async def iter_ndjson(" in streaming
+
+    def test_client_requests_use_resilience_policy(self, bake):
+        result = bake(HIGH_THROUGHPUT)
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        client = (pkg / "client.py").read_text()
+        assert "await self.policy.execute(" in client
+        resilience = (pkg / "resilience.py").read_text()
+        for name in ["RetryPolicy", "CircuitBreaker", "CircuitOpenError"]:
+            assert f"class {name}" in resilience
+        processor = (pkg / "processor.py").read_text()
+        for key in [
+            "retry_max_attempts",
+            "circuit_failure_threshold",
+            "hedge_percentile",
+        ]:
+            assert f'"{key}"' in processor
+
+    def test_client_caches_access_tokens(self, bake):
+        result = bake()
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        client = (pkg / "client.py").read_text()
+        assert "authenticated: bool = False" in client
+        assert "async def fetch_access_token(self)" in client
+        auth = (pkg / "auth.py").read_text()
+        assert "class TokenCache:" in auth
+        concurrency = (pkg / "concurrency.py").read_text()
+        assert "class SingleFlight[K, V]:" in concurrency
+        processor = (pkg / "processor.py").read_text()
+        assert '"client_id"' in processor
+        assert '"client_secret"' in processor
+
+    def test_processor_suppresses_duplicate_callbacks(self, bake):
+        result = bake(HIGH_THROUGHPUT)
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        processor = (pkg / "processor.py").read_text()
+        assert "def _get_callback_id(self" in processor
+        assert "if self._is_duplicate_callback(data, headers):" in processor
+        assert "def acknowledge_callback(self" in processor
+        assert '"callback_dedup"' in processor
+        dedup = (pkg / "dedup.py").read_text()
+        assert "class MemoryDedupStore(DedupStore):" in dedup
+        assert "class SqliteDedupStore(DedupStore):" in dedup
+
+    def test_pooled_clients_record_request_metrics(self, bake):
+        result = bake(HIGH_THROUGHPUT)
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        transport = (pkg / "transport.py").read_text()
+        assert "default_metrics.event_hooks()" in transport
+        metrics = (pkg / "metrics.py").read_text()
+        assert "def to_prometheus(self" in metrics
+        assert 'DEFAULT_NAMESPACE = "getpaid_mygateway"' in metrics
+        client = (pkg / "client.py").read_text()
+        assert "operation: str | None = None" in client
+
+    def test_client_logs_response_summaries(self, bake):
+        result = bake(HIGH_THROUGHPUT)
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        client = (pkg / "client.py").read_text()
+        assert "last_response" not in client
+        assert "response_log: ResponseLog | None = None" in client
+        response_log = (pkg / "response_log.py").read_text()
+        assert "__slots__ = (" in response_log
+        processor = (pkg / "processor.py").read_text()
+        assert '"response_log_size"' in processor
+
+    def test_currency_exponents_generated(self, bake):
+        result = bake()
+        pkg = result.project_path / "src" / "getpaid_mygateway"
+        currency = (pkg / "currency.py").read_text()
+        assert '    "EUR": 2,\n    "PLN": 2,\n}' in currency
+        processor = (pkg / "processor.py").read_text()
+        assert "from .currency import to_minor_units" in processor
+
+    def test_types_has_auto_name_enum(self, bake):
+        result = bake()
         content = (
             result.project_path / "src" / "getpaid_mygateway" / "types.py"
         ).read_text()
         assert "class AutoName(StrEnum):" in content
+        assert "class Struct:" in content
+        assert "@dataclass(slots=True)" in content
 
-    def test_py_typed_marker(self, cookies):
-        result = _bake(cookies)
+    def test_py_typed_marker(self, bake):
+        result = bake()
         py_typed = (
             result.project_path / "src" / "getpaid_mygateway" / "py.typed"
         )
@@ -391,23 +1014,32 @@ class TestSourceContent:
 class TestGeneratedTests:
     """Verify the generated test files are reasonable."""
 
-    def test_conftest_has_mock_order(self, cookies):
-        result = _bake(cookies)
+    def test_conftest_has_mock_order(self, bake):
+        result = bake()
         content = (result.project_path / "tests" / "conftest.py").read_text()
         assert "class MockOrder" in content
 
-    def test_conftest_has_mock_payment(self, cookies):
-        result = _bake(cookies)
+    def test_conftest_has_mock_payment(self, bake):
+        result = bake()
         content = (result.project_path / "tests" / "conftest.py").read_text()
         assert "class MockPayment" in content
 
-    def test_conftest_has_processor_fixture(self, cookies):
-        result = _bake(cookies)
+    def test_conftest_has_processor_fixture(self, bake):
+        result = bake()
         content = (result.project_path / "tests" / "conftest.py").read_text()
         assert "def processor" in content
 
-    def test_test_processor_has_attribute_tests(self, cookies):
-        result = _bake(cookies)
+    def test_import_tests_check_budget(self, bake):
+        result = bake()
+        content = (
+            result.project_path / "tests" / "test_imports.py"
+        ).read_text()
+        assert "IMPORT_SELF_TIME_BUDGET_US" in content
+        assert '"importtime"' in content
+        assert "'httpx'" in content
+
+    def test_test_processor_has_attribute_tests(self, bake):
+        result = bake()
         content = (
             result.project_path / "tests" / "test_processor.py"
         ).read_text()
@@ -423,14 +1055,14 @@ class TestGeneratedTests:
 class TestDocsContent:
     """Verify docs files reference the correct project."""
 
-    def test_docs_conf_project_name(self, cookies):
-        result = _bake(cookies)
+    def test_docs_conf_project_name(self, bake):
+        result = bake()
         content = (result.project_path / "docs" / "conf.py").read_text()
         assert "python-getpaid-mygateway" in content
         assert "furo" in content
 
-    def test_docs_index_includes_readme(self, cookies):
-        result = _bake(cookies)
+    def test_docs_index_includes_readme(self, bake):
+        result = bake()
         content = (result.project_path / "docs" / "index.md").read_text()
         assert "include" in content
         assert "README.md" in content
@@ -444,24 +1076,24 @@ class TestDocsContent:
 class TestReadme:
     """Verify the generated README has expected content."""
 
-    def test_readme_has_project_name(self, cookies):
-        result = _bake(cookies)
+    def test_readme_has_project_name(self, bake):
+        result = bake()
         content = (result.project_path / "README.md").read_text()
         assert "python-getpaid-mygateway" in content
 
-    def test_readme_has_disclaimer(self, cookies):
-        result = _bake(cookies)
+    def test_readme_has_disclaimer(self, bake):
+        result = bake()
         content = (result.project_path / "README.md").read_text()
         assert "nothing in common" in content.lower()
 
-    def test_readme_has_install_instructions(self, cookies):
-        result = _bake(cookies)
+    def test_readme_has_install_instructions(self, bake):
+        result = bake()
         content = (result.project_path / "README.md").read_text()
         assert "pip install" in content
         assert "python-getpaid-mygateway" in content
 
-    def test_readme_has_entry_point_example(self, cookies):
-        result = _bake(cookies)
+    def test_readme_has_entry_point_example(self, bake):
+        result = bake()
         content = (result.project_path / "README.md").read_text()
         assert "getpaid.backends" in content
 
@@ -512,6 +1144,33 @@ class TestHookValidation:
         )
         assert result.exit_code != 0
 
+    def test_invalid_performance_profile_rejected(self, cookies):
+        result = cookies.bake(
+            extra_context={
+                **DEFAULT_CONTEXT,
+                "performance_profile": "turbo",
+            }
+        )
+        assert result.exit_code != 0
+
+    def test_invalid_json_backend_rejected(self, cookies):
+        result = cookies.bake(
+            extra_context={
+                **DEFAULT_CONTEXT,
+                "json_backend": "simplejson",
+            }
+        )
+        assert result.exit_code != 0
+
+    def test_unknown_currency_rejected(self, cookies):
+        result = cookies.bake(
+            extra_context={
+                **DEFAULT_CONTEXT,
+                "accepted_currencies": "['PLN', 'XYZ']",
+            }
+        )
+        assert result.exit_code != 0
+
 
 # ---------------------------------------------------------------
 # Ruff compliance
@@ -519,20 +1178,19 @@ class TestHookValidation:
 
 
 class TestRuffCompliance:
-    """Verify generated Python files pass ruff linting."""
+    """Verify generated Python files pass ruff linting.
 
-    def test_generated_python_passes_ruff_check(self, cookies):
-        """All generated .py files should pass ruff check."""
-        import subprocess
-
-        result = _bake(cookies)
-        project = result.project_path
+    Each check runs ruff once over every pre-baked variant.
+    """
 
-        py_files = list(project.rglob("*.py"))
-        assert len(py_files) > 0, "No Python files found"
+    def test_generated_python_passes_ruff_check(self, projects):
+        """All generated .py files should pass ruff check."""
+        for project in projects:
+            py_files = list(Path(project).rglob("*.py"))
+            assert len(py_files) > 0, f"No Python files found in {project}"
 
         proc = subprocess.run(
-            ["ruff", "check", "--no-fix", str(project)],
+            ["ruff", "check", "--no-fix", "--no-cache", *projects],
             capture_output=True,
             text=True,
         )
@@ -540,15 +1198,10 @@ class TestRuffCompliance:
             f"ruff check failed:\n{proc.stdout}\n{proc.stderr}"
         )
 
-    def test_generated_python_passes_ruff_format(self, cookies):
+    def test_generated_python_passes_ruff_format(self, projects):
         """All generated .py files should pass ruff format check."""
-        import subprocess
-
-        result = _bake(cookies)
-        project = result.project_path
-
         proc = subprocess.run(
-            ["ruff", "format", "--check", str(project)],
+            ["ruff", "format", "--check", "--no-cache", *projects],
             capture_output=True,
             text=True,
         )
@@ -567,9 +1220,10 @@ class TestNoTemplateLeaks:
 
     TEMPLATE_PATTERN = re.compile(r"\{\{\s*cookiecutter\.")
 
-    def test_no_template_variables_in_files(self, cookies):
+    @pytest.mark.parametrize("profile", ["minimal", "high_throughput"])
+    def test_no_template_variables_in_files(self, bake, profile):
         """No generated file should contain raw {{ cookiecutter. }}."""
-        result = _bake(cookies)
+        result = bake({"performance_profile": profile})
         project = result.project_path
 
         for path in project.rglob("*"):
@@ -1,12 +1,46 @@
 """{{ cookiecutter.project_description }}"""
 
-from {{ cookiecutter.package_name }}.client import {{ cookiecutter.client_class_name }}
-from {{ cookiecutter.package_name }}.processor import {{ cookiecutter.processor_class_name }}
+import importlib
+
+
+# ``typing`` is not imported at runtime: it costs more than the package.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from {{ cookiecutter.package_name }}.client import {{ cookiecutter.client_class_name }}
+    from {{ cookiecutter.package_name }}.client import {{ cookiecutter.__sync_client_class_name }}
+    from {{ cookiecutter.package_name }}.processor import {{ cookiecutter.processor_class_name }}
+    from {{ cookiecutter.package_name }}.processor import {{ cookiecutter.__sync_processor_class_name }}
 
 
 __all__ = [
     "{{ cookiecutter.client_class_name }}",
     "{{ cookiecutter.processor_class_name }}",
+    "{{ cookiecutter.__sync_client_class_name }}",
+    "{{ cookiecutter.__sync_processor_class_name }}",
 ]
 
 __version__ = "{{ cookiecutter.version }}"
+
+# Exports are imported on first attribute access so that importing the
+# package (e.g. during backend discovery) does not pull in httpx or
+# getpaid_core.
+_LAZY_EXPORTS = {
+    "{{ cookiecutter.client_class_name }}": "{{ cookiecutter.package_name }}.client",
+    "{{ cookiecutter.processor_class_name }}": "{{ cookiecutter.package_name }}.processor",
+    "{{ cookiecutter.__sync_client_class_name }}": "{{ cookiecutter.package_name }}.client",
+    "{{ cookiecutter.__sync_processor_class_name }}": "{{ cookiecutter.package_name }}.processor",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
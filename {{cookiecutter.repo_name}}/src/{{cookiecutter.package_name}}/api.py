@@ -0,0 +1,54 @@
+"""Gateway API operations, independent of the client that sends them.
+
+An :class:`ApiCall` describes one request and how to parse its response.
+Both the async and the sync client run it with ``call()``, so requests
+are built and responses parsed in one place.
+"""
+
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import httpx
+
+
+@dataclass(frozen=True, slots=True)
+class ApiCall[T]:
+    """One gateway API call.
+
+    ``options`` are passed to ``httpx`` (``json``, ``params``, ...) and
+    ``parse`` turns the response into the call's result.
+    """
+
+    method: str
+    path: str
+    parse: "Callable[[httpx.Response], T]"
+    authenticated: bool = False
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+    idempotent: bool | None = None
+    operation: str | None = None
+{%- endif %}
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+# TODO: Describe gateway-specific API operations as ApiCall factories.
+# Example:
+#
+# def create_payment(**payload: Any) -> ApiCall[PaymentResponse]:
+#     return ApiCall(
+#         "POST",
+#         "/payments",
+#         lambda response: PaymentResponse.decode(
+#             response.raise_for_status().content
+#         ),
+#         authenticated=True,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+#         operation="create_payment",
+{%- endif %}
+#         options={"json": payload},
+#     )
@@ -0,0 +1,165 @@
+"""Access-token caching for the {{ cookiecutter.gateway_name }} client.
+
+Tokens are cached per credential set and shared by all clients in the
+process. Concurrent callers needing a token wait for a single fetch, and
+tokens close to expiry are refreshed in the background while the
+current one is still served. Sync clients share the same cache through
+:meth:`TokenCache.get_sync`.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from .concurrency import SingleFlight
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_LIFETIME = 300.0
+DEFAULT_REFRESH_MARGIN = 60.0
+
+
+@dataclass(frozen=True, slots=True)
+class AccessToken:
+    """An access token and its expiry on the ``time.monotonic`` clock."""
+
+    value: str
+    expires_at: float
+    token_type: str = "Bearer"
+
+    @classmethod
+    def from_expires_in(
+        cls,
+        value: str,
+        expires_in: float | None,
+        *,
+        token_type: str = "Bearer",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> "AccessToken":
+        """Build a token from a relative ``expires_in`` in seconds."""
+        lifetime = DEFAULT_TOKEN_LIFETIME if expires_in is None else expires_in
+        return cls(value, clock() + float(lifetime), token_type)
+
+    @property
+    def authorization(self) -> str:
+        """Return the ``Authorization`` header value."""
+        return f"{self.token_type} {self.value}"
+
+
+type FetchToken = Callable[[], Awaitable[AccessToken]]
+type FetchTokenSync = Callable[[], AccessToken]
+
+
+class TokenCache:
+    """Per-credential token cache with single-flight, proactive refresh."""
+
+    def __init__(
+        self,
+        *,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.refresh_margin = refresh_margin
+        self._clock = clock
+        # Each token is stored with the time its refresh is due.
+        self._tokens: dict[Hashable, tuple[AccessToken, float]] = {}
+        self._flights: SingleFlight[Hashable, AccessToken] = SingleFlight()
+        self._locks: dict[Hashable, threading.Lock] = {}
+
+    async def get(self, key: Hashable, fetch: FetchToken) -> AccessToken:
+        """Return a valid token for ``key``, fetching one if needed.
+
+        A token within ``refresh_margin`` of expiry is still returned, and
+        a single background refresh is started for it. Tokens living less
+        than twice the margin are refreshed halfway through their lifetime.
+        """
+        entry = self._tokens.get(key)
+        now = self._clock()
+        if entry is not None and entry[0].expires_at > now:
+            token, refresh_at = entry
+            if now >= refresh_at:
+                self._refresh_in_background(key, fetch)
+            return token
+        return await self._flights.do(key, lambda: self._fetch(key, fetch))
+
+    def get_sync(self, key: Hashable, fetch: FetchTokenSync) -> AccessToken:
+        """Blocking variant of :meth:`get` for sync clients.
+
+        One thread fetches a missing or expiring token while the others
+        wait for it; a token within ``refresh_margin`` of expiry keeps
+        being served to the other threads during the refresh.
+        """
+        entry = self._tokens.get(key)
+        if entry is not None and not self._expiring(entry):
+            return entry[0]
+        token = None if entry is None else entry[0]
+        if token is not None and token.expires_at <= self._clock():
+            token = None
+        lock = self._locks.setdefault(key, threading.Lock())
+        if token is None:
+            lock.acquire()
+        elif not lock.acquire(blocking=False):
+            return token
+        try:
+            current = self._tokens.get(key)
+            if current is not None and not self._expiring(current):
+                return current[0]
+            try:
+                return self._store(key, fetch())
+            except Exception as exc:
+                if token is None:
+                    raise
+                logger.warning("Token refresh failed: %r", exc)
+                return token
+        finally:
+            lock.release()
+
+    def invalidate(
+        self, key: Hashable, token: AccessToken | None = None
+    ) -> None:
+        """Drop the cached token for ``key``.
+
+        When ``token`` is given, only drop it if it is still the cached
+        one, so a token refreshed by another caller is kept.
+        """
+        entry = self._tokens.get(key)
+        if token is None or (entry is not None and entry[0] is token):
+            self._tokens.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached tokens."""
+        self._tokens.clear()
+
+    def _expiring(self, entry: tuple[AccessToken, float]) -> bool:
+        return self._clock() >= entry[1]
+
+    def _store(self, key: Hashable, token: AccessToken) -> AccessToken:
+        lifetime = token.expires_at - self._clock()
+        margin = min(self.refresh_margin, lifetime / 2)
+        self._tokens[key] = (token, token.expires_at - margin)
+        return token
+
+    async def _fetch(self, key: Hashable, fetch: FetchToken) -> AccessToken:
+        return self._store(key, await fetch())
+
+    def _refresh_in_background(self, key: Hashable, fetch: FetchToken) -> None:
+        if self._flights.in_flight(key):
+            return
+        future = self._flights.start(key, lambda: self._fetch(key, fetch))
+        future.add_done_callback(_log_refresh_failure)
+
+
+def _log_refresh_failure(future: asyncio.Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning(
+            "Background token refresh failed: %r", future.exception()
+        )
+
+
+default_token_cache = TokenCache()
@@ -0,0 +1,215 @@
+"""Cache of {{ cookiecutter.gateway_name }} responses to mostly static GET endpoints.
+
+Payment-method lists, paywall configuration and fee tables rarely
+change, yet checkout pages fetch them on every render. A
+:class:`ResponseCache` keeps successful ``GET`` responses for endpoints
+given a TTL, bounded by LRU eviction. Expired entries are revalidated
+with ``If-None-Match``/``If-Modified-Since`` and, for a further
+``stale`` seconds, served while the revalidation runs in the background,
+so callers never wait for a refresh.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Literal
+
+import httpx
+
+
+type CacheState = Literal["fresh", "stale", "expired", "miss"]
+
+DEFAULT_CACHE_MAX_ENTRIES = 256
+DEFAULT_CACHE_STALE = 60.0
+# Headers that describe the encoded body; cached content is decoded.
+_DROPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding"}
+)
+
+
+class CachedResponse:
+    """Body, headers and expiry of one cached response."""
+
+    __slots__ = ("content", "expires_at", "headers", "status_code")
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: dict[str, str],
+        content: bytes,
+        expires_at: float,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.expires_at = expires_at
+
+    @classmethod
+    def from_response(
+        cls, response: httpx.Response, expires_at: float
+    ) -> "CachedResponse":
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name not in _DROPPED_HEADERS
+        }
+        return cls(response.status_code, headers, response.content, expires_at)
+
+    def validators(self) -> dict[str, str]:
+        """Return the conditional request headers for revalidation."""
+        headers = {}
+        if etag := self.headers.get("etag"):
+            headers["If-None-Match"] = etag
+        if last_modified := self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def build(self, request: httpx.Request) -> httpx.Response:
+        """Return a new ``httpx.Response`` for ``request``."""
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+        )
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of ``GET`` responses with per-endpoint TTLs.
+
+    ``ttls`` maps path prefixes (e.g. ``"/payment-methods"``) to
+    lifetimes in seconds; the longest matching prefix applies and other
+    paths are not cached. ``hits`` counts fresh hits, ``stale_hits``
+    stale entries served during revalidation, ``misses`` requests sent
+    to the gateway and ``revalidated`` entries confirmed by a ``304``.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float],
+        *,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        stale: float = DEFAULT_CACHE_STALE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttls = dict(ttls)
+        self.max_entries = max_entries
+        self.stale = stale
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._refreshing: set[Hashable] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    def ttl(self, path: str) -> float | None:
+        """Return the TTL for ``path``, or ``None`` if it is not cached."""
+        prefixes = [prefix for prefix in self.ttls if path.startswith(prefix)]
+        if not prefixes:
+            return None
+        return self.ttls[max(prefixes, key=len)]
+
+    def lookup(self, key: Hashable) -> tuple[CachedResponse | None, CacheState]:
+        """Return the entry for ``key`` and whether it can be served.
+
+        ``"stale"`` entries may be served while they are revalidated;
+        ``"expired"`` entries are only used for a conditional request.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, "miss"
+            self._entries.move_to_end(key)
+            age = self._clock() - entry.expires_at
+            if age < 0:
+                self.hits += 1
+                return entry, "fresh"
+            if age < self.stale:
+                self.stale_hits += 1
+                return entry, "stale"
+            self.misses += 1
+            return entry, "expired"
+
+    def claim_refresh(self, key: Hashable) -> bool:
+        """Return ``True`` if the caller should revalidate ``key``.
+
+        Only one background revalidation per key runs at a time; release
+        it with :meth:`release_refresh`.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def release_refresh(self, key: Hashable) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def update(
+        self,
+        key: Hashable,
+        entry: CachedResponse | None,
+        response: httpx.Response,
+        ttl: float,
+    ) -> httpx.Response:
+        """Store or refresh the entry for ``key`` from ``response``.
+
+        Returns the response to hand to the caller: the cached one when
+        the gateway answered ``304 Not Modified``.
+        """
+        expires_at = self._clock() + ttl
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                entry.expires_at = expires_at
+                self._store(key, entry)
+                self.revalidated += 1
+            return entry.build(response.request)
+        cache_control = response.headers.get("cache-control", "")
+        if response.status_code == 200 and "no-store" not in cache_control:
+            with self._lock:
+                self._store(
+                    key, CachedResponse.from_response(response, expires_at)
+                )
+        return response
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return the entry count and hit/miss counters."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+        }
+
+    def _store(self, key: Hashable, entry: CachedResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+@lru_cache(maxsize=8)
+def get_response_cache(
+    ttls: Iterable[tuple[str, float]],
+    max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    stale: float = DEFAULT_CACHE_STALE,
+) -> ResponseCache:
+    """Return the shared cache for one configuration.
+
+    ``ttls`` is a hashable sequence of ``(path_prefix, seconds)`` pairs.
+    """
+    return ResponseCache(dict(ttls), max_entries=max_entries, stale=stale)
@@ -1,18 +1,194 @@
-"""{{ cookiecutter.gateway_name }} API client."""
+"""{{ cookiecutter.gateway_name }} API clients.
 
+:class:`{{ cookiecutter.client_class_name }}` is async and
+:class:`{{ cookiecutter.__sync_client_class_name }}` is its blocking twin for
+WSGI deployments. Both run the gateway operations described in
+:mod:`{{ cookiecutter.package_name }}.api` with ``call()``.
+"""
+
+{% if cookiecutter.performance_profile == "high_throughput" -%}
+import asyncio
+{% endif -%}
+import hashlib
 import logging
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+import threading
+{%- endif %}
+from collections.abc import AsyncIterator
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from collections.abc import Coroutine
+from collections.abc import Hashable
+{%- endif %}
 from typing import Any
+from typing import ClassVar
 
 import httpx
 
+from .api import ApiCall
+from .auth import AccessToken
+from .auth import TokenCache
+from .auth import default_token_cache
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from .cache import CachedResponse
+from .cache import ResponseCache
+{%- endif %}
+from .codec import dumps
+from .codec import loads
+from .deadline import Deadline
+from .deadline import current_deadline
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from .deadline import detached_context
+from .metrics import OPERATION_EXTENSION
+from .resilience import IDEMPOTENT_METHODS
+from .resilience import ResiliencePolicy
+from .response_log import ResponseLog
+{%- endif %}
+from .streaming import DEFAULT_CHUNK_SIZE
+from .streaming import StreamFormat
+from .streaming import iter_records
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from .transport import SyncTransportPool
+from .transport import TransportPool
+from .transport import TransportSettings
+from .transport import default_pool
+from .transport import default_sync_pool
+{%- endif %}
+
 
 logger = logging.getLogger(__name__)
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+# Background revalidations, referenced until they finish.
+_revalidations: set[asyncio.Task[None]] = set()
+{%- endif %}
+
+
+class _BaseClient:
+    """Request building and parsing shared by the async and sync clients."""
+
+    token_path: ClassVar[str] = "/oauth/token"
+
+    def __init__(
+        self,
+        api_url: str,
+        *,
+        client_id: str,
+        client_secret: str,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        transport_settings: TransportSettings | None,
+        policy: ResiliencePolicy | None,
+{%- endif %}
+        token_cache: TokenCache | None,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        response_log: ResponseLog | None,
+        response_cache: ResponseCache | None,
+{%- endif %}
+    ) -> None:
+        self.api_url = api_url.rstrip("/")
+        self.client_id = client_id
+        self._client_secret = client_secret
+        self.token_cache = token_cache or default_token_cache
+        self._credentials_key = (
+            self.api_url,
+            client_id,
+            hashlib.sha256(client_secret.encode()).hexdigest(),
+        )
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        self._transport_settings = transport_settings or TransportSettings()
+        self.policy = policy or ResiliencePolicy.for_endpoint(self.api_url)
+        self.response_log = response_log
+        self.response_cache = response_cache
+
+    def _prepare(
+        self,
+        method: str,
+        path: str,
+        idempotent: bool | None,
+        operation: str | None,
+        kwargs: dict[str, Any],
+    ) -> tuple[str, str, bool, dict[str, Any]]:
+        method = method.upper()
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        if operation is not None:
+            kwargs = _with_operation(kwargs, operation)
+        if "json" in kwargs:
+            kwargs = _with_json_body(kwargs)
+        return method, f"{self.api_url}{path}", idempotent, kwargs
+
+    def _cache_ttl(self, method: str, path: str) -> float | None:
+        if method != "GET" or self.response_cache is None:
+            return None
+        return self.response_cache.ttl(path)
+
+    def _cache_key(self, url: str, kwargs: dict[str, Any]) -> Hashable:
+        return (
+            self._credentials_key,
+            str(httpx.URL(url, params=kwargs.get("params"))),
+        )
+{%- else %}
+
+    def _prepare(
+        self, method: str, path: str, kwargs: dict[str, Any]
+    ) -> tuple[str, str, dict[str, Any]]:
+        if "json" in kwargs:
+            kwargs = _with_json_body(kwargs)
+        return method.upper(), f"{self.api_url}{path}", kwargs
+{%- endif %}
 
+    def _token_call(self) -> ApiCall[AccessToken]:
+        """Describe the access-token request.
 
-class {{ cookiecutter.client_class_name }}:
+        Implements the OAuth 2.0 client-credentials grant against
+        ``token_path``; adjust it to the gateway's authentication scheme.
+        """
+        return ApiCall(
+            "POST",
+            self.token_path,
+            _parse_token,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+            idempotent=True,
+            operation="access_token",
+{%- endif %}
+            options={
+                "data": {
+                    "grant_type": "client_credentials",
+                    "client_id": self.client_id,
+                    "client_secret": self._client_secret,
+                }
+            },
+        )
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+    def _log_response(self, response: httpx.Response) -> None:
+        if self.response_log is not None:
+            self.response_log.record(response)
+{%- endif %}
+
+
+class {{ cookiecutter.client_class_name }}(_BaseClient):
     """Async HTTP client for the {{ cookiecutter.gateway_name }} API.
+{%- if cookiecutter.performance_profile == "high_throughput" %}
 
-    Can be used as an async context manager or standalone.
+    Can be used as an async context manager or standalone. Unless an
+    ``httpx.AsyncClient`` is injected, requests go through a shared,
+    pooled client (see :mod:`{{ cookiecutter.package_name }}.transport`), so
+    connections are reused across client instances and are not closed
+    when the context manager exits. Requests sent through :meth:`request`
+    are retried, hedged and circuit-broken according to ``policy`` (see
+    :mod:`{{ cookiecutter.package_name }}.resilience`). Authenticated requests
+    use access tokens cached per credential set (see
+    :mod:`{{ cookiecutter.package_name }}.auth`). Responses are not retained
+    unless a ``response_log`` is given (see
+    :mod:`{{ cookiecutter.package_name }}.response_log`).
+{%- else %}
+
+    Can be used as an async context manager or standalone. Unless an
+    ``httpx.AsyncClient`` is injected, the client creates its own, using
+    ``transport`` if given, and closes it when the context manager exits.
+    Authenticated requests use access tokens cached per credential set
+    (see :mod:`{{ cookiecutter.package_name }}.auth`).
+{%- endif %}
 
     Usage::
 
@@ -24,16 +200,59 @@ class {{ cookiecutter.client_class_name }}:
         self,
         api_url: str,
         *,
+        client_id: str = "",
+        client_secret: str = "",
         client: httpx.AsyncClient | None = None,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        transport_settings: TransportSettings | None = None,
+        pool: TransportPool | None = None,
+        policy: ResiliencePolicy | None = None,
+        token_cache: TokenCache | None = None,
+        response_log: ResponseLog | None = None,
+        response_cache: ResponseCache | None = None,
     ) -> None:
-        self.api_url = api_url.rstrip("/")
+        super().__init__(
+            api_url,
+            client_id=client_id,
+            client_secret=client_secret,
+            transport_settings=transport_settings,
+            policy=policy,
+            token_cache=token_cache,
+            response_log=response_log,
+            response_cache=response_cache,
+        )
+        self._client = client
+        self._pool = pool or default_pool
+
+    async def __aenter__(self) -> "{{ cookiecutter.client_class_name }}":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        # Injected clients belong to the caller and pooled clients to the
+        # pool; neither is closed here.
+        return None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Return the injected HTTP client or the shared pooled one."""
+        if self._client is not None:
+            return self._client
+        return self._pool.get(self.api_url, self._transport_settings)
+{%- else %}
+        transport: httpx.AsyncBaseTransport | None = None,
+        token_cache: TokenCache | None = None,
+    ) -> None:
+        super().__init__(
+            api_url,
+            client_id=client_id,
+            client_secret=client_secret,
+            token_cache=token_cache,
+        )
         self._client = client
         self._owns_client = client is None
-        self.last_response: httpx.Response | None = None
+        self._transport = transport
 
     async def __aenter__(self) -> "{{ cookiecutter.client_class_name }}":
-        if self._owns_client:
-            self._client = httpx.AsyncClient()
         return self
 
     async def __aexit__(self, *exc: Any) -> None:
@@ -45,18 +264,616 @@ class {{ cookiecutter.client_class_name }}:
     def client(self) -> httpx.AsyncClient:
         """Return the underlying HTTP client, creating one if needed."""
         if self._client is None:
-            self._client = httpx.AsyncClient()
-            self._owns_client = True
+            self._client = httpx.AsyncClient(transport=self._transport)
         return self._client
+{%- endif %}
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        idempotent: bool | None = None,
+        authenticated: bool = False,
+        operation: str | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request to ``path`` through the resilience policy.
+
+        ``idempotent`` defaults to whether ``method`` is idempotent; pass
+        ``True`` for gateway operations that are safe to repeat (e.g.
+        those carrying an idempotency key).
+
+        With ``authenticated=True`` a cached access token is attached. If
+        the gateway answers ``401``, the token is invalidated and the
+        request is retried once with a fresh one.
+
+        ``operation`` names the call in request metrics (see
+        :mod:`{{ cookiecutter.package_name }}.metrics`); it defaults to the
+        HTTP method. Keep it low-cardinality: never include IDs.
+
+        ``GET`` requests to endpoints with a TTL in ``response_cache`` are
+        answered from the cache (see
+        :mod:`{{ cookiecutter.package_name }}.cache`).
+        """
+        method, url, idempotent, kwargs = self._prepare(
+            method, path, idempotent, operation, kwargs
+        )
+        cache = self.response_cache
+        ttl = self._cache_ttl(method, path)
+        if cache is None or ttl is None:
+            return await self._request(
+                method, url, idempotent, authenticated, kwargs
+            )
+        key = self._cache_key(url, kwargs)
+        entry, state = cache.lookup(key)
+        if entry is None or state == "expired":
+            return await self._revalidate(
+                cache, key, entry, ttl, url, authenticated, kwargs
+            )
+        if state == "stale" and cache.claim_refresh(key):
+            _in_background(
+                self._refresh(
+                    cache, key, entry, ttl, url, authenticated, kwargs
+                )
+            )
+        return entry.build(httpx.Request(method, url))
+
+    async def _revalidate(
+        self,
+        cache: ResponseCache,
+        key: Hashable,
+        entry: CachedResponse | None,
+        ttl: float,
+        url: str,
+        authenticated: bool,
+        kwargs: dict[str, Any],
+    ) -> httpx.Response:
+        response = await self._request(
+            "GET", url, True, authenticated, _with_validators(kwargs, entry)
+        )
+        return cache.update(key, entry, response, ttl)
+
+    async def _refresh(
+        self, cache: ResponseCache, key: Hashable, *args: Any
+    ) -> None:
+        try:
+            await self._revalidate(cache, key, *args)
+        finally:
+            cache.release_refresh(key)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        idempotent: bool,
+        authenticated: bool,
+        kwargs: dict[str, Any],
+        *,
+        stream: bool = False,
+    ) -> httpx.Response:
+        if not authenticated:
+            return await self._send(method, url, idempotent, kwargs, stream)
+        token = await self.get_access_token()
+        response = await self._send(
+            method, url, idempotent, _with_token(kwargs, token), stream
+        )
+        if response.status_code == 401:
+            self.token_cache.invalidate(self._credentials_key, token)
+            await response.aclose()
+            token = await self.get_access_token()
+            response = await self._send(
+                method, url, idempotent, _with_token(kwargs, token), stream
+            )
+        return response
+{%- else %}
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        authenticated: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request to ``path``.
+
+        With ``authenticated=True`` a cached access token is attached. If
+        the gateway answers ``401``, the token is invalidated and the
+        request is retried once with a fresh one.
+        """
+        method, url, kwargs = self._prepare(method, path, kwargs)
+        return await self._request(method, url, authenticated, kwargs)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        authenticated: bool,
+        kwargs: dict[str, Any],
+        *,
+        stream: bool = False,
+    ) -> httpx.Response:
+        if not authenticated:
+            return await self._send(method, url, kwargs, stream)
+        token = await self.get_access_token()
+        response = await self._send(
+            method, url, _with_token(kwargs, token), stream
+        )
+        if response.status_code == 401:
+            self.token_cache.invalidate(self._credentials_key, token)
+            await response.aclose()
+            token = await self.get_access_token()
+            response = await self._send(
+                method, url, _with_token(kwargs, token), stream
+            )
+        return response
+{%- endif %}
+
+    async def call[T](self, api_call: ApiCall[T]) -> T:
+        """Send ``api_call`` and return its parsed result."""
+        response = await self.request(
+            api_call.method,
+            api_call.path,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+            idempotent=api_call.idempotent,
+{%- endif %}
+            authenticated=api_call.authenticated,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+            operation=api_call.operation,
+{%- endif %}
+            **api_call.options,
+        )
+        return api_call.parse(response)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        idempotent: bool,
+{%- endif %}
+        kwargs: dict[str, Any],
+        stream: bool = False,
+    ) -> httpx.Response:
+        deadline = current_deadline()
+
+        async def request(options: dict[str, Any]) -> httpx.Response:
+            if not stream:
+                return await self.client.request(method, url, **options)
+            return await self.client.send(
+                self.client.build_request(method, url, **options), stream=True
+            )
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+        async def send() -> httpx.Response:
+            if deadline is None:
+                return await request(kwargs)
+            with deadline.guard():
+                return await request(
+                    _with_deadline(kwargs, deadline, self.client.timeout)
+                )
+
+        response = await self.policy.execute(send, idempotent=idempotent)
+        if not stream:
+            # Streamed responses are logged once the body has been read.
+            self._log_response(response)
+        return response
+{%- else %}
+
+        if deadline is None:
+            return await request(kwargs)
+        with deadline.guard():
+            return await request(
+                _with_deadline(kwargs, deadline, self.client.timeout)
+            )
+{%- endif %}
+
+    async def get_access_token(self) -> AccessToken:
+        """Return a cached access token, fetching one if needed."""
+        return await self.token_cache.get(
+            self._credentials_key, self.fetch_access_token
+        )
+
+    async def fetch_access_token(self) -> AccessToken:
+        """Request a new access token from the gateway."""
+        return await self.call(self._token_call())
+
+    async def stream_records(
+        self,
+        method: str,
+        path: str,
+        *,
+        stream_format: StreamFormat | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        idempotent: bool | None = None,
+{%- endif %}
+        authenticated: bool = False,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        operation: str | None = None,
+{%- endif %}
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Stream a JSON array or NDJSON response, yielding each record.
+
+        Use this instead of ``response.json()`` for large listings such
+        as transaction or settlement reports; memory stays bounded by the
+        size of a single record.
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+        The request goes through the same deadline, resilience policy,
+        rate limiter and authentication as :meth:`request`; only the
+        response cache is skipped.
+        """
+        method, url, idempotent, kwargs = self._prepare(
+            method, path, idempotent, operation, kwargs
+        )
+        response = await self._request(
+            method, url, idempotent, authenticated, kwargs, stream=True
+        )
+{%- else %}
+
+        The request goes through the same deadline and authentication as
+        :meth:`request`.
+        """
+        method, url, kwargs = self._prepare(method, path, kwargs)
+        response = await self._request(
+            method, url, authenticated, kwargs, stream=True
+        )
+{%- endif %}
+        try:
+            response.raise_for_status()
+            async for record in iter_records(
+                response,
+                stream_format=stream_format,
+                chunk_size=chunk_size,
+            ):
+                yield record
+        finally:
+            await response.aclose()
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+            self._log_response(response)
+{%- endif %}
+
+
+class {{ cookiecutter.__sync_client_class_name }}(_BaseClient):
+    """Blocking twin of :class:`{{ cookiecutter.client_class_name }}`.
+
+    Use it from WSGI deployments and other synchronous code.
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+    Unless an ``httpx.Client`` is injected, requests go through a shared,
+    thread-safe pooled client (see
+    :data:`{{ cookiecutter.package_name }}.transport.default_sync_pool`). The
+    same resilience policy, token cache and response log apply; requests
+    are not hedged.
+{%- else %}
+
+    Unless an ``httpx.Client`` is injected, the client creates its own and
+    closes it when the context manager exits. The same token cache
+    applies.
+{%- endif %}
+
+    Usage::
+
+        with {{ cookiecutter.__sync_client_class_name }}(api_url="...") as client:
+            payment = client.call(create_payment(...))
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        *,
+        client_id: str = "",
+        client_secret: str = "",
+        client: httpx.Client | None = None,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        transport_settings: TransportSettings | None = None,
+        pool: SyncTransportPool | None = None,
+        policy: ResiliencePolicy | None = None,
+        token_cache: TokenCache | None = None,
+        response_log: ResponseLog | None = None,
+        response_cache: ResponseCache | None = None,
+    ) -> None:
+        super().__init__(
+            api_url,
+            client_id=client_id,
+            client_secret=client_secret,
+            transport_settings=transport_settings,
+            policy=policy,
+            token_cache=token_cache,
+            response_log=response_log,
+            response_cache=response_cache,
+        )
+        self._client = client
+        self._pool = pool or default_sync_pool
+
+    def __enter__(self) -> "{{ cookiecutter.__sync_client_class_name }}":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        # As for the async client, neither injected nor pooled clients are
+        # closed here.
+        return None
+
+    @property
+    def client(self) -> httpx.Client:
+        """Return the injected HTTP client or the shared pooled one."""
+        if self._client is not None:
+            return self._client
+        return self._pool.get(self.api_url, self._transport_settings)
+{%- else %}
+        transport: httpx.BaseTransport | None = None,
+        token_cache: TokenCache | None = None,
+    ) -> None:
+        super().__init__(
+            api_url,
+            client_id=client_id,
+            client_secret=client_secret,
+            token_cache=token_cache,
+        )
+        self._client = client
+        self._owns_client = client is None
+        self._transport = transport
+
+    def __enter__(self) -> "{{ cookiecutter.__sync_client_class_name }}":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._owns_client and self._client is not None:
+            self._client.close()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.Client:
+        """Return the underlying HTTP client, creating one if needed."""
+        if self._client is None:
+            self._client = httpx.Client(transport=self._transport)
+        return self._client
+{%- endif %}
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        idempotent: bool | None = None,
+        authenticated: bool = False,
+        operation: str | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Blocking variant of :meth:`{{ cookiecutter.client_class_name }}.request`.
+
+        Stale cache entries are revalidated in a background thread.
+        """
+        method, url, idempotent, kwargs = self._prepare(
+            method, path, idempotent, operation, kwargs
+        )
+        cache = self.response_cache
+        ttl = self._cache_ttl(method, path)
+        if cache is None or ttl is None:
+            return self._request(method, url, idempotent, authenticated, kwargs)
+        key = self._cache_key(url, kwargs)
+        entry, state = cache.lookup(key)
+        if entry is None or state == "expired":
+            return self._revalidate(
+                cache, key, entry, ttl, url, authenticated, kwargs
+            )
+        if state == "stale" and cache.claim_refresh(key):
+            threading.Thread(
+                target=self._refresh,
+                args=(cache, key, entry, ttl, url, authenticated, kwargs),
+                daemon=True,
+            ).start()
+        return entry.build(httpx.Request(method, url))
+
+    def _revalidate(
+        self,
+        cache: ResponseCache,
+        key: Hashable,
+        entry: CachedResponse | None,
+        ttl: float,
+        url: str,
+        authenticated: bool,
+        kwargs: dict[str, Any],
+    ) -> httpx.Response:
+        response = self._request(
+            "GET", url, True, authenticated, _with_validators(kwargs, entry)
+        )
+        return cache.update(key, entry, response, ttl)
+
+    def _refresh(self, cache: ResponseCache, key: Hashable, *args: Any) -> None:
+        try:
+            self._revalidate(cache, key, *args)
+        except Exception as exc:
+            logger.warning("Background revalidation failed: %r", exc)
+        finally:
+            cache.release_refresh(key)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        idempotent: bool,
+        authenticated: bool,
+        kwargs: dict[str, Any],
+    ) -> httpx.Response:
+        if not authenticated:
+            return self._send(method, url, idempotent, kwargs)
+        token = self.get_access_token()
+        response = self._send(
+            method, url, idempotent, _with_token(kwargs, token)
+        )
+        if response.status_code == 401:
+            self.token_cache.invalidate(self._credentials_key, token)
+            response.close()
+            token = self.get_access_token()
+            response = self._send(
+                method, url, idempotent, _with_token(kwargs, token)
+            )
+        return response
+{%- else %}
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        authenticated: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Blocking variant of :meth:`{{ cookiecutter.client_class_name }}.request`."""
+        method, url, kwargs = self._prepare(method, path, kwargs)
+        return self._request(method, url, authenticated, kwargs)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        authenticated: bool,
+        kwargs: dict[str, Any],
+    ) -> httpx.Response:
+        if not authenticated:
+            return self._send(method, url, kwargs)
+        token = self.get_access_token()
+        response = self._send(method, url, _with_token(kwargs, token))
+        if response.status_code == 401:
+            self.token_cache.invalidate(self._credentials_key, token)
+            response.close()
+            token = self.get_access_token()
+            response = self._send(method, url, _with_token(kwargs, token))
+        return response
+{%- endif %}
+
+    def call[T](self, api_call: ApiCall[T]) -> T:
+        """Send ``api_call`` and return its parsed result."""
+        response = self.request(
+            api_call.method,
+            api_call.path,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+            idempotent=api_call.idempotent,
+{%- endif %}
+            authenticated=api_call.authenticated,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+            operation=api_call.operation,
+{%- endif %}
+            **api_call.options,
+        )
+        return api_call.parse(response)
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+    def _send(
+        self, method: str, url: str, idempotent: bool, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        deadline = current_deadline()
+
+        def send() -> httpx.Response:
+            if deadline is None:
+                return self.client.request(method, url, **kwargs)
+            with deadline.guard():
+                return self.client.request(
+                    method,
+                    url,
+                    **_with_deadline(kwargs, deadline, self.client.timeout),
+                )
+
+        response = self.policy.execute_sync(send, idempotent=idempotent)
+        self._log_response(response)
+        return response
+{%- else %}
+
+    def _send(
+        self, method: str, url: str, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        deadline = current_deadline()
+        if deadline is None:
+            return self.client.request(method, url, **kwargs)
+        with deadline.guard():
+            return self.client.request(
+                method,
+                url,
+                **_with_deadline(kwargs, deadline, self.client.timeout),
+            )
+{%- endif %}
+
+    def get_access_token(self) -> AccessToken:
+        """Return a cached access token, fetching one if needed."""
+        return self.token_cache.get_sync(
+            self._credentials_key, self.fetch_access_token
+        )
+
+    def fetch_access_token(self) -> AccessToken:
+        """Request a new access token from the gateway."""
+        return self.call(self._token_call())
+
+
+def _parse_token(response: httpx.Response) -> AccessToken:
+    response.raise_for_status()
+    payload = loads(response.content)
+    return AccessToken.from_expires_in(
+        payload["access_token"],
+        payload.get("expires_in"),
+        token_type=payload.get("token_type", "Bearer").capitalize(),
+    )
+
+
+def _with_token(kwargs: dict[str, Any], token: AccessToken) -> dict[str, Any]:
+    headers = {
+        **kwargs.get("headers", {}),
+        "Authorization": token.authorization,
+    }
+    return {**kwargs, "headers": headers}
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+
+def _with_validators(
+    kwargs: dict[str, Any], entry: CachedResponse | None
+) -> dict[str, Any]:
+    if entry is None:
+        return kwargs
+    headers = {**kwargs.get("headers", {}), **entry.validators()}
+    return {**kwargs, "headers": headers}
+
+
+def _in_background(revalidation: Coroutine[Any, Any, None]) -> None:
+    loop = asyncio.get_running_loop()
+    task = loop.create_task(revalidation, context=detached_context())
+    _revalidations.add(task)
+    task.add_done_callback(_revalidation_done)
+
+
+def _revalidation_done(task: asyncio.Task[None]) -> None:
+    _revalidations.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Background revalidation failed: %r", task.exception())
+{%- endif %}
+
+
+def _with_deadline(
+    kwargs: dict[str, Any], deadline: Deadline, default: httpx.Timeout
+) -> dict[str, Any]:
+    timeout = httpx.Timeout(kwargs.get("timeout", default))
+    return {**kwargs, "timeout": deadline.timeout(timeout)}
+
+
+def _with_json_body(kwargs: dict[str, Any]) -> dict[str, Any]:
+    kwargs = dict(kwargs)
+    content = dumps(kwargs.pop("json"))
+    headers = {
+        "Content-Type": "application/json",
+        **kwargs.get("headers", {}),
+    }
+    return {**kwargs, "content": content, "headers": headers}
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
 
-    # TODO: Add gateway-specific API methods here.
-    # Example:
-    #
-    # async def create_payment(self, **kwargs) -> dict:
-    #     response = await self.client.post(
-    #         f"{self.api_url}/payments",
-    #         json=kwargs,
-    #     )
-    #     self.last_response = response
-    #     response.raise_for_status()
-    #     return response.json()
+def _with_operation(kwargs: dict[str, Any], operation: str) -> dict[str, Any]:
+    extensions = {
+        **kwargs.get("extensions", {}),
+        OPERATION_EXTENSION: operation,
+    }
+    return {**kwargs, "extensions": extensions}
+{%- endif %}
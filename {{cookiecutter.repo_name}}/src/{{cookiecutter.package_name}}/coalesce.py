@@ -0,0 +1,180 @@
+"""Coalescing of concurrent {{ cookiecutter.gateway_name }} status fetches.
+
+Return-URL handlers, polling jobs and admin views often ask for the
+status of the same payment at the same moment. A :class:`StatusCoalescer`
+lets concurrent callers for one payment share a single in-flight gateway
+request and its result (or error). An optional short-lived result cache
+also absorbs bursts of calls arriving just after a fetch completed.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Hashable
+from functools import lru_cache
+from typing import Any
+
+from .concurrency import SingleFlight
+from .metrics import DEFAULT_NAMESPACE
+from .metrics import prometheus_labels
+
+
+DEFAULT_STATUS_CACHE_TTL = 0.0
+DEFAULT_STATUS_CACHE_MAX_ENTRIES = 1024
+_MISSING = object()
+
+
+class _Flight:
+    """A blocking fetch other threads wait for."""
+
+    __slots__ = ("done", "error", "value")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class StatusCoalescer[V]:
+    """Share one status fetch per payment between concurrent callers.
+
+    Successful results are kept for ``ttl`` seconds (``0`` disables the
+    cache) in an LRU bounded by ``max_entries``; errors are never cached.
+    ``fetches`` counts gateway requests made, ``coalesced`` calls that
+    joined one in flight and ``cache_hits`` calls answered from the
+    cache. In-flight fetches are shared per event loop, so threads that
+    each run their own loop (sync bridges) never await another loop's
+    fetch; they still share the result cache.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_STATUS_CACHE_TTL,
+        *,
+        max_entries: int = DEFAULT_STATUS_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._flights: SingleFlight[Hashable, V] = SingleFlight()
+        self._sync_flights: dict[Hashable, _Flight] = {}
+        self._results: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.fetches = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+
+    async def do(self, key: Hashable, fetch: Callable[[], Awaitable[V]]) -> V:
+        """Return the status for ``key``, sharing or reusing a fetch."""
+        value = self._cached(key)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            if self._flights.in_flight(key):
+                self.coalesced += 1
+            else:
+                self.fetches += 1
+        return await self._flights.do(key, lambda: self._fetch(key, fetch))
+
+    def do_sync(self, key: Hashable, fetch: Callable[[], V]) -> V:
+        """Blocking variant of :meth:`do` for threads."""
+        value = self._cached(key)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            flight = self._sync_flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._sync_flights[key] = _Flight()
+                self.fetches += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        try:
+            flight.value = fetch()
+            self._store(key, flight.value)
+            return flight.value
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._sync_flights[key]
+            flight.done.set()
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop the cached result for ``key``, e.g. after a callback."""
+        with self._lock:
+            self._results.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        """Return the call counters and the number of calls saved."""
+        return {
+            "fetches": self.fetches,
+            "coalesced": self.coalesced,
+            "cache_hits": self.cache_hits,
+            "saved": self.coalesced + self.cache_hits,
+        }
+
+    def to_prometheus(self, namespace: str = DEFAULT_NAMESPACE) -> str:
+        """Render the counters in the Prometheus text exposition format."""
+        name = f"{namespace}_status_calls_total"
+        lines = [
+            f"# HELP {name} Status calls, by how they were answered.",
+            f"# TYPE {name} counter",
+        ]
+        for result, count in [
+            ("fetched", self.fetches),
+            ("coalesced", self.coalesced),
+            ("cached", self.cache_hits),
+        ]:
+            labels = prometheus_labels(result=result)
+            lines.append(f"{name}{labels} {count}")
+        return "\n".join(lines) + "\n"
+
+    async def _fetch(
+        self, key: Hashable, fetch: Callable[[], Awaitable[V]]
+    ) -> V:
+        value = await fetch()
+        self._store(key, value)
+        return value
+
+    def _cached(self, key: Hashable) -> Any:
+        if not self.ttl:
+            return _MISSING
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._results[key]
+                return _MISSING
+            self._results.move_to_end(key)
+            self.cache_hits += 1
+            return value
+
+    def _store(self, key: Hashable, value: V) -> None:
+        if not self.ttl:
+            return
+        with self._lock:
+            self._results[key] = (self._clock() + self.ttl, value)
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+
+@lru_cache(maxsize=8)
+def get_status_coalescer(
+    ttl: float = DEFAULT_STATUS_CACHE_TTL,
+    max_entries: int = DEFAULT_STATUS_CACHE_MAX_ENTRIES,
+) -> StatusCoalescer:
+    """Return the process-wide coalescer for one configuration."""
+    return StatusCoalescer(ttl, max_entries=max_entries)
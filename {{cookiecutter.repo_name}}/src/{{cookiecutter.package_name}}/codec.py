@@ -0,0 +1,111 @@
+"""JSON encoding and decoding of {{ cookiecutter.gateway_name }} payloads.
+
+Request bodies, token responses, callbacks and streamed records are
+encoded and decoded through :func:`dumps` and :func:`loads`.
+{%- if cookiecutter.json_backend != "stdlib" %} They use
+``{{ cookiecutter.json_backend }}``, installed with the ``json`` extra, and fall back to the
+standard library when it is missing; ``BACKEND`` names the one in use.
+{%- endif %}
+
+``Decimal`` values are encoded as strings. :func:`loads` raises
+``ValueError`` for invalid JSON whatever the backend.
+"""
+
+import json
+from decimal import Decimal
+from typing import Any
+{%- if cookiecutter.json_backend == "orjson" %}
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+{%- elif cookiecutter.json_backend == "msgspec" %}
+
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+{%- endif %}
+
+
+type JsonBody = bytes | bytearray | memoryview | str
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    text = json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=_default
+    )
+    return text.encode()
+
+
+def _stdlib_loads(data: JsonBody) -> Any:
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+{%- if cookiecutter.json_backend == "orjson" %}
+
+
+def _orjson_codec() -> tuple[Any, Any]:
+    if orjson is None:
+        raise ImportError("orjson is not installed")
+    encode = orjson.dumps
+
+    def dumps(obj: Any) -> bytes:
+        return encode(obj, default=_default)
+
+    # orjson.JSONDecodeError is a ValueError.
+    return dumps, orjson.loads
+
+
+if orjson is not None:
+    BACKEND = "orjson"
+    dumps, loads = _orjson_codec()
+else:
+    BACKEND = "stdlib"
+    dumps = _stdlib_dumps
+    loads = _stdlib_loads
+{%- elif cookiecutter.json_backend == "msgspec" %}
+
+
+def _msgspec_codec() -> tuple[Any, Any]:
+    if msgspec is None:
+        raise ImportError("msgspec is not installed")
+    encoder = msgspec.json.Encoder(enc_hook=_default, decimal_format="string")
+    decoder = msgspec.json.Decoder()
+    decode_error = msgspec.DecodeError
+
+    def dumps(obj: Any) -> bytes:
+        return encoder.encode(obj)
+
+    def loads(data: JsonBody) -> Any:
+        try:
+            return decoder.decode(data)
+        except decode_error as exc:
+            raise ValueError(str(exc)) from exc
+
+    return dumps, loads
+
+
+if msgspec is not None:
+    BACKEND = "msgspec"
+    dumps, loads = _msgspec_codec()
+else:
+    BACKEND = "stdlib"
+    dumps = _stdlib_dumps
+    loads = _stdlib_loads
+{%- else %}
+
+
+BACKEND = "stdlib"
+dumps = _stdlib_dumps
+loads = _stdlib_loads
+{%- endif %}
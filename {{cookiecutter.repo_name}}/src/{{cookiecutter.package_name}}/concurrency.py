@@ -0,0 +1,183 @@
+"""Concurrency helpers for {{ cookiecutter.gateway_name }} batch operations."""
+
+import asyncio
+import itertools
+import weakref
+from collections import deque
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Coroutine
+from collections.abc import Iterable
+from typing import Any
+
+from .deadline import detached_context
+
+
+async def bounded_as_completed[T](
+    jobs: Iterable[Callable[[], Awaitable[T]]],
+    limit: int,
+) -> AsyncIterator[T]:
+    """Run ``jobs`` with at most ``limit`` in flight; yield in completion order.
+
+    Jobs are started lazily as earlier ones finish, so memory stays
+    proportional to ``limit`` rather than to the number of jobs. Jobs
+    still running when the consumer stops iterating are cancelled.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    jobs = iter(jobs)
+    pending: set[asyncio.Future[T]] = {
+        asyncio.ensure_future(job()) for job in itertools.islice(jobs, limit)
+    }
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for job in itertools.islice(jobs, len(done)):
+                pending.add(asyncio.ensure_future(job()))
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def ordered_by_key[K, T, R](
+    items: Iterable[tuple[K, T]] | AsyncIterable[tuple[K, T]],
+    process: Callable[[T], Awaitable[R]],
+    *,
+    limit: int,
+    max_pending: int,
+) -> AsyncIterator[R]:
+    """Process ``(key, item)`` pairs in order per key, keys concurrently.
+
+    At most ``limit`` keys are processed at once. An item is processed
+    only after the consumer has taken the result of the previous item
+    with the same key, so results can be applied in order. At most
+    ``max_pending`` items are read ahead of the consumer; reading pauses
+    until results are consumed. An exception raised by ``process`` stops
+    the iteration; work still running when it stops is cancelled.
+    """
+    if limit < 1 or max_pending < 1:
+        raise ValueError("limit and max_pending must be at least 1")
+    slots = asyncio.Semaphore(limit)
+    room = asyncio.Semaphore(max_pending)
+    queues: dict[K, deque[T]] = {}
+    results: asyncio.Queue[tuple[R, asyncio.Event] | Exception | None] = (
+        asyncio.Queue()
+    )
+    workers: set[asyncio.Task[None]] = set()
+
+    async def drain(queue: deque[T], key: K) -> None:
+        async with slots:
+            while queue:
+                consumed = asyncio.Event()
+                try:
+                    result = await process(queue.popleft())
+                except Exception as exc:
+                    results.put_nowait(exc)
+                    return
+                results.put_nowait((result, consumed))
+                await consumed.wait()
+        del queues[key]
+
+    def enqueue(key: K, item: T) -> None:
+        queue = queues.get(key)
+        if queue is not None:
+            queue.append(item)
+            return
+        queue = queues[key] = deque([item])
+        worker = asyncio.ensure_future(drain(queue, key))
+        workers.add(worker)
+        worker.add_done_callback(workers.discard)
+
+    async def feed() -> int:
+        if isinstance(items, AsyncIterable):
+            source = aiter(items)
+        else:
+            source = _aiter(items)
+        count = 0
+        try:
+            # Room is reserved before reading, so that no more than
+            # ``max_pending`` items are ever taken from ``items``.
+            while True:
+                await room.acquire()
+                pair = await anext(source, None)
+                if pair is None:
+                    break
+                enqueue(*pair)
+                count += 1
+        except Exception as exc:
+            results.put_nowait(exc)
+        else:
+            results.put_nowait(None)
+        return count
+
+    feeder = asyncio.ensure_future(feed())
+    consumed_count = 0
+    try:
+        while not feeder.done() or consumed_count < feeder.result():
+            entry = await results.get()
+            if entry is None:
+                continue
+            if isinstance(entry, Exception):
+                raise entry
+            result, consumed = entry
+            yield result
+            consumed_count += 1
+            consumed.set()
+            room.release()
+    finally:
+        pending = {feeder, *workers}
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _aiter[T](items: Iterable[T]) -> AsyncIterator[T]:
+    for item in items:
+        yield item
+
+
+class SingleFlight[K, V]:
+    """Share one in-flight call per key between concurrent callers.
+
+    The first caller for a key starts the call; callers arriving while it
+    runs await the same result instead of starting their own. A waiter
+    being cancelled does not cancel the shared call, and the call is not
+    bound by the first caller's deadline. Calls are only shared within
+    one event loop, so threads each running their own loop (sync
+    bridges) never await a task of another loop.
+    """
+
+    def __init__(self) -> None:
+        self._calls: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[K, asyncio.Future[V]]
+        ] = weakref.WeakKeyDictionary()
+
+    def in_flight(self, key: K) -> bool:
+        """Return whether a call for ``key`` runs on the current loop."""
+        calls = self._calls.get(asyncio.get_running_loop())
+        return calls is not None and key in calls
+
+    def start(
+        self, key: K, call: Callable[[], Coroutine[Any, Any, V]]
+    ) -> asyncio.Future[V]:
+        """Return the running call for ``key``, starting it if needed."""
+        loop = asyncio.get_running_loop()
+        calls = self._calls.setdefault(loop, {})
+        future = calls.get(key)
+        if future is None:
+            future = loop.create_task(call(), context=detached_context())
+            calls[key] = future
+            future.add_done_callback(lambda _: calls.pop(key, None))
+        return future
+
+    async def do(self, key: K, call: Callable[[], Coroutine[Any, Any, V]]) -> V:
+        """Return the result of the (possibly shared) call for ``key``."""
+        return await asyncio.shield(self.start(key, call))
@@ -0,0 +1,66 @@
+"""Currency metadata and minor-unit conversion for {{ cookiecutter.gateway_name }}.
+
+``MINOR_UNIT_EXPONENTS`` was generated from ISO 4217 for the processor's
+``accepted_currencies``. :func:`to_minor_units` and
+:func:`from_minor_units` convert between ``Decimal`` amounts and the
+integer minor units gateway APIs expect, with exact integer arithmetic
+instead of per-request ``quantize`` calls.
+"""
+
+from decimal import Decimal
+
+
+# TODO: override exponents where the gateway deviates from ISO 4217,
+# and add one whenever a currency is added to accepted_currencies.
+MINOR_UNIT_EXPONENTS: dict[str, int] = {
+{%- for code, exponent in cookiecutter._iso4217_minor_units | dictsort %}
+{%- if ("'" ~ code ~ "'") in cookiecutter.accepted_currencies %}
+    "{{ code }}": {{ exponent }},
+{%- endif %}
+{%- endfor %}
+}
+
+_SCALES = {code: 10**exp for code, exp in MINOR_UNIT_EXPONENTS.items()}
+_ONE = Decimal(1)
+
+
+def minor_unit_exponent(currency: str) -> int:
+    """Return the number of decimal places of ``currency``."""
+    try:
+        return MINOR_UNIT_EXPONENTS[currency]
+    except KeyError:
+        raise _unsupported(currency) from None
+
+
+def to_minor_units(
+    amount: Decimal, currency: str, *, rounding: str | None = None
+) -> int:
+    """Convert ``amount`` to an integer number of minor units.
+
+    Amounts with more decimal places than ``currency`` has raise
+    ``ValueError`` unless a :mod:`decimal` ``rounding`` mode (e.g.
+    ``ROUND_HALF_UP``) is given.
+    """
+    scale = _SCALES.get(currency)
+    if scale is None:
+        raise _unsupported(currency)
+    try:
+        numerator, denominator = amount.as_integer_ratio()
+    except (ValueError, OverflowError):
+        raise ValueError(f"Invalid amount: {amount}") from None
+    minor, remainder = divmod(numerator * scale, denominator)
+    if not remainder:
+        return minor
+    if rounding is None:
+        raise ValueError(f"{amount} has more decimal places than {currency}")
+    exponent = MINOR_UNIT_EXPONENTS[currency]
+    return int(amount.scaleb(exponent).quantize(_ONE, rounding=rounding))
+
+
+def from_minor_units(minor: int, currency: str) -> Decimal:
+    """Convert an integer number of minor units to a ``Decimal`` amount."""
+    return Decimal(minor).scaleb(-minor_unit_exponent(currency))
+
+
+def _unsupported(currency: str) -> ValueError:
+    return ValueError(f"Unsupported currency: {currency!r}")
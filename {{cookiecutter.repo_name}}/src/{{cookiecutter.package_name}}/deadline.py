@@ -0,0 +1,165 @@
+"""Deadlines bounding {{ cookiecutter.gateway_name }} operations end to end.
+
+A processor operation given a time budget (``deadline=``) runs inside
+:func:`within_deadline`: the whole operation is cancelled once the budget
+is spent, and every request it sends gets at most the remaining time as
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+its ``httpx`` timeout, so retries and token fetches share one budget
+instead of each waiting for the full default timeout. Exhaustion raises
+:class:`DeadlineExceededError`.
+
+The active deadline is carried in a context variable. Work shared with
+other callers (single-flight token fetches, background cache refreshes)
+runs in a :func:`detached_context` and is not bound by it.
+{%- else %}
+its ``httpx`` timeout, so token fetches share one budget instead of each
+waiting for the full default timeout. Exhaustion raises
+:class:`DeadlineExceededError`.
+
+The active deadline is carried in a context variable. Work shared with
+other callers (single-flight token fetches) runs in a
+:func:`detached_context` and is not bound by it.
+{%- endif %}
+"""
+
+import asyncio
+import contextvars
+import time
+from collections.abc import AsyncGenerator
+from collections.abc import Generator
+from contextlib import asynccontextmanager
+from contextlib import contextmanager
+
+import httpx
+from getpaid_core.exceptions import CommunicationError
+
+
+class DeadlineExceededError(CommunicationError):
+    """The operation's time budget ran out before the gateway answered."""
+
+
+class Deadline:
+    """Point in ``time.monotonic()`` time by which an operation must end."""
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, expires_at: float) -> None:
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """Return a deadline ``seconds`` from now."""
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        """Return the seconds left, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def timeout(self, timeout: httpx.Timeout) -> httpx.Timeout:
+        """Return ``timeout`` with every phase capped at the time left.
+
+        Raises :class:`DeadlineExceededError` if no time is left, so no
+        request is started after the deadline.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededError("Deadline exceeded")
+        return httpx.Timeout(
+            connect=_cap(timeout.connect, remaining),
+            read=_cap(timeout.read, remaining),
+            write=_cap(timeout.write, remaining),
+            pool=_cap(timeout.pool, remaining),
+        )
+
+    @contextmanager
+    def guard(self) -> Generator[None]:
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        """Report request timeouts caused by this deadline as exceeded.
+
+        Such timeouts are not retried: the budget is already spent.
+        """
+{%- else %}
+        """Report request timeouts caused by this deadline as exceeded."""
+{%- endif %}
+        try:
+            yield
+        except httpx.TimeoutException as exc:
+            if self.expired:
+                raise DeadlineExceededError("Deadline exceeded") from exc
+            raise
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.3f})"
+
+
+type Budget = float | Deadline
+
+_current: contextvars.ContextVar[Deadline | None] = contextvars.ContextVar(
+    "deadline", default=None
+)
+
+
+def current_deadline() -> Deadline | None:
+    """Return the deadline of the running operation, if any."""
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(budget: Budget | None) -> Generator[Deadline | None]:
+    """Make ``budget`` the current deadline for the enclosed block.
+
+    ``budget`` is a number of seconds or a :class:`Deadline`. A nested
+    scope cannot extend an enclosing deadline, only shorten it. Blocking
+    code is not interrupted; its requests are bounded by the deadline.
+    """
+    deadline = _earliest(budget, _current.get())
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+@asynccontextmanager
+async def within_deadline(
+    budget: Budget | None,
+) -> AsyncGenerator[Deadline | None]:
+    """Async :func:`deadline_scope` that also cancels the block on expiry."""
+    with deadline_scope(budget) as deadline:
+        if deadline is None:
+            yield None
+            return
+        try:
+            async with asyncio.timeout(deadline.remaining()):
+                yield deadline
+        except TimeoutError as exc:
+            raise DeadlineExceededError("Deadline exceeded") from exc
+
+
+def detached_context() -> contextvars.Context:
+    """Return a copy of the current context without a deadline."""
+    context = contextvars.copy_context()
+    context.run(_current.set, None)
+    return context
+
+
+def _earliest(
+    budget: Budget | None, current: Deadline | None
+) -> Deadline | None:
+    if budget is None:
+        return current
+    if isinstance(budget, Deadline):
+        deadline = budget
+    else:
+        deadline = Deadline.after(budget)
+    if current is not None and current.expires_at < deadline.expires_at:
+        return current
+    return deadline
+
+
+def _cap(value: float | None, remaining: float) -> float:
+    return remaining if value is None else min(value, remaining)
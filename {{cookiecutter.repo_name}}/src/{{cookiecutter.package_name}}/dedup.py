@@ -0,0 +1,223 @@
+"""Suppression of duplicate {{ cookiecutter.gateway_name }} callbacks.
+
+Gateways redeliver the same notification until they see a success
+response, often several times. Remembering the IDs of processed
+notifications lets duplicates short-circuit before signature
+verification and before any database work.
+
+Two stores are provided: :class:`MemoryDedupStore` for a single process
+and :class:`SqliteDedupStore`, backed by a local SQLite file, for hosts
+running several worker processes.
+"""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Literal
+
+
+type DedupBackend = Literal["memory", "sqlite"]
+
+DEFAULT_DEDUP_TTL = 24 * 60 * 60.0
+DEFAULT_DEDUP_MAX_ENTRIES = 10_000
+_PRUNE_INTERVAL = 100
+
+
+class DedupStore:
+    """Bounded, expiring set of processed notification IDs.
+
+    ``hits`` counts lookups that found a duplicate and ``misses`` counts
+    lookups for new notifications. Stores are shared by threads (the
+    sync adapter and verification pools), so implementations lock their
+    own state.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def seen(self, key: str) -> bool:
+        """Return whether ``key`` was processed, updating the counters."""
+        found = self._contains(key)
+        with self._stats_lock:
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return found
+
+    def add(self, key: str) -> None:
+        """Record ``key`` as processed."""
+        raise NotImplementedError
+
+    def discard(self, key: str) -> None:
+        """Forget ``key`` so that a redelivery is processed again."""
+        raise NotImplementedError
+
+    def stats(self) -> dict[str, int]:
+        """Return the hit/miss counters."""
+        with self._stats_lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def _contains(self, key: str) -> bool:
+        raise NotImplementedError
+
+
+class MemoryDedupStore(DedupStore):
+    """In-process store evicting the oldest entries first."""
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_DEDUP_TTL,
+        max_entries: int = DEFAULT_DEDUP_MAX_ENTRIES,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Ordered by expiry time: entries are only ever appended with
+        # ``now + ttl``, so the oldest entry is always first.
+        self._expires: OrderedDict[str, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._expires)
+
+    def add(self, key: str) -> None:
+        now = self._clock()
+        with self._lock:
+            self._expires[key] = now + self.ttl
+            self._expires.move_to_end(key)
+            self._evict(now)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._expires.pop(key, None)
+
+    def _contains(self, key: str) -> bool:
+        now = self._clock()
+        with self._lock:
+            expires_at = self._expires.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= now:
+                del self._expires[key]
+                return False
+            return True
+
+    def _evict(self, now: float) -> None:
+        expires = self._expires
+        while len(expires) > self.max_entries:
+            expires.popitem(last=False)
+        while expires and next(iter(expires.values())) <= now:
+            expires.popitem(last=False)
+
+
+class SqliteDedupStore(DedupStore):
+    """Store shared by worker processes through a local SQLite file.
+
+    Lookups are single indexed queries on a local file and are run
+    inline; expired and excess entries are pruned every
+    ``_PRUNE_INTERVAL`` additions. Expiry uses wall-clock time because
+    the file outlives any one process.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = DEFAULT_DEDUP_TTL,
+        max_entries: int = DEFAULT_DEDUP_MAX_ENTRIES,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__()
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._additions = 0
+        self._db = sqlite3.connect(
+            path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS processed_callbacks "
+            "(key TEXT PRIMARY KEY, expires_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS processed_callbacks_expires_at "
+            "ON processed_callbacks (expires_at)"
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._db.execute(
+                "SELECT COUNT(*) FROM processed_callbacks"
+            ).fetchone()
+        return count
+
+    def add(self, key: str) -> None:
+        now = self._clock()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO processed_callbacks VALUES (?, ?)",
+                (key, now + self.ttl),
+            )
+            self._additions += 1
+            if self._additions % _PRUNE_INTERVAL == 0:
+                self._prune(now)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM processed_callbacks WHERE key = ?", (key,)
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+    def _contains(self, key: str) -> bool:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM processed_callbacks "
+                "WHERE key = ? AND expires_at > ?",
+                (key, self._clock()),
+            ).fetchone()
+        return row is not None
+
+    def _prune(self, now: float) -> None:
+        self._db.execute(
+            "DELETE FROM processed_callbacks WHERE expires_at <= ?", (now,)
+        )
+        self._db.execute(
+            "DELETE FROM processed_callbacks WHERE key IN ("
+            "SELECT key FROM processed_callbacks "
+            "ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+
+@lru_cache(maxsize=8)
+def get_dedup_store(
+    backend: DedupBackend = "memory",
+    ttl: float = DEFAULT_DEDUP_TTL,
+    max_entries: int = DEFAULT_DEDUP_MAX_ENTRIES,
+    path: str | None = None,
+) -> DedupStore:
+    """Return the shared store for one backend configuration."""
+    if backend == "memory":
+        return MemoryDedupStore(ttl, max_entries)
+    if backend == "sqlite":
+        if not path:
+            raise ValueError("The sqlite dedup backend requires a path")
+        return SqliteDedupStore(path, ttl, max_entries)
+    raise ValueError(f"Unknown dedup backend: {backend!r}")
@@ -0,0 +1,265 @@
+"""Cached public keys for {{ cookiecutter.gateway_name }} callback signatures.
+
+Gateways that sign callbacks with published keys (a JWKS document) would
+otherwise have every callback fetch and parse the key set. A
+:class:`KeyStore` keeps the parsed keys by key ID (``kid``):
+
+- the key set is refreshed in the background once it is ``ttl`` seconds
+  old; callers keep being served the cached keys meanwhile;
+- a callback signed with an unknown ``kid`` (the gateway rotated its
+  keys) re-fetches the key set once, shared by all concurrent callers,
+  and at most once per ``refetch_interval``, so forged key IDs cannot
+  make the worker hammer the gateway. Until a key set has loaded, a
+  failed fetch is retried by the next callback;
+- with a ``bundle_path`` the key set is written to disk after every
+  fetch and loaded on start, so new workers verify callbacks without a
+  network round-trip.
+
+Parsing is left to a ``parse`` hook turning one JWK into the key object
+the signature library works with.
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+from typing import Any
+
+from getpaid_core.exceptions import InvalidCallbackError
+
+from .codec import dumps
+from .codec import loads
+from .concurrency import SingleFlight
+
+
+if TYPE_CHECKING:
+    import httpx
+
+
+type Jwks = dict[str, Any]
+
+DEFAULT_KEY_TTL = 3600.0
+DEFAULT_REFETCH_INTERVAL = 60.0
+_REFRESH = "refresh"
+
+logger = logging.getLogger(__name__)
+
+
+class KeyNotFoundError(InvalidCallbackError):
+    """The callback names a signing key the gateway does not publish."""
+
+
+def parse_jwks(response: "httpx.Response") -> Jwks:
+    """Decode a JWKS response."""
+    return loads(response.raise_for_status().content)
+
+
+class KeyStore[K]:
+    """Parsed gateway public keys by key ID.
+
+    Keys without a ``kid`` are stored under ``""``. ``fetches`` counts
+    key sets fetched from the gateway. ``clock`` is monotonic.
+    """
+
+    def __init__(
+        self,
+        parse: Callable[[dict[str, Any]], K] | None = None,
+        *,
+        ttl: float = DEFAULT_KEY_TTL,
+        refetch_interval: float = DEFAULT_REFETCH_INTERVAL,
+        bundle_path: str | os.PathLike[str] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.parse = parse or (lambda jwk: jwk)
+        self.ttl = ttl
+        self.refetch_interval = refetch_interval
+        self.bundle_path = bundle_path
+        self._clock = clock
+        self._keys: dict[str, K] = {}
+        self._document: Jwks | None = None
+        self._fetched_at: float | None = None
+        self._attempted_at: float | None = None
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._flights: SingleFlight[str, None] = SingleFlight()
+        self.fetches = 0
+        if bundle_path is not None and os.path.exists(bundle_path):
+            try:
+                self.load_bundle(bundle_path)
+            except (OSError, ValueError) as exc:
+                logger.warning("Ignoring key bundle %s: %r", bundle_path, exc)
+
+    def get_cached(self, kid: str) -> K | None:
+        """Return the cached key ``kid`` without fetching."""
+        return self._keys.get(kid)
+
+    async def get(self, kid: str, fetch: Callable[[], Awaitable[Jwks]]) -> K:
+        """Return the key ``kid``, fetching the key set with ``fetch``.
+
+        Raises :class:`KeyNotFoundError` if the gateway does not publish
+        the key, or if it is unknown and the key set was last fetched less
+        than ``refetch_interval`` seconds ago.
+        """
+        keys = self._keys
+        if kid in keys:
+            if (
+                self._stale()
+                and not self._flights.in_flight(_REFRESH)
+                and self._claim_refresh()
+            ):
+                refresh = self._flights.start(
+                    _REFRESH, lambda: self._refresh(fetch)
+                )
+                refresh.add_done_callback(_refresh_done)
+            return keys[kid]
+        if self._flights.in_flight(_REFRESH) or self._claim_refresh():
+            await self._flights.do(_REFRESH, lambda: self._refresh(fetch))
+        return self._lookup(kid)
+
+    def get_sync(self, kid: str, fetch: Callable[[], Jwks]) -> K:
+        """Blocking variant of :meth:`get` for threads."""
+        keys = self._keys
+        if kid in keys:
+            if self._stale() and self._claim_refresh():
+                threading.Thread(
+                    target=self._refresh_in_thread, args=(fetch,), daemon=True
+                ).start()
+            return keys[kid]
+        with self._fetch_lock:
+            # Another thread may have fetched the key set while we waited.
+            if kid not in self._keys and self._claim_refresh():
+                self._install(fetch())
+        return self._lookup(kid)
+
+    def load_bundle(self, path: str | os.PathLike[str]) -> None:
+        """Load a key set written by :meth:`dump_bundle`.
+
+        The keys are as old as the file, so an outdated bundle is
+        refreshed on first use.
+        """
+        with open(path, "rb") as file:
+            document = loads(file.read())
+            age = max(0.0, time.time() - os.fstat(file.fileno()).st_mtime)
+        self._install(document, self._clock() - age, persist=False)
+
+    def dump_bundle(self, path: str | os.PathLike[str]) -> None:
+        """Atomically write the current key set to ``path``."""
+        if self._document is None:
+            raise ValueError("No key set has been loaded")
+        path = os.fspath(path)
+        # A unique temporary file per call: threads may dump concurrently.
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f"{os.path.basename(path)}.",
+            suffix=".tmp",
+            dir=os.path.dirname(path) or ".",
+        )
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(dumps(self._document))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _lookup(self, kid: str) -> K:
+        keys = self._keys
+        if kid not in keys:
+            raise KeyNotFoundError(f"Unknown callback signing key: {kid!r}")
+        return keys[kid]
+
+    async def _refresh(self, fetch: Callable[[], Awaitable[Jwks]]) -> None:
+        self._install(await fetch())
+
+    def _refresh_in_thread(self, fetch: Callable[[], Jwks]) -> None:
+        try:
+            with self._fetch_lock:
+                self._install(fetch())
+        except Exception as exc:
+            logger.warning("Background key refresh failed: %r", exc)
+
+    def _install(
+        self,
+        document: Jwks,
+        fetched_at: float | None = None,
+        *,
+        persist: bool = True,
+    ) -> None:
+        jwks = document.get("keys") if isinstance(document, dict) else None
+        if not isinstance(jwks, list):
+            raise ValueError("Not a JWKS document")
+        keys: dict[str, K] = {}
+        for jwk in jwks:
+            try:
+                keys[jwk.get("kid", "")] = self.parse(jwk)
+            except (AttributeError, KeyError, TypeError, ValueError) as exc:
+                logger.warning("Skipping unusable signing key: %r", exc)
+        # Replacing the map drops keys the gateway rotated out.
+        with self._lock:
+            self._keys = keys
+            self._document = document
+            self._fetched_at = (
+                self._clock() if fetched_at is None else fetched_at
+            )
+            if persist:
+                self.fetches += 1
+        if persist and self.bundle_path is not None:
+            try:
+                self.dump_bundle(self.bundle_path)
+            except OSError as exc:
+                logger.warning("Could not write key bundle: %r", exc)
+
+    def _stale(self) -> bool:
+        fetched_at = self._fetched_at
+        return fetched_at is None or self._clock() - fetched_at >= self.ttl
+
+    def _claim_refresh(self) -> bool:
+        """Reserve a fetch unless one was attempted too recently.
+
+        Until a key set has loaded, every fetch is allowed: throttling
+        then would reject all callbacks after a single failed fetch.
+        """
+        with self._lock:
+            now = self._clock()
+            if (
+                self._fetched_at is not None
+                and self._attempted_at is not None
+                and now - self._attempted_at < self.refetch_interval
+            ):
+                return False
+            self._attempted_at = now
+            return True
+
+
+def _refresh_done(task: asyncio.Future[None]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Background key refresh failed: %r", task.exception())
+
+
+_stores: dict[tuple[str, object], KeyStore] = {}
+
+
+def get_key_store[K](
+    url: str,
+    parse: Callable[[dict[str, Any]], K] | None = None,
+    ttl: float = DEFAULT_KEY_TTL,
+    refetch_interval: float = DEFAULT_REFETCH_INTERVAL,
+    bundle_path: str | os.PathLike[str] | None = None,
+) -> KeyStore[K]:
+    """Return the process-wide key store for the key set at ``url``.
+
+    The settings only apply when the store is first created.
+    """
+    store = _stores.get((url, parse))
+    if store is None:
+        store = _stores[(url, parse)] = KeyStore(
+            parse,
+            ttl=ttl,
+            refetch_interval=refetch_interval,
+            bundle_path=bundle_path,
+        )
+    return store
@@ -0,0 +1,252 @@
+"""Load test the {{ cookiecutter.gateway_name }} processor against the mock gateway.
+
+Drives concurrent payment flows (``prepare_transaction`` followed by a
+signed callback through ``verify_callback`` and ``handle_callback``)
+through the real processor and client, served in-process by
+:class:`~{{ cookiecutter.package_name }}.mock_gateway.MockGateway`, and
+reports throughput and latency percentiles::
+
+    getpaid-{{ cookiecutter.gateway_slug | replace('_', '-') }}-loadtest \
+        --flows 2000 --concurrency 100 \
+        --latency lognormal:0.05,0.6 --error-rate 0.01
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass
+from dataclasses import field
+from decimal import Decimal
+from functools import partial
+from typing import TYPE_CHECKING
+from typing import Literal
+
+from getpaid_core.enums import FraudStatus
+from getpaid_core.enums import PaymentStatus
+from getpaid_core.types import BuyerInfo
+from getpaid_core.types import ItemInfo
+
+from .concurrency import bounded_as_completed
+from .mock_gateway import MockGateway
+from .mock_gateway import parse_latency
+from .processor import {{ cookiecutter.processor_class_name }}
+from .transport import aclose_pooled_clients
+
+
+if TYPE_CHECKING:
+    from getpaid_core.protocols import Order
+
+
+type Flow = Literal["prepare", "callback", "full"]
+
+
+class LoadTestOrder:
+    """Minimal order satisfying the getpaid_core Order protocol."""
+
+    def __init__(self, total: Decimal, currency: str) -> None:
+        self.total = total
+        self.currency = currency
+
+    def get_total_amount(self) -> Decimal:
+        return self.total
+
+    def get_buyer_info(self) -> BuyerInfo:
+        return {"email": "loadtest@example.com"}
+
+    def get_description(self) -> str:
+        return "Load test order"
+
+    def get_currency(self) -> str:
+        return self.currency
+
+    def get_items(self) -> list[ItemInfo]:
+        return [{"name": "Item", "quantity": 1, "unit_price": self.total}]
+
+    def get_return_url(self, success: bool | None = None) -> str:
+        return "https://example.com/return"
+
+
+class LoadTestPayment:
+    """Minimal payment satisfying the getpaid_core Payment protocol."""
+
+    def __init__(
+        self, amount: Decimal = Decimal("100.00"), currency: str = "PLN"
+    ) -> None:
+        self.id = str(uuid.uuid4())
+        self.order: Order = LoadTestOrder(amount, currency)
+        self.amount_required = amount
+        self.currency = currency
+        self.status: str = PaymentStatus.NEW
+        self.backend = "{{ cookiecutter.gateway_slug }}"
+        self.external_id: str | None = ""
+        self.description: str | None = self.order.get_description()
+        self.amount_paid = Decimal("0")
+        self.amount_locked = Decimal("0")
+        self.amount_refunded = Decimal("0")
+        self.fraud_status: str = FraudStatus.UNKNOWN
+        self.fraud_message = ""
+        self.provider_data: dict = {}
+
+    def is_fully_paid(self) -> bool:
+        return self.amount_paid >= self.amount_required
+
+    def is_fully_refunded(self) -> bool:
+        return self.amount_refunded >= self.amount_paid
+
+
+@dataclass
+class LoadTestReport:
+    """Outcome of a load test run; latencies are in seconds."""
+
+    duration: float
+    latencies: list[float] = field(default_factory=list)
+    errors: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def flows(self) -> int:
+        return len(self.latencies) + self.errors.total()
+
+    @property
+    def throughput(self) -> float:
+        """Return completed flows per second."""
+        return len(self.latencies) / self.duration if self.duration else 0.0
+
+    def percentile(self, fraction: float) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def format(self) -> str:
+        lines = [
+            f"flows:      {self.flows}",
+            f"succeeded:  {len(self.latencies)}",
+            f"failed:     {self.errors.total()}",
+            f"duration:   {self.duration:.2f}s",
+            f"throughput: {self.throughput:.1f} flows/s",
+        ]
+        for fraction in (0.5, 0.95, 0.99):
+            value = self.percentile(fraction)
+            if value is not None:
+                label = f"p{round(fraction * 100)}:"
+                lines.append(f"{label:<12}{value * 1000:.1f}ms")
+        for error, count in self.errors.most_common():
+            lines.append(f"error:      {count} x {error}")
+        return "\n".join(lines)
+
+
+async def run_flow(
+    processor_class: type[{{ cookiecutter.processor_class_name }}],
+    config: dict,
+    gateway: MockGateway,
+    flow: Flow,
+) -> float:
+    """Run one payment flow and return its latency in seconds."""
+    started = time.perf_counter()
+    payment = LoadTestPayment()
+    processor = processor_class(payment=payment, config=config)
+    if flow in ("prepare", "full"):
+        await processor.prepare_transaction()
+    if flow in ("callback", "full"):
+        data, headers, body = gateway.signed_callback(
+            payment.external_id or payment.id
+        )
+        await processor.verify_callback(data, headers, raw_body=body)
+        await processor.handle_callback(data, headers, raw_body=body)
+    return time.perf_counter() - started
+
+
+async def _timed_flow(
+    processor_class: type[{{ cookiecutter.processor_class_name }}],
+    config: dict,
+    gateway: MockGateway,
+    flow: Flow,
+) -> float | BaseException:
+    try:
+        return await run_flow(processor_class, config, gateway, flow)
+    except Exception as exc:
+        return exc
+
+
+async def run_load_test(
+    gateway: MockGateway,
+    *,
+    flows: int,
+    concurrency: int,
+    flow: Flow = "full",
+    processor_class: type[{{ cookiecutter.processor_class_name }}] | None = None,
+    config: dict | None = None,
+) -> LoadTestReport:
+    """Run ``flows`` flows with at most ``concurrency`` in flight.
+
+    ``config`` entries override the processor configuration pointing at
+    ``gateway``.
+    """
+    processor_class = processor_class or {{ cookiecutter.processor_class_name }}
+    config = {
+        "sandbox": True,
+        "client_id": "loadtest",
+        "client_secret": "loadtest",
+        "signature_key": gateway.signature_key,
+        "transport": gateway.transport(),
+        **(config or {}),
+    }
+    job = partial(_timed_flow, processor_class, config, gateway, flow)
+    started = time.perf_counter()
+    report = LoadTestReport(duration=0.0)
+    try:
+        async for outcome in bounded_as_completed(
+            (job for _ in range(flows)), concurrency
+        ):
+            if isinstance(outcome, BaseException):
+                report.errors[f"{type(outcome).__name__}: {outcome}"] += 1
+            else:
+                report.latencies.append(outcome)
+    finally:
+        report.duration = time.perf_counter() - started
+        await aclose_pooled_clients()
+    return report
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Console entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--flows", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument(
+        "--flow", choices=["prepare", "callback", "full"], default="full"
+    )
+    parser.add_argument(
+        "--latency",
+        default="lognormal:0.02,0.5",
+        help='"SECONDS", "uniform:LOW,HIGH" or "lognormal:MEDIAN,SIGMA"',
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--payload-size", type=int, default=512)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    gateway = MockGateway(
+        latency=parse_latency(args.latency),
+        error_rate=args.error_rate,
+        payload_size=args.payload_size,
+        seed=args.seed,
+    )
+    report = asyncio.run(
+        run_load_test(
+            gateway,
+            flows=args.flows,
+            concurrency=args.concurrency,
+            flow=args.flow,
+        )
+    )
+    print(report.format())
+    return 1 if report.flows and not report.latencies else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,359 @@
+"""In-process request timing for the {{ cookiecutter.gateway_name }} client.
+
+:class:`RequestMetrics` installs httpx request/response event hooks that
+record, per logical operation and HTTP request:
+
+- ``connect_seconds``: TCP and TLS setup, only when a new connection
+  was opened (its count against ``total_seconds`` shows connection
+  reuse);
+- ``ttfb_seconds``: time until the response headers arrived;
+- ``total_seconds``: time until the response body was read or closed;
+- ``response_bytes``: bytes received on the wire;
+- the response status code.
+
+Timings go into fixed-bucket histograms, so memory does not grow with
+traffic. Read them with :meth:`RequestMetrics.snapshot` or export them
+with :meth:`RequestMetrics.to_prometheus`. The same registry instruments
+sync ``httpx.Client`` instances through
+:meth:`RequestMetrics.sync_event_hooks`.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+
+
+OPERATION_EXTENSION = "getpaid_operation"
+DEFAULT_NAMESPACE = "{{ cookiecutter.package_name }}"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUANTILES = (0.5, 0.95, 0.99)
+
+_BUCKETS = {
+    "connect_seconds": LATENCY_BUCKETS,
+    "ttfb_seconds": LATENCY_BUCKETS,
+    "total_seconds": LATENCY_BUCKETS,
+    "response_bytes": SIZE_BUCKETS,
+}
+_HELP = {
+    "connect_seconds": "Time spent opening new connections.",
+    "ttfb_seconds": "Time until the response headers were received.",
+    "total_seconds": "Time until the response body was received.",
+    "response_bytes": "Response body size received on the wire.",
+}
+
+type EventHook = Callable[[Any], Awaitable[None]]
+type SyncEventHook = Callable[[Any], None]
+
+
+class Histogram:
+    """Cumulative fixed-bucket histogram with estimated quantiles."""
+
+    __slots__ = ("buckets", "count", "counts", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def copy(self) -> "Histogram":
+        histogram = Histogram(self.buckets)
+        histogram.counts = self.counts.copy()
+        histogram.count = self.count
+        histogram.sum = self.sum
+        return histogram
+
+    def quantile(self, fraction: float) -> float | None:
+        """Estimate a quantile by interpolating within its bucket.
+
+        Values above the last bucket are reported as the last bound.
+        """
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def snapshot(self) -> dict[str, float | None]:
+        """Return the count, sum and p50/p95/p99 estimates."""
+        summary: dict[str, float | None] = {
+            "count": self.count,
+            "sum": self.sum,
+        }
+        for fraction in QUANTILES:
+            summary[f"p{round(fraction * 100)}"] = self.quantile(fraction)
+        return summary
+
+
+class _Timing:
+    __slots__ = ("connect_seconds", "connect_started", "operation", "started")
+
+    def __init__(self, operation: str, started: float) -> None:
+        self.operation = operation
+        self.started = started
+        self.connect_started: float | None = None
+        self.connect_seconds: float | None = None
+
+
+class _MeteredStream(httpx.AsyncByteStream, httpx.SyncByteStream):
+    """Count response bytes and report them once the body is closed."""
+
+    def __init__(self, stream: Any, on_close: Callable[[int], None]) -> None:
+        self._stream = stream
+        self._on_close: Callable[[int], None] | None = on_close
+        self._size = 0
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._size += len(chunk)
+            yield chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._size += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+        self._report()
+
+    def close(self) -> None:
+        self._stream.close()
+        self._report()
+
+    def _report(self) -> None:
+        if self._on_close is not None:
+            self._on_close(self._size)
+            self._on_close = None
+
+
+class RequestMetrics:
+    """Per-operation request histograms fed by httpx event hooks.
+
+    The operation is taken from the ``getpaid_operation`` request
+    extension, which :meth:`request` of the API client sets, and
+    defaults to the HTTP method.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._histograms: dict[tuple[str, str], Histogram] = {}
+        self._statuses: Counter[tuple[str, int]] = Counter()
+        # Sync clients record from several threads.
+        self._lock = threading.Lock()
+
+    def event_hooks(self) -> dict[str, list[EventHook]]:
+        """Return ``event_hooks`` for an ``httpx.AsyncClient``."""
+        return {
+            "request": [self._on_request],
+            "response": [self._on_response],
+        }
+
+    def sync_event_hooks(self) -> dict[str, list[SyncEventHook]]:
+        """Return ``event_hooks`` for a sync ``httpx.Client``."""
+        return {
+            "request": [self._record_request],
+            "response": [self._record_response],
+        }
+
+    def instrument(self, client: httpx.AsyncClient | httpx.Client) -> None:
+        """Add this registry's event hooks to an existing client."""
+        hooks = client.event_hooks
+        if isinstance(client, httpx.Client):
+            new_hooks: dict[str, list[Any]] = self.sync_event_hooks()
+        else:
+            new_hooks = self.event_hooks()
+        for event, handlers in new_hooks.items():
+            hooks[event] = [*hooks.get(event, []), *handlers]
+        client.event_hooks = hooks
+
+    def observe(self, operation: str, metric: str, value: float) -> None:
+        """Record one ``metric`` sample for ``operation``."""
+        with self._lock:
+            histogram = self._histograms.get((operation, metric))
+            if histogram is None:
+                histogram = Histogram(_BUCKETS[metric])
+                self._histograms[operation, metric] = histogram
+            histogram.observe(value)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return ``{operation: {metric: summary, "status": counts}}``."""
+        histograms, statuses = self._copy()
+        result: dict[str, dict[str, Any]] = {}
+        for key, histogram in sorted(histograms.items()):
+            operation, metric = key
+            summary = result.setdefault(operation, {"status": {}})
+            summary[metric] = histogram.snapshot()
+        for (operation, status), count in sorted(statuses.items()):
+            summary = result.setdefault(operation, {"status": {}})
+            summary["status"][status] = count
+        return result
+
+    def to_prometheus(self, namespace: str = DEFAULT_NAMESPACE) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        copied, statuses = self._copy()
+        histograms = sorted(copied.items())
+        lines: list[str] = []
+        for metric in _BUCKETS:
+            name = f"{namespace}_request_{metric}"
+            lines.append(f"# HELP {name} {_HELP[metric]}")
+            lines.append(f"# TYPE {name} histogram")
+            for (operation, kind), histogram in histograms:
+                if kind == metric:
+                    lines += _histogram_lines(name, operation, histogram)
+        name = f"{namespace}_responses_total"
+        lines += [
+            f"# HELP {name} Responses received, by status code.",
+            f"# TYPE {name} counter",
+        ]
+        for (operation, status), count in sorted(statuses.items()):
+            labels = prometheus_labels(operation=operation, status=status)
+            lines.append(f"{name}{labels} {count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+        with self._lock:
+            self._histograms.clear()
+            self._statuses.clear()
+
+    def _copy(
+        self,
+    ) -> tuple[dict[tuple[str, str], Histogram], Counter[tuple[str, int]]]:
+        """Copy the samples under the lock."""
+        with self._lock:
+            histograms = {
+                key: histogram.copy()
+                for key, histogram in self._histograms.items()
+            }
+            return histograms, self._statuses.copy()
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        timing = self._start_timing(request)
+        if "trace" not in request.extensions:
+            request.extensions["trace"] = _connect_tracer(self._clock, timing)
+
+    async def _on_response(self, response: httpx.Response) -> None:
+        self._record_response(response)
+
+    def _record_request(self, request: httpx.Request) -> None:
+        timing = self._start_timing(request)
+        if "trace" not in request.extensions:
+            request.extensions["trace"] = _sync_connect_tracer(
+                self._clock, timing
+            )
+
+    def _start_timing(self, request: httpx.Request) -> _Timing:
+        operation = request.extensions.get(OPERATION_EXTENSION, request.method)
+        timing = _Timing(operation, self._clock())
+        request.extensions["getpaid_timing"] = timing
+        return timing
+
+    def _record_response(self, response: httpx.Response) -> None:
+        timing: _Timing | None = response.request.extensions.get(
+            "getpaid_timing"
+        )
+        if timing is None:
+            return
+        now = self._clock()
+        operation = timing.operation
+        self.observe(operation, "ttfb_seconds", now - timing.started)
+        if timing.connect_seconds is not None:
+            self.observe(operation, "connect_seconds", timing.connect_seconds)
+        with self._lock:
+            self._statuses[operation, response.status_code] += 1
+
+        def on_close(size: int) -> None:
+            elapsed = self._clock() - timing.started
+            self.observe(operation, "total_seconds", elapsed)
+            self.observe(operation, "response_bytes", size)
+
+        if response.is_closed:
+            # Already fully read, e.g. a response built from bytes.
+            on_close(len(response.content))
+        else:
+            response.stream = _MeteredStream(response.stream, on_close)
+
+
+def _connect_tracer(
+    clock: Callable[[], float], timing: _Timing
+) -> Callable[[str, dict[str, Any]], Awaitable[None]]:
+    async def trace(event: str, info: dict[str, Any]) -> None:
+        _trace_connect(clock, timing, event)
+
+    return trace
+
+
+def _sync_connect_tracer(
+    clock: Callable[[], float], timing: _Timing
+) -> Callable[[str, dict[str, Any]], None]:
+    def trace(event: str, info: dict[str, Any]) -> None:
+        _trace_connect(clock, timing, event)
+
+    return trace
+
+
+def _trace_connect(
+    clock: Callable[[], float], timing: _Timing, event: str
+) -> None:
+    if event == "connection.connect_tcp.started":
+        timing.connect_started = clock()
+    elif timing.connect_started is not None and event in (
+        "connection.connect_tcp.complete",
+        "connection.start_tls.complete",
+    ):
+        timing.connect_seconds = clock() - timing.connect_started
+
+
+def _histogram_lines(
+    name: str, operation: str, histogram: Histogram
+) -> list[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip(histogram.buckets, histogram.counts, strict=False):
+        cumulative += count
+        labels = prometheus_labels(operation=operation, le=bound)
+        lines.append(f"{name}_bucket{labels} {cumulative}")
+    labels = prometheus_labels(operation=operation, le="+Inf")
+    lines.append(f"{name}_bucket{labels} {histogram.count}")
+    labels = prometheus_labels(operation=operation)
+    lines.append(f"{name}_sum{labels} {histogram.sum}")
+    lines.append(f"{name}_count{labels} {histogram.count}")
+    return lines
+
+
+def prometheus_labels(**labels: object) -> str:
+    """Render ``labels`` as an escaped Prometheus label set."""
+    pairs = ",".join(
+        f'{key}="{_escape(str(value))}"' for key, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+default_metrics = RequestMetrics()
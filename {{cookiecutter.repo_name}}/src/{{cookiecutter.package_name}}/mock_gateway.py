@@ -0,0 +1,181 @@
+"""In-process stand-in for the {{ cookiecutter.gateway_name }} API.
+
+:class:`MockGateway` is a dependency-free ASGI application. Serve it
+through ``httpx.ASGITransport`` (see :meth:`MockGateway.transport`) to
+exercise the real client and processor without a sandbox, with
+configurable latency, error rate and response size.
+
+TODO: mirror the gateway's real endpoints and payloads as the processor
+is implemented.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import itertools
+import json
+import math
+import random
+import re
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import MutableMapping
+from typing import Any
+
+import httpx
+
+
+type Latency = Callable[[], float]
+type Scope = MutableMapping[str, Any]
+type Receive = Callable[[], Awaitable[MutableMapping[str, Any]]]
+type Send = Callable[[MutableMapping[str, Any]], Awaitable[None]]
+
+MOCK_GATEWAY_URL = "http://mock-gateway.local"
+DEFAULT_SIGNATURE_KEY = "mock-gateway-signature-key"
+
+_PAYMENT_PATH = re.compile(r"^/payments/(?P<id>[^/]+)$")
+_REFUND_PATH = re.compile(r"^/payments/(?P<id>[^/]+)/refunds$")
+
+
+def fixed_latency(seconds: float) -> Latency:
+    """Return a latency distribution that always takes ``seconds``."""
+    return lambda: seconds
+
+
+def uniform_latency(
+    low: float, high: float, *, rng: random.Random | None = None
+) -> Latency:
+    """Return latencies drawn uniformly from ``[low, high]``."""
+    rng = rng or random.Random()
+    return lambda: rng.uniform(low, high)
+
+
+def lognormal_latency(
+    median: float, sigma: float, *, rng: random.Random | None = None
+) -> Latency:
+    """Return long-tailed latencies with the given ``median``."""
+    if median <= 0:
+        raise ValueError("median must be positive")
+    rng = rng or random.Random()
+    mu = math.log(median)
+    return lambda: rng.lognormvariate(mu, sigma)
+
+
+def parse_latency(spec: str, *, rng: random.Random | None = None) -> Latency:
+    """Parse a latency specification.
+
+    Accepts ``"0.05"`` (fixed seconds), ``"uniform:LOW,HIGH"`` and
+    ``"lognormal:MEDIAN,SIGMA"``.
+    """
+    kind, _, args = spec.partition(":")
+    if not args:
+        return fixed_latency(float(kind))
+    values = [float(value) for value in args.split(",")]
+    if kind == "uniform" and len(values) == 2:
+        return uniform_latency(*values, rng=rng)
+    if kind == "lognormal" and len(values) == 2:
+        return lognormal_latency(*values, rng=rng)
+    raise ValueError(f"Invalid latency specification: {spec!r}")
+
+
+class MockGateway:
+    """ASGI application imitating the gateway's REST API and callbacks.
+
+    Every request waits for a delay drawn from ``latency`` and fails with
+    ``503`` with probability ``error_rate``. Successful JSON responses are
+    padded to at least ``payload_size`` bytes.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: Latency | None = None,
+        error_rate: float = 0.0,
+        payload_size: int = 0,
+        signature_key: str = DEFAULT_SIGNATURE_KEY,
+        seed: int | None = None,
+    ) -> None:
+        self.latency = latency or fixed_latency(0.0)
+        self.error_rate = error_rate
+        self.payload_size = payload_size
+        self.signature_key = signature_key
+        self.requests = 0
+        self._rng = random.Random(seed)
+        self._ids = itertools.count(1)
+
+    def transport(self) -> httpx.ASGITransport:
+        """Return an httpx transport serving this app in-process."""
+        return httpx.ASGITransport(app=self)
+
+    def signed_callback(
+        self, payment_id: str, status: str = "COMPLETED"
+    ) -> tuple[dict[str, Any], dict[str, str], bytes]:
+        """Return ``(data, headers, raw_body)`` of a signed notification."""
+        data = {
+            "notificationId": f"ntf-{next(self._ids)}",
+            "paymentId": payment_id,
+            "status": status,
+        }
+        body = json.dumps(data).encode()
+        signature = hmac.new(
+            self.signature_key.encode(), body, hashlib.sha256
+        ).hexdigest()
+        return data, {"X-Signature": signature}, body
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            return
+        # Drain the request body; the mock does not inspect it.
+        while (await receive()).get("more_body", False):
+            pass
+        self.requests += 1
+        delay = self.latency()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self._rng.random() < self.error_rate:
+            status, payload = 503, {"error": "Service unavailable"}
+        else:
+            status, payload = self._route(scope["method"], scope["path"])
+        await _send_json(send, status, payload)
+
+    def _route(self, method: str, path: str) -> tuple[int, dict[str, Any]]:
+        if method == "POST" and path == "/oauth/token":
+            return 200, {"access_token": "mock-token", "expires_in": 3600}
+        if method == "POST" and path == "/payments":
+            payment_id = f"pay-{next(self._ids)}"
+            return 201, self._pad(
+                {
+                    "id": payment_id,
+                    "redirectUrl": f"{MOCK_GATEWAY_URL}/pay/{payment_id}",
+                }
+            )
+        if method == "GET" and (match := _PAYMENT_PATH.match(path)):
+            return 200, self._pad({"id": match["id"], "status": "COMPLETED"})
+        if method == "POST" and (match := _REFUND_PATH.match(path)):
+            refund = {"id": f"ref-{next(self._ids)}", "paymentId": match["id"]}
+            return 201, self._pad({**refund, "status": "PENDING"})
+        return 404, {"error": "Not found"}
+
+    def _pad(self, payload: dict[str, Any]) -> dict[str, Any]:
+        if self.payload_size:
+            # 15 bytes for the ``, "padding": ""`` member itself.
+            size = len(json.dumps(payload)) + 15
+            payload["padding"] = "x" * max(0, self.payload_size - size)
+        return payload
+
+
+async def _send_json(send: Send, status: int, payload: dict[str, Any]) -> None:
+    body = json.dumps(payload).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,173 @@
+"""Offloading of CPU-heavy callback verification from the event loop.
+
+Verifying RSA, ECDSA or JWS signatures (or HMACs over large bodies)
+takes long enough that, during a burst of callbacks, running it on the
+event loop stalls every other coroutine in the worker. A
+:class:`VerificationPool` moves that work to a thread or process pool:
+
+- :meth:`VerificationPool.run` runs a blocking verification on a worker
+  thread, with at most ``max_pending`` jobs queued per event loop so a
+  burst waits for a slot instead of piling up unbounded work;
+- :meth:`VerificationPool.compute` runs the signature check itself,
+  either inline or, with ``kind="process"``, in a process pool; its
+  function and arguments must then be picklable.
+
+Bodies of at most ``inline_max_bytes`` are verified inline: for them the
+hand-off costs more than the check.
+"""
+
+import asyncio
+import contextvars
+import multiprocessing
+import os
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal
+
+
+type ExecutorKind = Literal["thread", "process"]
+
+DEFAULT_MAX_PENDING = 64
+DEFAULT_INLINE_MAX_BYTES = 4096
+
+
+class VerificationPool:
+    """Bounded thread or process pool for callback verification.
+
+    ``max_workers`` defaults to the number of CPUs. Executors are created
+    on first use and shut down by :meth:`shutdown`.
+    """
+
+    def __init__(
+        self,
+        kind: ExecutorKind = "thread",
+        *,
+        max_workers: int | None = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        inline_max_bytes: int = DEFAULT_INLINE_MAX_BYTES,
+    ) -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind!r}")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.kind = kind
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.inline_max_bytes = inline_max_bytes
+        self._threads: ThreadPoolExecutor | None = None
+        self._processes: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._slots: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    def offloads(self, size: int) -> bool:
+        """Return whether a body of ``size`` bytes is verified off-loop."""
+        return size > self.inline_max_bytes
+
+    async def run[T](self, func: Callable[[], T], *, size: int) -> T:
+        """Run ``func`` on a worker thread, or inline for small bodies.
+
+        ``func`` runs in a copy of the current context, so it sees the
+        caller's deadline. Waits for a free slot once ``max_pending``
+        jobs of this event loop are queued or running.
+        """
+        if not self.offloads(size):
+            return func()
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = asyncio.Semaphore(self.max_pending)
+        context = contextvars.copy_context()
+        async with slots:
+            return await loop.run_in_executor(
+                self._thread_pool(), context.run, func
+            )
+
+    def compute[T](self, func: Callable[..., T], *args: object, size: int) -> T:
+        """Run ``func(*args)`` in the process pool, or inline.
+
+        Blocks the calling thread; call it from code :meth:`run` has
+        already moved off the event loop.
+        """
+        if self.kind != "process" or not self.offloads(size):
+            return func(*args)
+        args = tuple(
+            bytes(arg) if isinstance(arg, memoryview) else arg for arg in args
+        )
+        return self._process_pool().submit(func, *args).result()
+
+    def shutdown(self) -> None:
+        """Shut down the executors, waiting for running jobs."""
+        with self._lock:
+            executors = (self._threads, self._processes)
+            self._threads = self._processes = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown()
+
+    def _thread_pool(self) -> Executor:
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="callback-verify"
+                )
+            return self._threads
+
+    def _process_pool(self) -> Executor:
+        with self._lock:
+            if self._processes is None:
+                # The pool starts from a multi-threaded process, where
+                # fork() is unsafe.
+                self._processes = ProcessPoolExecutor(
+                    self.max_workers, mp_context=_process_context()
+                )
+            return self._processes
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def body_size(body: object) -> int:
+    """Return the size in bytes of a bytes-like ``body``, else ``0``."""
+    if isinstance(body, bytes | bytearray | memoryview):
+        return memoryview(body).nbytes
+    return 0
+
+
+_pools: dict[tuple[object, ...], VerificationPool] = {}
+
+
+def get_verification_pool(
+    kind: ExecutorKind = "thread",
+    max_workers: int | None = None,
+    max_pending: int = DEFAULT_MAX_PENDING,
+    inline_max_bytes: int = DEFAULT_INLINE_MAX_BYTES,
+) -> VerificationPool:
+    """Return the process-wide pool for one configuration."""
+    key = (kind, max_workers, max_pending, inline_max_bytes)
+    pool = _pools.get(key)
+    if pool is None:
+        pool = _pools[key] = VerificationPool(
+            kind,
+            max_workers=max_workers,
+            max_pending=max_pending,
+            inline_max_bytes=inline_max_bytes,
+        )
+    return pool
+
+
+def shutdown_verification_pools() -> None:
+    """Shut down the executors of every shared pool.
+
+    Call it on application shutdown; pools restart on next use.
+    """
+    for pool in _pools.values():
+        pool.shutdown()
@@ -1,18 +1,159 @@
 """{{ cookiecutter.gateway_name }} payment processor."""
 
+import itertools
 import logging
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+from dataclasses import dataclass
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from dataclasses import field
+{%- endif %}
+from decimal import Decimal
+from functools import partial
+from itertools import batched
+from typing import TYPE_CHECKING
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from typing import Any
+{%- endif %}
 from typing import ClassVar
 
+from getpaid_core.exceptions import CredentialsError
+from getpaid_core.exceptions import InvalidCallbackError
 from getpaid_core.processor import BaseProcessor
 from getpaid_core.types import PaymentUpdate
 from getpaid_core.types import RefundResult
 from getpaid_core.types import TransactionResult
 
+from .api import ApiCall
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from .cache import DEFAULT_CACHE_MAX_ENTRIES
+from .cache import DEFAULT_CACHE_STALE
+from .cache import ResponseCache
+from .cache import get_response_cache
+{%- endif %}
 from .client import {{ cookiecutter.client_class_name }}
+from .client import {{ cookiecutter.__sync_client_class_name }}
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from .coalesce import DEFAULT_STATUS_CACHE_MAX_ENTRIES
+from .coalesce import DEFAULT_STATUS_CACHE_TTL
+from .coalesce import StatusCoalescer
+from .coalesce import get_status_coalescer
+{%- endif %}
+from .codec import loads
+from .concurrency import bounded_as_completed
+from .concurrency import ordered_by_key
+from .currency import to_minor_units
+from .deadline import Budget
+from .deadline import deadline_scope
+from .deadline import within_deadline
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from .dedup import DEFAULT_DEDUP_MAX_ENTRIES
+from .dedup import DEFAULT_DEDUP_TTL
+from .dedup import DedupStore
+from .dedup import get_dedup_store
+from .keys import DEFAULT_KEY_TTL
+from .keys import DEFAULT_REFETCH_INTERVAL
+from .keys import Jwks
+from .keys import KeyStore
+from .keys import get_key_store
+from .keys import parse_jwks
+from .offload import DEFAULT_INLINE_MAX_BYTES
+from .offload import DEFAULT_MAX_PENDING
+from .offload import VerificationPool
+from .offload import body_size
+from .offload import get_verification_pool
+from .ratelimit import DEFAULT_INTERACTIVE_RESERVE
+from .ratelimit import DEFAULT_MAX_PAUSE
+from .ratelimit import Priority
+from .ratelimit import request_priority
+from .resilience import DEFAULT_CIRCUIT_FAILURE_THRESHOLD
+from .resilience import DEFAULT_CIRCUIT_RESET_TIMEOUT
+from .resilience import DEFAULT_RETRY_BACKOFF_BASE
+from .resilience import DEFAULT_RETRY_BACKOFF_MAX
+from .resilience import DEFAULT_RETRY_MAX_ATTEMPTS
+from .resilience import ResiliencePolicy
+from .resilience import RetryPolicy
+from .response_log import ResponseLog
+from .response_log import get_response_log
+{%- endif %}
+from .signature import HmacVerifier
+from .signature import get_hmac_verifier
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from .transport import DEFAULT_KEEPALIVE_EXPIRY
+from .transport import DEFAULT_MAX_CONNECTIONS
+from .transport import DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+from .transport import DEFAULT_TIMEOUT
+from .transport import TransportSettings
+{%- endif %}
+
+
+if TYPE_CHECKING:
+    from getpaid_core.protocols import Payment
+
+    from .signature import Body
 
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_STATUS_CONCURRENCY = 10
+DEFAULT_CALLBACK_CONCURRENCY = 10
+DEFAULT_CALLBACK_MAX_PENDING = 1000
+
+type Callback = tuple["Body", dict]
+
+
+@dataclass(frozen=True, slots=True)
+class PaymentStatusResult:
+    """Outcome of fetching one payment's status in a batch.
+
+    ``error`` holds the exception raised for this payment, if any, so a
+    single failure does not abort the whole batch.
+    """
+
+    payment: "Payment"
+    update: PaymentUpdate | None = None
+    error: Exception | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class CallbackResult:
+    """Outcome of ingesting one callback in a batch.
+
+    ``index`` is the callback's position in the input. ``error`` holds
+    the exception raised while parsing, verifying or handling it, if any.
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+    Call :meth:`acknowledge` once ``update`` has been saved.
+{%- endif %}
+    """
+
+    index: int
+    payment_id: str | None
+    update: PaymentUpdate | None = None
+    error: Exception | None = None
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+    _acknowledge: Callable[[], None] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    def acknowledge(self) -> None:
+        """Record the callback as processed so redeliveries are skipped."""
+        if self._acknowledge is not None:
+            self._acknowledge()
+{%- endif %}
+
+
+@dataclass(frozen=True, slots=True)
+class _QueuedCallback:
+    index: int
+    raw_body: "Body"
+    headers: dict
+    data: dict | None = None
+    payment_id: str | None = None
+    error: Exception | None = None
+
 
 class {{ cookiecutter.processor_class_name }}(BaseProcessor):
     """{{ cookiecutter.gateway_name }} payment gateway processor."""
@@ -22,62 +163,935 @@ class {{ cookiecutter.processor_class_name }}(BaseProcessor):
     accepted_currencies: ClassVar[list[str]] = {{ cookiecutter.accepted_currencies | replace("'", '"') }}
     sandbox_url: ClassVar[str] = "{{ cookiecutter.sandbox_url }}"
     production_url: ClassVar[str] = "{{ cookiecutter.production_url }}"
+    # Maximum payments per bulk-status request; 0 disables the bulk path.
+    bulk_status_batch_size: ClassVar[int] = 0
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+    # Set by verify_callback() when the notification was already processed.
+    _duplicate_callback: bool = False
+{%- endif %}
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+    def _get_transport_settings(self) -> TransportSettings:
+        """Build connection pool settings from processor config."""
+        return TransportSettings(
+            max_connections=self.get_setting(
+                "max_connections", DEFAULT_MAX_CONNECTIONS
+            ),
+            max_keepalive_connections=self.get_setting(
+                "max_keepalive_connections", DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=self.get_setting(
+                "keepalive_expiry", DEFAULT_KEEPALIVE_EXPIRY
+            ),
+            timeout=self.get_setting("timeout", DEFAULT_TIMEOUT),
+            http2=self.get_setting("http2", False),
+            instrumented=self.get_setting("request_metrics", True),
+            transport=self.get_setting("transport"),
+            sync_transport=self.get_setting("sync_transport"),
+        )
+
+    def _get_resilience_policy(self) -> ResiliencePolicy:
+        """Build the retry/hedging/circuit-breaker policy from config."""
+        return ResiliencePolicy.for_endpoint(
+            self.get_paywall_baseurl().rstrip("/"),
+            retry=RetryPolicy(
+                max_attempts=self.get_setting(
+                    "retry_max_attempts", DEFAULT_RETRY_MAX_ATTEMPTS
+                ),
+                backoff_base=self.get_setting(
+                    "retry_backoff_base", DEFAULT_RETRY_BACKOFF_BASE
+                ),
+                backoff_max=self.get_setting(
+                    "retry_backoff_max", DEFAULT_RETRY_BACKOFF_MAX
+                ),
+            ),
+            failure_threshold=self.get_setting(
+                "circuit_failure_threshold", DEFAULT_CIRCUIT_FAILURE_THRESHOLD
+            ),
+            reset_timeout=self.get_setting(
+                "circuit_reset_timeout", DEFAULT_CIRCUIT_RESET_TIMEOUT
+            ),
+            hedge_percentile=self.get_setting("hedge_percentile"),
+            rate_limit=self.get_setting("rate_limit"),
+            rate_limit_burst=self.get_setting("rate_limit_burst"),
+            interactive_reserve=self.get_setting(
+                "rate_limit_interactive_reserve", DEFAULT_INTERACTIVE_RESERVE
+            ),
+            rate_limit_max_pause=self.get_setting(
+                "rate_limit_max_pause", DEFAULT_MAX_PAUSE
+            ),
+        )
+
+    def get_response_log(self) -> ResponseLog | None:
+        """Return the log of recent gateway responses.
+
+        Shared by every processor with the same API URL and log settings;
+        ``None`` unless ``response_log_size`` is set.
+        """
+        size = self.get_setting("response_log_size", 0)
+        if not size:
+            return None
+        return get_response_log(
+            self.get_paywall_baseurl().rstrip("/"),
+            size,
+            self.get_setting("response_log_bodies", False),
+        )
+
+    def _get_response_cache(self) -> ResponseCache | None:
+        """Return the shared response cache if ``response_cache`` is set."""
+        ttls = self.get_setting("response_cache")
+        if not ttls:
+            return None
+        return get_response_cache(
+            tuple(sorted(ttls.items())),
+            self.get_setting(
+                "response_cache_max_entries", DEFAULT_CACHE_MAX_ENTRIES
+            ),
+            self.get_setting("response_cache_stale", DEFAULT_CACHE_STALE),
+        )
+
+    def _get_client(self) -> {{ cookiecutter.client_class_name }}:
+        """Create a client instance from processor config.
+
+        The client borrows a pooled HTTP connection pool shared by all
+        processors with the same API URL and transport settings.
+        """
+        return {{ cookiecutter.client_class_name }}(
+            api_url=self.get_paywall_baseurl(),
+            client_id=self.get_setting("client_id", ""),
+            client_secret=self.get_setting("client_secret", ""),
+            transport_settings=self._get_transport_settings(),
+            policy=self._get_resilience_policy(),
+            response_log=self.get_response_log(),
+            response_cache=self._get_response_cache(),
+            # TODO: pass other credentials from self.get_setting(...)
+        )
+
+    def _get_sync_client(self) -> {{ cookiecutter.__sync_client_class_name }}:
+        """Create a sync client from processor config.
+
+        Used by :class:`{{ cookiecutter.__sync_processor_class_name }}`; it
+        borrows the process-wide pooled ``httpx.Client``.
+        """
+        return {{ cookiecutter.__sync_client_class_name }}(
+            api_url=self.get_paywall_baseurl(),
+            client_id=self.get_setting("client_id", ""),
+            client_secret=self.get_setting("client_secret", ""),
+            transport_settings=self._get_transport_settings(),
+            policy=self._get_resilience_policy(),
+            response_log=self.get_response_log(),
+            response_cache=self._get_response_cache(),
+        )
+
+    def _get_status_coalescer(
+        self,
+    ) -> StatusCoalescer[PaymentUpdate | None] | None:
+        """Return the shared coalescer unless ``status_coalescing`` is off."""
+        if not self.get_setting("status_coalescing", True):
+            return None
+        return get_status_coalescer(
+            self.get_setting("status_cache_ttl", DEFAULT_STATUS_CACHE_TTL),
+            self.get_setting(
+                "status_cache_max_entries", DEFAULT_STATUS_CACHE_MAX_ENTRIES
+            ),
+        )
+
+    def _get_status_key(self) -> tuple[str, str, str] | None:
+        """Identify this payment's status across processor instances."""
+        external_id = self.payment.external_id
+        if not external_id:
+            return None
+        return (
+            self.get_paywall_baseurl(),
+            self.get_setting("client_id", ""),
+            external_id,
+        )
+{%- else %}
 
     def _get_client(self) -> {{ cookiecutter.client_class_name }}:
         """Create a client instance from processor config."""
         return {{ cookiecutter.client_class_name }}(
             api_url=self.get_paywall_baseurl(),
-            # TODO: pass credentials from self.get_setting(...)
+            client_id=self.get_setting("client_id", ""),
+            client_secret=self.get_setting("client_secret", ""),
+            transport=self.get_setting("transport"),
+            # TODO: pass other credentials from self.get_setting(...)
         )
 
-    async def prepare_transaction(self, **kwargs) -> TransactionResult:
+    def _get_sync_client(self) -> {{ cookiecutter.__sync_client_class_name }}:
+        """Create a sync client from processor config.
+
+        Used by :class:`{{ cookiecutter.__sync_processor_class_name }}`.
+        """
+        return {{ cookiecutter.__sync_client_class_name }}(
+            api_url=self.get_paywall_baseurl(),
+            client_id=self.get_setting("client_id", ""),
+            client_secret=self.get_setting("client_secret", ""),
+            transport=self.get_setting("sync_transport"),
+        )
+{%- endif %}
+
+    def _get_deadline(self, deadline: Budget | None) -> Budget | None:
+        if deadline is None:
+            return self.get_setting("operation_deadline")
+        return deadline
+
+    async def _call[T](
+        self, call: ApiCall[T], deadline: Budget | None = None
+    ) -> T:
+        async with (
+            within_deadline(self._get_deadline(deadline)),
+            self._get_client() as client,
+        ):
+            return await client.call(call)
+
+    async def prepare_transaction(
+        self, *, deadline: Budget | None = None, **kwargs
+    ) -> TransactionResult:
         """Prepare a payment transaction with the gateway.
 
-        This is the only REQUIRED method. It must communicate with
-        the payment gateway API to register a new transaction and
-        return a ``TransactionResult`` indicating where to redirect
-        the buyer.
+        This is the only REQUIRED operation. It must register a new
+        transaction with the gateway and return a ``TransactionResult``
+        indicating where to redirect the buyer.
+
+        Implement it in ``_prepare_transaction_call()``, which the sync
+        adapter runs as well.
+
+        ``deadline`` bounds the whole operation, in seconds or as a
+        :class:`~{{ cookiecutter.package_name }}.deadline.Deadline`; it
+        defaults to the ``operation_deadline`` setting. Once it is spent
+        the operation is cancelled with ``DeadlineExceededError``.
 
         Returns:
             TransactionResult with redirect_url, method, etc.
         """
+        return await self._call(
+            self._prepare_transaction_call(**kwargs), deadline
+        )
+
+    def _prepare_transaction_call(self, **kwargs) -> ApiCall[TransactionResult]:
+        """Describe the gateway call registering this payment."""
         # TODO: implement gateway-specific transaction registration
+        # Example:
+        #
+        # return ApiCall(
+        #     "POST",
+        #     "/payments",
+        #     self._parse_transaction,
+        #     authenticated=True,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        #     operation="prepare_transaction",
+{%- endif %}
+        #     options={
+        #         "json": {
+        #             "amount": self._to_minor_units(
+        #                 self.payment.amount_required
+        #             ),
+        #             "currency": self.payment.currency,
+        #         }
+        #     },
+        # )
         raise NotImplementedError
 
+    def _to_minor_units(self, amount: Decimal) -> int:
+        """Return ``amount`` in minor units of the payment currency.
+
+        Raises ``ValueError`` if the amount has more decimal places than
+        the currency allows; see :mod:`{{ cookiecutter.package_name }}.currency`.
+        """
+        return to_minor_units(amount, self.payment.currency)
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
     async def verify_callback(
         self, data: dict, headers: dict, **kwargs
     ) -> None:
         """Verify the authenticity of a gateway callback.
 
+        Implemented in the blocking ``_verify_callback()``, shared with
+        the sync adapter; it must not perform I/O. With
+        ``callback_verify_executor`` set, callbacks whose ``raw_body`` is
+        larger than ``callback_verify_inline_bytes`` are verified on a
+        worker thread, so a burst does not stall the event loop.
+
+        With ``callback_keys_path`` set, the gateway key the callback
+        names (see ``_get_callback_key_id()``) is passed to
+        ``_verify_callback()`` as ``signing_key``, from the shared key
+        store.
+
+        Notifications already processed (see ``_get_callback_id()``)
+        return early, before any key lookup or offloading;
+        ``handle_callback()`` then ignores them.
+        """
+        if self._is_duplicate_callback(data, headers):
+            return
+        store = self._get_key_store()
+        if store is not None:
+            kwargs["signing_key"] = await store.get(
+                self._get_callback_key_id(data, headers),
+                lambda: self._call(self._callback_keys_call()),
+            )
+        pool = self._get_verification_pool()
+        call = partial(self._verify_callback, data, headers, **kwargs)
+        if pool is None:
+            call()
+            return
+        await pool.run(call, size=body_size(kwargs.get("raw_body")))
+
+    def _get_verification_pool(self) -> VerificationPool | None:
+        """Return the shared verification pool, if one is configured."""
+        kind = self.get_setting("callback_verify_executor")
+        if not kind:
+            return None
+        return get_verification_pool(
+            kind,
+            self.get_setting("callback_verify_workers"),
+            self.get_setting(
+                "callback_verify_max_pending", DEFAULT_MAX_PENDING
+            ),
+            self.get_setting(
+                "callback_verify_inline_bytes", DEFAULT_INLINE_MAX_BYTES
+            ),
+        )
+
+    def _get_key_store(self) -> KeyStore | None:
+        """Return the shared gateway key store, if one is configured."""
+        path = self.get_setting("callback_keys_path")
+        if not path:
+            return None
+        return get_key_store(
+            self.get_paywall_baseurl().rstrip("/") + path,
+            type(self)._parse_callback_key,
+            self.get_setting("callback_keys_ttl", DEFAULT_KEY_TTL),
+            self.get_setting(
+                "callback_keys_refetch_interval", DEFAULT_REFETCH_INTERVAL
+            ),
+            self.get_setting("callback_keys_bundle"),
+        )
+
+    def _callback_keys_call(self) -> ApiCall[Jwks]:
+        """Describe the gateway call fetching its published key set."""
+        return ApiCall(
+            "GET",
+            self.get_setting("callback_keys_path"),
+            parse_jwks,
+            operation="callback_keys",
+        )
+
+    def _get_callback_key_id(self, data: dict, headers: dict) -> str:
+        """Return the ID (``kid``) of the key that signed this callback.
+
+        Return ``""`` for gateways publishing a single key without ID.
+        """
+        # TODO: return the key ID the gateway sends, e.g.
+        # return headers.get("X-Key-Id", "")
+        return ""
+
+    @classmethod
+    def _parse_callback_key(cls, jwk: dict) -> Any:
+        """Turn one published JWK into a key object for verification.
+
+        Called once per key set fetch, not per callback. Raise
+        ``ValueError`` for keys that cannot be used; they are skipped.
+        """
+        # TODO: parse with the signature library in use, e.g.
+        # return jwt.PyJWK(jwk)
+        return jwk
+{%- else %}
+
+    async def verify_callback(
+        self, data: dict, headers: dict, **kwargs
+    ) -> None:
+        """Verify the authenticity of a gateway callback.
+
+        Implemented in the blocking ``_verify_callback()``, shared with
+        the sync adapter; it must not perform I/O.
+        """
+        self._verify_callback(data, headers, **kwargs)
+{%- endif %}
+
+    def _verify_callback(self, data: dict, headers: dict, **kwargs) -> None:
+        """Verify the authenticity of a gateway callback.
+
         Called before ``handle_callback``. Should raise
         ``InvalidCallbackError`` if the signature or data is invalid.
+
+        For HMAC-signed gateways, pass the undecoded request body as
+        ``raw_body`` and verify it with ``_verify_signature()`` rather
+        than re-serializing ``data``.
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+        Not called for notifications already processed (see
+        ``_get_callback_id()``).
+{%- endif %}
         """
         # TODO: implement signature verification
+        # Example:
+        #
+        # self._verify_signature(
+        #     kwargs.get("raw_body"), headers.get("X-Signature", "")
+        # )
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        #
+        # or, for gateways signing with published keys, check the
+        # signature against kwargs["signing_key"].
+{%- endif %}
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+    def _get_callback_id(self, data: dict, headers: dict) -> str | None:
+        """Return the gateway's unique ID for this notification.
+
+        Return ``None`` to process every delivery. Use an ID that changes
+        whenever the notified state changes (an event or notification
+        ID), never the payment ID alone.
+        """
+        # TODO: return the gateway's notification ID, e.g.
+        # return data.get("notificationId")
+        return None
+
+    def _get_dedup_store(self) -> DedupStore | None:
+        """Return the processed-callback store, or ``None`` if disabled."""
+        backend = self.get_setting("callback_dedup", "memory")
+        if not backend:
+            return None
+        return get_dedup_store(
+            backend,
+            self.get_setting("callback_dedup_ttl", DEFAULT_DEDUP_TTL),
+            self.get_setting(
+                "callback_dedup_max_entries", DEFAULT_DEDUP_MAX_ENTRIES
+            ),
+            self.get_setting("callback_dedup_path"),
+        )
+
+    def _get_callback_key(self, data: dict, headers: dict) -> str | None:
+        callback_id = self._get_callback_id(data, headers)
+        if callback_id is None:
+            return None
+        return f"{self.slug}:{callback_id}"
+
+    def _is_duplicate_callback(self, data: dict, headers: dict) -> bool:
+        """Return whether this notification was already processed."""
+        key = self._get_callback_key(data, headers)
+        store = self._get_dedup_store()
+        if key is None or store is None or not store.seen(key):
+            return False
+        logger.debug("Ignoring duplicate callback %s", key)
+        self._duplicate_callback = True
+        return True
+
+    def acknowledge_callback(self, data: dict, headers: dict) -> None:
+        """Record this notification so that redeliveries are skipped.
+
+        Call it once the update from ``handle_callback()`` has been
+        saved, e.g. after ``PaymentFlow.handle_callback()`` returns. A
+        notification whose update failed to apply or save is not
+        recorded, so the gateway's redelivery is processed again.
+        """
+        key = self._get_callback_key(data, headers)
+        store = self._get_dedup_store()
+        if key is not None and store is not None:
+            store.add(key)
+{%- endif %}
+
+    def _get_signature_verifier(self) -> HmacVerifier:
+        """Return the shared HMAC verifier for this processor's config."""
+        key = self.get_setting("signature_key")
+        if not key:
+            raise CredentialsError("signature_key is not configured")
+        return get_hmac_verifier(
+            key,
+            self.get_setting("signature_algorithm", "sha256"),
+            self.get_setting("signature_encoding", "hex"),
+        )
+
+    def _verify_signature(
+        self, raw_body: "Body | None", signature: str | bytes
+    ) -> None:
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        """Raise ``InvalidCallbackError`` if the body signature is invalid.
+
+        With ``callback_verify_executor="process"`` large bodies are
+        checked in the process pool.
+        """
+        if raw_body is None or not signature:
+            raise InvalidCallbackError("Missing callback body or signature")
+        verifier = self._get_signature_verifier()
+        pool = self._get_verification_pool()
+        if pool is None:
+            valid = verifier.verify(raw_body, signature)
+        else:
+            valid = pool.compute(
+                verifier.verify, raw_body, signature, size=body_size(raw_body)
+            )
+        if not valid:
+{%- else %}
+        """Raise ``InvalidCallbackError`` if the body signature is invalid."""
+        if raw_body is None or not signature:
+            raise InvalidCallbackError("Missing callback body or signature")
+        if not self._get_signature_verifier().verify(raw_body, signature):
+{%- endif %}
+            raise InvalidCallbackError("Invalid callback signature")
 
     async def handle_callback(
         self, data: dict, headers: dict, **kwargs
     ) -> PaymentUpdate | None:
         """Handle a payment status callback from the gateway.
 
+        Implemented in the blocking ``_handle_callback()``, shared with
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        the sync adapter; it must not perform I/O. Duplicate notifications
+        return ``None`` without calling it.
+        """
+        if self._duplicate_callback:
+            return None
+        update = self._handle_callback(data, headers, **kwargs)
+        if update is not None:
+            self._forget_status()
+        return update
+{%- else %}
+        the sync adapter; it must not perform I/O.
+        """
+        return self._handle_callback(data, headers, **kwargs)
+{%- endif %}
+
+    def _handle_callback(
+        self, data: dict, headers: dict, **kwargs
+    ) -> PaymentUpdate | None:
+        """Handle a payment status callback from the gateway.
+
         Return a semantic ``PaymentUpdate`` describing what changed.
         Example:
 
         - ``PaymentUpdate(payment_event="payment_captured", paid_amount=...)``
         - ``PaymentUpdate(payment_event="failed")``
-        - ``PaymentUpdate(payment_event="refund_confirmed", refunded_amount=...)``
+        - ``PaymentUpdate(payment_event="refund_confirmed",
+          refunded_amount=...)``
+
+        Decode the raw body into a typed struct from ``types`` rather than
+        reading fields out of ``data`` by hand.
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+        Duplicates never reach this method, and the notification is only
+        recorded as processed by ``acknowledge_callback()``.
+{%- endif %}
         """
         # TODO: implement callback handling
+        # Example:
+        #
+        # notification = Notification.decode(kwargs["raw_body"])
+        # if notification.status is TransactionStatus.COMPLETED:
+        #     return PaymentUpdate(...)
+        return None
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+    def _forget_status(self) -> None:
+        """Drop the cached status after the payment changed."""
+        coalescer = self._get_status_coalescer()
+        key = self._get_status_key()
+        if coalescer is not None and key is not None:
+            coalescer.invalidate(key)
+{%- endif %}
+
+    @classmethod
+    def _parse_callback(cls, raw_body: "Body", headers: dict) -> dict:
+        """Decode a raw callback body into the ``data`` dict."""
+        # TODO: adjust if the gateway does not send JSON callbacks
+        return loads(raw_body)
+
+    @classmethod
+    def _get_callback_payment_id(cls, data: dict, headers: dict) -> str:
+        """Return the gateway payment ID a notification refers to.
+
+        Batch ingestion (``ingest_callbacks()``) handles notifications
+        with the same payment ID in delivery order, and rejects those
+        with an empty ID with ``InvalidCallbackError``.
+        """
+        # TODO: return the gateway's payment ID, e.g.
+        # return data["paymentId"]
+        raise NotImplementedError
+
+    @classmethod
+    async def ingest_callbacks(
+        cls,
+        callbacks: Iterable[Callback] | AsyncIterable[Callback],
+        get_payment: Callable[[str], Awaitable["Payment"]],
+        config: dict | None = None,
+        *,
+        concurrency: int | None = None,
+        max_pending: int | None = None,
+    ) -> AsyncIterator[CallbackResult]:
+        """Verify and handle a backlog of ``(raw_body, headers)`` callbacks.
+
+        Callbacks for different payments are processed concurrently, at
+        most ``concurrency`` payments at a time (``callback_concurrency``
+        setting by default). Callbacks for the same payment are handled
+        in delivery order, each only after the previous result was taken,
+        so apply every update before asking for the next result.
+        ``get_payment`` loads a payment by its gateway ID.
+
+        At most ``max_pending`` callbacks (``callback_max_pending``
+        setting by default) are read ahead of the consumer. Per-callback
+        failures are reported in ``CallbackResult.error``.
+        """
+        config = config or {}
+        limit = concurrency or config.get(
+            "callback_concurrency", DEFAULT_CALLBACK_CONCURRENCY
+        )
+        max_pending = max_pending or config.get(
+            "callback_max_pending", DEFAULT_CALLBACK_MAX_PENDING
+        )
+        index = itertools.count()
+        if isinstance(callbacks, AsyncIterable):
+            queued = (
+                cls._queue_callback(next(index), *callback)
+                async for callback in callbacks
+            )
+        else:
+            queued = (
+                cls._queue_callback(next(index), *callback)
+                for callback in callbacks
+            )
+        async for result in ordered_by_key(
+            queued,
+            partial(cls._ingest_callback, get_payment, config),
+            limit=limit,
+            max_pending=max_pending,
+        ):
+            yield result
+
+    @classmethod
+    def _queue_callback(
+        cls, index: int, raw_body: "Body", headers: dict
+    ) -> tuple[str | None, _QueuedCallback]:
+        try:
+            data = cls._parse_callback(raw_body, headers)
+            payment_id = cls._get_callback_payment_id(data, headers)
+            if not payment_id:
+                raise InvalidCallbackError("Callback names no payment")
+        except Exception as exc:
+            # Unparseable callbacks share the ``None`` key.
+            return None, _QueuedCallback(index, raw_body, headers, error=exc)
+        return payment_id, _QueuedCallback(
+            index, raw_body, headers, data, payment_id
+        )
+
+    @classmethod
+    async def _ingest_callback(
+        cls,
+        get_payment: Callable[[str], Awaitable["Payment"]],
+        config: dict,
+        callback: _QueuedCallback,
+    ) -> CallbackResult:
+        data, payment_id = callback.data, callback.payment_id
+        try:
+            if callback.error is not None:
+                raise callback.error
+            if data is None or payment_id is None:
+                raise InvalidCallbackError("Callback names no payment")
+            payment = await get_payment(payment_id)
+            processor = cls(payment=payment, config=config)
+            await processor.verify_callback(
+                data, callback.headers, raw_body=callback.raw_body
+            )
+            update = await processor.handle_callback(
+                data, callback.headers, raw_body=callback.raw_body
+            )
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+            acknowledge = partial(
+                processor.acknowledge_callback, data, callback.headers
+            )
+{%- endif %}
+        except Exception as exc:
+            logger.warning(
+                "Callback %d for payment %s failed: %r",
+                callback.index,
+                callback.payment_id,
+                exc,
+            )
+            return CallbackResult(
+                callback.index, callback.payment_id, error=exc
+            )
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        return CallbackResult(
+            callback.index, callback.payment_id, update, None, acknowledge
+        )
+{%- else %}
+        return CallbackResult(callback.index, callback.payment_id, update)
+{%- endif %}
 
-    async def fetch_payment_status(self, **kwargs) -> PaymentUpdate | None:
+    async def fetch_payment_status(
+        self, *, deadline: Budget | None = None, **kwargs
+    ) -> PaymentUpdate | None:
         """Fetch current payment status from the gateway (PULL flow).
 
+        Implement it in ``_fetch_payment_status_call()``. ``deadline`` is
+        as for :meth:`prepare_transaction`.
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+        Concurrent calls for the same payment share one gateway request
+        (``status_coalescing``), and with ``status_cache_ttl`` set its
+        result is reused for that many seconds. Calls passing extra
+        arguments are not coalesced.
+{%- endif %}
+
         Returns:
             PaymentUpdate describing the current semantic status.
         """
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        call = self._fetch_payment_status_call(**kwargs)
+        coalescer = self._get_status_coalescer()
+        key = self._get_status_key()
+        if coalescer is None or key is None or kwargs:
+            return await self._call(call, deadline)
+        # The shared request is bounded by the default deadline only; each
+        # caller's own deadline bounds its wait.
+        async with within_deadline(self._get_deadline(deadline)):
+            return await coalescer.do(key, lambda: self._call(call))
+{%- else %}
+        return await self._call(
+            self._fetch_payment_status_call(**kwargs), deadline
+        )
+{%- endif %}
+
+    def _fetch_payment_status_call(
+        self, **kwargs
+    ) -> ApiCall[PaymentUpdate | None]:
+        """Describe the gateway call returning this payment's status."""
         # TODO: implement status polling
         raise NotImplementedError
 
-    async def start_refund(self, amount=None, **kwargs) -> RefundResult:
-        """Start a refund and return refund metadata."""
+    @classmethod
+    async def fetch_bulk_status(
+        cls, payments: list["Payment"], config: dict | None = None
+    ) -> dict[str, PaymentUpdate | None]:
+        """Fetch many payment statuses with one gateway request.
+
+        Only used when ``bulk_status_batch_size`` is non-zero. Return a
+        mapping of ``payment.external_id`` to ``PaymentUpdate``; payments
+        missing from the mapping are reported as ``None``.
+        """
+        # TODO: implement if the gateway exposes a bulk-status endpoint
+        raise NotImplementedError
+
+    @classmethod
+    async def fetch_payment_statuses(
+        cls,
+        payments: Iterable["Payment"],
+        config: dict | None = None,
+        *,
+        concurrency: int | None = None,
+    ) -> AsyncIterator[PaymentStatusResult]:
+        """Fetch the status of many payments (batch PULL flow).
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+        Requests fan out over the shared pooled client with at most
+        ``concurrency`` in flight (``status_concurrency`` setting by
+        default). Results are yielded in completion order, not input
+        order. Requests are sent with batch priority, so the rate limiter
+        lets interactive calls go first.
+{%- else %}
+
+        Requests fan out with at most ``concurrency`` in flight
+        (``status_concurrency`` setting by default). Results are yielded
+        in completion order, not input order.
+{%- endif %}
+        """
+        config = config or {}
+        limit = concurrency or config.get(
+            "status_concurrency", DEFAULT_STATUS_CONCURRENCY
+        )
+        if cls.bulk_status_batch_size:
+            chunks = batched(payments, cls.bulk_status_batch_size)
+            chunk_jobs = (
+                partial(cls._fetch_status_chunk, list(chunk), config)
+                for chunk in chunks
+            )
+            async for results in bounded_as_completed(chunk_jobs, limit):
+                for result in results:
+                    yield result
+        else:
+            jobs = (
+                partial(cls._fetch_single_status, payment, config)
+                for payment in payments
+            )
+            async for result in bounded_as_completed(jobs, limit):
+                yield result
+
+    @classmethod
+    async def _fetch_single_status(
+        cls, payment: "Payment", config: dict
+    ) -> PaymentStatusResult:
+        try:
+            processor = cls(payment=payment, config=config)
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+            with request_priority(Priority.BATCH):
+                update = await processor.fetch_payment_status()
+{%- else %}
+            update = await processor.fetch_payment_status()
+{%- endif %}
+        except Exception as exc:
+            logger.warning(
+                "Status fetch failed for payment %s: %r", payment.id, exc
+            )
+            return PaymentStatusResult(payment=payment, error=exc)
+        return PaymentStatusResult(payment=payment, update=update)
+
+    @classmethod
+    async def _fetch_status_chunk(
+        cls, payments: list["Payment"], config: dict
+    ) -> list[PaymentStatusResult]:
+        try:
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+            with request_priority(Priority.BATCH):
+                updates = await cls.fetch_bulk_status(payments, config)
+{%- else %}
+            updates = await cls.fetch_bulk_status(payments, config)
+{%- endif %}
+        except Exception as exc:
+            logger.warning(
+                "Bulk status fetch failed for %d payments: %r",
+                len(payments),
+                exc,
+            )
+            return [
+                PaymentStatusResult(payment=payment, error=exc)
+                for payment in payments
+            ]
+        return [
+            PaymentStatusResult(
+                payment=payment, update=updates.get(payment.external_id)
+            )
+            for payment in payments
+        ]
+
+    async def start_refund(
+        self, amount=None, *, deadline: Budget | None = None, **kwargs
+    ) -> RefundResult:
+        """Start a refund and return refund metadata.
+
+        Implement it in ``_start_refund_call()``. ``deadline`` is as for
+        :meth:`prepare_transaction`.
+        """
+        return await self._call(
+            self._start_refund_call(amount, **kwargs), deadline
+        )
+
+    def _start_refund_call(
+        self, amount: Decimal | None = None, **kwargs
+    ) -> ApiCall[RefundResult]:
+        """Describe the gateway call refunding ``amount``."""
         # TODO: implement refund creation
+        # Example:
+        #
+        # if amount is None:
+        #     amount = self.payment.amount_paid
+        # return ApiCall(
+        #     "POST",
+        #     f"/payments/{self.payment.external_id}/refunds",
+        #     self._parse_refund,
+        #     authenticated=True,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        #     operation="start_refund",
+{%- endif %}
+        #     options={"json": {"amount": self._to_minor_units(amount)}},
+        # )
         raise NotImplementedError
+
+
+class {{ cookiecutter.__sync_processor_class_name }}:
+    """Blocking adapter for :class:`{{ cookiecutter.processor_class_name }}`.
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+    For WSGI deployments: operations send the processor's
+    :class:`~{{ cookiecutter.package_name }}.api.ApiCall` through the pooled
+    sync client instead of bridging each call through a new event loop
+    and a new ``httpx.AsyncClient``. Callbacks run the processor's own
+{%- else %}
+
+    For WSGI deployments: operations send the processor's
+    :class:`~{{ cookiecutter.package_name }}.api.ApiCall` through the sync
+    client instead of bridging each call through a new event loop and
+    a new ``httpx.AsyncClient``. Callbacks run the processor's own
+{%- endif %}
+    verification and handling. A ``deadline`` caps the timeout of each
+    request but does not interrupt one in progress.
+    """
+
+    processor_class = {{ cookiecutter.processor_class_name }}
+
+    def __init__(self, payment: "Payment", config: dict | None = None) -> None:
+        self.processor = self.processor_class(payment=payment, config=config)
+
+    @property
+    def payment(self) -> "Payment":
+        return self.processor.payment
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+    def get_response_log(self) -> ResponseLog | None:
+        return self.processor.get_response_log()
+{%- endif %}
+
+    def prepare_transaction(
+        self, *, deadline: Budget | None = None, **kwargs
+    ) -> TransactionResult:
+        return self._call(
+            self.processor._prepare_transaction_call(**kwargs), deadline
+        )
+
+    def verify_callback(self, data: dict, headers: dict, **kwargs) -> None:
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        if self.processor._is_duplicate_callback(data, headers):
+            return
+        store = self.processor._get_key_store()
+        if store is not None:
+            kwargs["signing_key"] = store.get_sync(
+                self.processor._get_callback_key_id(data, headers),
+                lambda: self._call(self.processor._callback_keys_call()),
+            )
+{%- endif %}
+        self.processor._verify_callback(data, headers, **kwargs)
+
+    def handle_callback(
+        self, data: dict, headers: dict, **kwargs
+    ) -> PaymentUpdate | None:
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        if self.processor._duplicate_callback:
+            return None
+        update = self.processor._handle_callback(data, headers, **kwargs)
+        if update is not None:
+            self.processor._forget_status()
+        return update
+
+    def acknowledge_callback(self, data: dict, headers: dict) -> None:
+        self.processor.acknowledge_callback(data, headers)
+{%- else %}
+        return self.processor._handle_callback(data, headers, **kwargs)
+{%- endif %}
+
+    def fetch_payment_status(
+        self, *, deadline: Budget | None = None, **kwargs
+    ) -> PaymentUpdate | None:
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        call = self.processor._fetch_payment_status_call(**kwargs)
+        coalescer = self.processor._get_status_coalescer()
+        key = self.processor._get_status_key()
+        if coalescer is None or key is None or kwargs:
+            return self._call(call, deadline)
+        return coalescer.do_sync(key, lambda: self._call(call, deadline))
+{%- else %}
+        return self._call(
+            self.processor._fetch_payment_status_call(**kwargs), deadline
+        )
+{%- endif %}
+
+    def start_refund(
+        self, amount=None, *, deadline: Budget | None = None, **kwargs
+    ) -> RefundResult:
+        return self._call(
+            self.processor._start_refund_call(amount, **kwargs), deadline
+        )
+
+    def _call[T](self, call: ApiCall[T], deadline: Budget | None = None) -> T:
+        budget = self.processor._get_deadline(deadline)
+        client = self.processor._get_sync_client()
+        with deadline_scope(budget), client:
+            return client.call(call)
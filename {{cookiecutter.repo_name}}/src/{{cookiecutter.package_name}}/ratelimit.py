@@ -0,0 +1,236 @@
+"""Client-side rate limiting for {{ cookiecutter.gateway_name }} requests.
+
+A per-``api_url`` :class:`RateLimiter` keeps requests within the
+gateway's published quota with a token bucket, so bulk jobs slow down
+instead of provoking ``429`` storms that also hit live checkout traffic.
+
+- Requests have a :class:`Priority`. Batch requests only spend tokens
+  above a reserve kept for interactive ones, so interactive calls go
+  first when the bucket runs low. Batch operations set it with
+  :func:`request_priority`.
+- The limiter adapts to the gateway's answers: ``Retry-After`` and
+  ``RateLimit-Remaining``/``RateLimit-Reset`` headers (also with the
+  ``X-`` prefix) pause or drain the bucket for every caller.
+
+Without a configured rate the limiter only honours those headers.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Generator
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+
+import httpx
+
+from .deadline import DeadlineExceededError
+from .deadline import current_deadline
+
+
+DEFAULT_INTERACTIVE_RESERVE = 0.2
+DEFAULT_MAX_PAUSE = 120.0
+THROTTLED_STATUSES = frozenset({429, 503})
+# Reset values above this are Unix timestamps rather than delays.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class Priority(IntEnum):
+    """Request priority; lower values are served first."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "priority", default=Priority.INTERACTIVE
+)
+
+
+def current_priority() -> Priority:
+    """Return the priority of requests sent from the current context."""
+    return _priority.get()
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Generator[None]:
+    """Send the requests of the enclosed block with ``priority``."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class RateLimiter:
+    """Token bucket for one gateway endpoint.
+
+    Tokens refill at ``rate`` per second up to ``burst`` (``rate`` by
+    default). A fraction ``interactive_reserve`` of the bucket can only
+    be spent by :attr:`Priority.INTERACTIVE` requests; a bucket too small
+    to hold a reserve on top of one token serves both priorities alike.
+    With ``rate=None`` requests are only delayed by the gateway's
+    rate-limit headers. Pauses they ask for are capped at ``max_pause``
+    seconds.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: float | None = None,
+        *,
+        interactive_reserve: float = DEFAULT_INTERACTIVE_RESERVE,
+        max_pause: float = DEFAULT_MAX_PAUSE,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst or max(1.0, rate or 0)
+        self.reserve = interactive_reserve * self.burst
+        self.max_pause = max_pause
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    def try_acquire(self, priority: Priority = Priority.INTERACTIVE) -> float:
+        """Take a token if one is available.
+
+        Returns ``0`` when the request may be sent, otherwise the seconds
+        to wait before trying again.
+        """
+        with self._lock:
+            now = self._clock()
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self.rate is None:
+                return 0.0
+            self._refill(now)
+            needed = 1.0
+            if priority > Priority.INTERACTIVE:
+                # Never need more than the bucket holds, or batch
+                # requests would wait forever.
+                needed = min(needed + self.reserve, self.burst)
+            if self._tokens >= needed:
+                self._tokens -= 1
+                return 0.0
+            return (needed - self._tokens) / self.rate
+
+    async def acquire(self, priority: Priority | None = None) -> None:
+        """Wait until a request with ``priority`` may be sent.
+
+        ``priority`` defaults to :func:`current_priority`. Raises
+        :class:`~{{ cookiecutter.package_name }}.deadline.DeadlineExceededError`
+        at once if the wait would outlast the current deadline.
+        """
+        priority = current_priority() if priority is None else priority
+        while delay := self.try_acquire(priority):
+            _check_deadline(delay)
+            await self._sleep(delay)
+
+    def acquire_sync(self, priority: Priority | None = None) -> None:
+        """Blocking variant of :meth:`acquire`."""
+        priority = current_priority() if priority is None else priority
+        while delay := self.try_acquire(priority):
+            _check_deadline(delay)
+            time.sleep(delay)
+
+    def observe(self, response: httpx.Response) -> None:
+        """Adapt to the rate-limit headers of ``response``."""
+        headers = response.headers
+        delay = None
+        if response.status_code in THROTTLED_STATUSES:
+            delay = parse_retry_after(headers.get("Retry-After"))
+        remaining = _header_float(headers, "RateLimit-Remaining")
+        reset = _reset_delay(_header_float(headers, "RateLimit-Reset"))
+        if remaining is not None and remaining < 1 and delay is None:
+            delay = reset
+        with self._lock:
+            now = self._clock()
+            if remaining is not None:
+                self._refill(now)
+                self._tokens = min(self._tokens, max(remaining, 0.0))
+            if response.status_code == 429:
+                self._tokens = 0.0
+                self._updated = now
+            if delay:
+                delay = min(delay, self.max_pause)
+                self._paused_until = max(self._paused_until, now + delay)
+
+    def _refill(self, now: float) -> None:
+        if self.rate is not None and now > self._updated:
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+        self._updated = max(self._updated, now)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds of a ``Retry-After`` header value.
+
+    Both forms are accepted: delay-seconds and an HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+_limiters: dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(
+    api_url: str,
+    rate: float | None = None,
+    burst: float | None = None,
+    interactive_reserve: float = DEFAULT_INTERACTIVE_RESERVE,
+    max_pause: float = DEFAULT_MAX_PAUSE,
+) -> RateLimiter:
+    """Return the process-wide rate limiter for ``api_url``.
+
+    The limits only apply when the limiter is first created.
+    """
+    limiter = _limiters.get(api_url)
+    if limiter is None:
+        limiter = _limiters[api_url] = RateLimiter(
+            rate,
+            burst,
+            interactive_reserve=interactive_reserve,
+            max_pause=max_pause,
+        )
+    return limiter
+
+
+def _check_deadline(delay: float) -> None:
+    deadline = current_deadline()
+    if deadline is not None and deadline.remaining() < delay:
+        raise DeadlineExceededError("Rate limit wait exceeds the deadline")
+
+
+def _header_float(headers: httpx.Headers, name: str) -> float | None:
+    value = headers.get(name) or headers.get(f"X-{name}")
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _reset_delay(reset: float | None) -> float | None:
+    if reset is None or reset < _EPOCH_THRESHOLD:
+        return reset
+    return max(0.0, reset - time.time())
@@ -0,0 +1,353 @@
+"""Retry, hedging and circuit breaking for {{ cookiecutter.gateway_name }} requests.
+
+Every client call goes through a :class:`ResiliencePolicy`:
+
+- idempotent requests are retried with jittered exponential backoff on
+  transport errors and retryable status codes; connection failures are
+  retried for any method because the request never reached the gateway;
+- idempotent requests can be hedged: when a response takes longer than
+  a recent latency percentile, a duplicate request is sent and the first
+  answer wins;
+- a per-``api_url`` circuit breaker fails fast with
+  :class:`CircuitOpenError` while the gateway is unhealthy;
+- every attempt waits for the per-``api_url`` rate limiter (see
+  :mod:`{{ cookiecutter.package_name }}.ratelimit`), which also learns from
+  the gateway's rate-limit headers. Idempotent requests answered ``429``
+  are retried once the limiter lets them through.
+
+:meth:`ResiliencePolicy.execute_sync` applies the same retry and circuit
+breaking decisions to blocking requests; it does not hedge.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import httpx
+from getpaid_core.exceptions import CommunicationError
+
+from .ratelimit import DEFAULT_INTERACTIVE_RESERVE
+from .ratelimit import DEFAULT_MAX_PAUSE
+from .ratelimit import RateLimiter
+from .ratelimit import get_rate_limiter
+
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({502, 503, 504})
+TOO_MANY_REQUESTS = 429
+
+DEFAULT_RETRY_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF_BASE = 0.1
+DEFAULT_RETRY_BACKOFF_MAX = 2.0
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 5
+DEFAULT_CIRCUIT_RESET_TIMEOUT = 30.0
+HEDGE_MIN_SAMPLES = 20
+LATENCY_WINDOW = 200
+
+
+class CircuitOpenError(CommunicationError):
+    """The gateway circuit is open; the request was not sent."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one gateway endpoint.
+
+    After ``failure_threshold`` consecutive failures the circuit opens
+    and requests fail fast. Once ``reset_timeout`` seconds have passed a
+    single trial request is let through (half-open); its outcome closes
+    or re-opens the circuit. A trial that never reports back (e.g. it was
+    cancelled) is abandoned after another ``reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_CIRCUIT_RESET_TIMEOUT,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_started_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        """Return ``"closed"``, ``"open"`` or ``"half-open"``."""
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Return whether a request may be sent now."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "open":
+            return False
+        now = self._clock()
+        if (
+            self._trial_started_at is None
+            or now - self._trial_started_at >= self.reset_timeout
+        ):
+            self._trial_started_at = now
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._trial_started_at = None
+        if self._opened_at is not None or (
+            self._failures >= self.failure_threshold
+        ):
+            self._opened_at = self._clock()
+
+
+class LatencyWindow:
+    """Rolling window of recent request latencies for one endpoint."""
+
+    def __init__(self, size: int = LATENCY_WINDOW) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the latency percentile, or ``None`` without enough data."""
+        if len(self._samples) < HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_latencies: dict[str, LatencyWindow] = {}
+
+
+def get_circuit_breaker(
+    api_url: str,
+    failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout: float = DEFAULT_CIRCUIT_RESET_TIMEOUT,
+) -> CircuitBreaker:
+    """Return the process-wide circuit breaker for ``api_url``.
+
+    The thresholds only apply when the breaker is first created.
+    """
+    breaker = _breakers.get(api_url)
+    if breaker is None:
+        breaker = _breakers[api_url] = CircuitBreaker(
+            failure_threshold, reset_timeout
+        )
+    return breaker
+
+
+def get_latency_window(api_url: str) -> LatencyWindow:
+    """Return the process-wide latency window for ``api_url``."""
+    return _latencies.setdefault(api_url, LatencyWindow())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry settings; ``max_attempts`` includes the first attempt."""
+
+    max_attempts: int = DEFAULT_RETRY_MAX_ATTEMPTS
+    backoff_base: float = DEFAULT_RETRY_BACKOFF_BASE
+    backoff_max: float = DEFAULT_RETRY_BACKOFF_MAX
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+
+    def backoff(self, attempt: int) -> float:
+        """Return a full-jitter delay before retry number ``attempt``."""
+        ceiling = min(self.backoff_max, self.backoff_base * 2**attempt)
+        return random.uniform(0, ceiling)
+
+
+type Send = Callable[[], Awaitable[httpx.Response]]
+type SyncSend = Callable[[], httpx.Response]
+
+
+class ResiliencePolicy:
+    """Retry, hedging, circuit breaking and rate limiting of a request."""
+
+    def __init__(
+        self,
+        *,
+        retry: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        latencies: LatencyWindow | None = None,
+        limiter: RateLimiter | None = None,
+        hedge_percentile: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.latencies = latencies or LatencyWindow()
+        self.limiter = limiter or RateLimiter()
+        self.hedge_percentile = hedge_percentile
+        self._clock = clock
+
+    @classmethod
+    def for_endpoint(
+        cls,
+        api_url: str,
+        *,
+        retry: RetryPolicy | None = None,
+        failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_CIRCUIT_RESET_TIMEOUT,
+        hedge_percentile: float | None = None,
+        rate_limit: float | None = None,
+        rate_limit_burst: float | None = None,
+        interactive_reserve: float = DEFAULT_INTERACTIVE_RESERVE,
+        rate_limit_max_pause: float = DEFAULT_MAX_PAUSE,
+    ) -> "ResiliencePolicy":
+        """Build a policy sharing ``api_url``'s per-endpoint state."""
+        return cls(
+            retry=retry,
+            breaker=get_circuit_breaker(
+                api_url, failure_threshold, reset_timeout
+            ),
+            latencies=get_latency_window(api_url),
+            limiter=get_rate_limiter(
+                api_url,
+                rate_limit,
+                rate_limit_burst,
+                interactive_reserve,
+                rate_limit_max_pause,
+            ),
+            hedge_percentile=hedge_percentile,
+        )
+
+    async def execute(self, send: Send, *, idempotent: bool) -> httpx.Response:
+        """Send a request, retrying and hedging as the policy allows.
+
+        A response with a retryable status is returned once attempts are
+        exhausted; the caller decides whether to raise for it.
+        """
+        attempts = self.retry.max_attempts if idempotent else 1
+        attempt = 0
+        while True:
+            self._check_circuit()
+            try:
+                if idempotent:
+                    response = await self._send_hedged(send)
+                else:
+                    response = await self._send(send)
+            except httpx.TransportError as exc:
+                if not self._retry_error(exc, attempt, attempts):
+                    raise
+            else:
+                if self._accept(response, attempt, attempts):
+                    return response
+                await response.aclose()
+            attempt += 1
+            await asyncio.sleep(self._retry_delay(attempt))
+
+    def execute_sync(
+        self, send: SyncSend, *, idempotent: bool
+    ) -> httpx.Response:
+        """Blocking variant of :meth:`execute`, without hedging."""
+        attempts = self.retry.max_attempts if idempotent else 1
+        attempt = 0
+        while True:
+            self._check_circuit()
+            self.limiter.acquire_sync()
+            try:
+                started = self._clock()
+                response = send()
+                self.latencies.record(self._clock() - started)
+                self.limiter.observe(response)
+            except httpx.TransportError as exc:
+                if not self._retry_error(exc, attempt, attempts):
+                    raise
+            else:
+                if self._accept(response, attempt, attempts):
+                    return response
+                response.close()
+            attempt += 1
+            time.sleep(self._retry_delay(attempt))
+
+    def _check_circuit(self) -> None:
+        if not self.breaker.allow():
+            raise CircuitOpenError("Gateway circuit is open")
+
+    def _retry_error(
+        self, exc: httpx.TransportError, attempt: int, attempts: int
+    ) -> bool:
+        """Record a failed attempt; return whether to try again."""
+        self.breaker.record_failure()
+        if isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout)):
+            # The request never reached the gateway: safe to retry.
+            attempts = self.retry.max_attempts
+        return attempt + 1 < attempts
+
+    def _accept(
+        self, response: httpx.Response, attempt: int, attempts: int
+    ) -> bool:
+        """Record a response; return whether to hand it to the caller."""
+        if response.status_code == TOO_MANY_REQUESTS:
+            # Throttled, not unhealthy: the limiter delays the next attempt.
+            return attempt + 1 >= attempts
+        if response.status_code not in self.retry.retry_statuses:
+            self.breaker.record_success()
+            return True
+        self.breaker.record_failure()
+        return attempt + 1 >= attempts
+
+    def _retry_delay(self, attempt: int) -> float:
+        delay = self.retry.backoff(attempt)
+        logger.debug("Retrying request in %.3fs", delay)
+        return delay
+
+    async def _send(self, send: Send) -> httpx.Response:
+        await self.limiter.acquire()
+        started = self._clock()
+        response = await send()
+        self.latencies.record(self._clock() - started)
+        self.limiter.observe(response)
+        return response
+
+    async def _send_hedged(self, send: Send) -> httpx.Response:
+        if self.hedge_percentile is None:
+            return await self._send(send)
+        delay = self.latencies.percentile(self.hedge_percentile)
+        if delay is None:
+            return await self._send(send)
+        first = asyncio.ensure_future(self._send(send))
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done:
+            return first.result()
+        logger.debug("Hedging request after %.3fs", delay)
+        pending = {first, asyncio.ensure_future(self._send(send))}
+        try:
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                responses = [
+                    task.result() for task in done if task.exception() is None
+                ]
+                if responses:
+                    # Both attempts may finish in the same round.
+                    for response in responses[1:]:
+                        await response.aclose()
+                    return responses[0]
+                if not pending:
+                    return done.pop().result()
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,155 @@
+"""Bounded log of recent {{ cookiecutter.gateway_name }} responses.
+
+Keeping whole ``httpx.Response`` objects alive pins their bodies for as
+long as the client lives. :class:`ResponseLog` keeps a fixed number of
+compact :class:`ResponseSummary` records instead; bodies are retained
+only when ``keep_bodies`` is enabled for debugging.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import suppress
+
+import httpx
+
+
+DEFAULT_RESPONSE_LOG_SIZE = 20
+DEFAULT_LOGGED_HEADERS = (
+    "content-type",
+    "content-length",
+    "retry-after",
+    "x-request-id",
+)
+
+
+class ResponseSummary:
+    """Compact record of one response.
+
+    ``elapsed`` is ``None`` when the response was logged before its body
+    was closed; ``body`` is only set in debug mode.
+    """
+
+    __slots__ = (
+        "body",
+        "elapsed",
+        "headers",
+        "method",
+        "size",
+        "status_code",
+        "url",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        status_code: int,
+        elapsed: float | None,
+        size: int,
+        headers: dict[str, str],
+        body: bytes | None = None,
+    ) -> None:
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.elapsed = elapsed
+        self.size = size
+        self.headers = headers
+        self.body = body
+
+    def __repr__(self) -> str:
+        return (
+            f"<ResponseSummary {self.method} {self.url} "
+            f"[{self.status_code}] {self.size}B>"
+        )
+
+    @classmethod
+    def from_response(
+        cls,
+        response: httpx.Response,
+        *,
+        headers: Iterable[str] = DEFAULT_LOGGED_HEADERS,
+        keep_body: bool = False,
+    ) -> "ResponseSummary":
+        """Summarize ``response`` without keeping a reference to it."""
+        body = None
+        if keep_body:
+            # Streamed responses were consumed without being stored.
+            with suppress(httpx.ResponseNotRead):
+                body = response.content
+        try:
+            elapsed = response.elapsed.total_seconds()
+        except RuntimeError:
+            elapsed = None
+        return cls(
+            method=response.request.method,
+            url=str(response.request.url),
+            status_code=response.status_code,
+            elapsed=elapsed,
+            size=response.num_bytes_downloaded,
+            headers={
+                name: response.headers[name]
+                for name in headers
+                if name in response.headers
+            },
+            body=body,
+        )
+
+
+class ResponseLog:
+    """Ring buffer of the most recent response summaries."""
+
+    def __init__(
+        self,
+        maxlen: int = DEFAULT_RESPONSE_LOG_SIZE,
+        *,
+        headers: Iterable[str] = DEFAULT_LOGGED_HEADERS,
+        keep_bodies: bool = False,
+    ) -> None:
+        self._entries: deque[ResponseSummary] = deque(maxlen=maxlen)
+        self.headers = tuple(name.lower() for name in headers)
+        self.keep_bodies = keep_bodies
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[ResponseSummary]:
+        """Iterate from the oldest to the most recent summary."""
+        return iter(self._entries)
+
+    @property
+    def last(self) -> ResponseSummary | None:
+        """Return the most recent summary, if any."""
+        return self._entries[-1] if self._entries else None
+
+    def record(self, response: httpx.Response) -> ResponseSummary:
+        """Summarize ``response`` and append it to the log."""
+        summary = ResponseSummary.from_response(
+            response, headers=self.headers, keep_body=self.keep_bodies
+        )
+        self._entries.append(summary)
+        return summary
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_logs: dict[tuple[str, int, bool], ResponseLog] = {}
+
+
+def get_response_log(
+    api_url: str,
+    maxlen: int = DEFAULT_RESPONSE_LOG_SIZE,
+    keep_bodies: bool = False,
+) -> ResponseLog:
+    """Return the process-wide response log for one configuration.
+
+    Clients are created per operation; sharing the log keeps their
+    responses readable after the client is gone.
+    """
+    key = (api_url, maxlen, keep_bodies)
+    log = _logs.get(key)
+    if log is None:
+        log = _logs[key] = ResponseLog(maxlen, keep_bodies=keep_bodies)
+    return log
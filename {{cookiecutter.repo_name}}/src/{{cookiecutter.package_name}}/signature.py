@@ -0,0 +1,106 @@
+"""Callback signature verification over raw request bytes.
+
+Verifying the exact bytes the gateway signed avoids re-serializing the
+decoded callback payload, which is slow and breaks on any difference in
+key order or whitespace.
+"""
+
+import base64
+import binascii
+import hmac
+from collections.abc import AsyncIterable
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Literal
+
+
+type Body = bytes | bytearray | memoryview
+type SignatureEncoding = Literal["hex", "base64"]
+
+
+class HmacVerifier:
+    """Constant-time HMAC verifier with a precomputed key schedule.
+
+    The keyed HMAC state is built once; every verification works on a
+    cheap ``.copy()`` of it. Bodies may be passed whole (``bytes`` or a
+    zero-copy ``memoryview``) or as an iterable of chunks.
+    """
+
+    def __init__(
+        self,
+        key: bytes | str,
+        *,
+        digestmod: str = "sha256",
+        encoding: SignatureEncoding = "hex",
+    ) -> None:
+        if isinstance(key, str):
+            key = key.encode()
+        self._key = key
+        self._template = hmac.new(key, digestmod=digestmod)
+        self.digestmod = digestmod
+        self.encoding = encoding
+
+    def __reduce__(self) -> tuple[object, ...]:
+        # HMAC objects cannot be pickled; rebuild from the configuration,
+        # e.g. in a verification process pool.
+        return (
+            get_hmac_verifier,
+            (self._key, self.digestmod, self.encoding),
+        )
+
+    def new(self) -> hmac.HMAC:
+        """Return a fresh HMAC object for incremental updates."""
+        return self._template.copy()
+
+    def digest(self, body: Body | Iterable[Body]) -> bytes:
+        """Return the raw HMAC digest of ``body``."""
+        mac = self.new()
+        if isinstance(body, bytes | bytearray | memoryview):
+            mac.update(body)
+        else:
+            for chunk in body:
+                mac.update(chunk)
+        return mac.digest()
+
+    async def adigest(self, chunks: AsyncIterable[Body]) -> bytes:
+        """Return the raw HMAC digest of a streamed body."""
+        mac = self.new()
+        async for chunk in chunks:
+            mac.update(chunk)
+        return mac.digest()
+
+    def verify(
+        self, body: Body | Iterable[Body], signature: str | bytes
+    ) -> bool:
+        """Return whether ``signature`` matches ``body``."""
+        return self._matches(self.digest(body), signature)
+
+    async def averify(
+        self, chunks: AsyncIterable[Body], signature: str | bytes
+    ) -> bool:
+        """Return whether ``signature`` matches a streamed body."""
+        return self._matches(await self.adigest(chunks), signature)
+
+    def _matches(self, digest: bytes, signature: str | bytes) -> bool:
+        try:
+            if self.encoding == "hex":
+                expected = bytes.fromhex(
+                    signature.decode()
+                    if isinstance(signature, bytes)
+                    else signature
+                )
+            else:
+                expected = base64.b64decode(signature, validate=True)
+        except (ValueError, binascii.Error):
+            return False
+        return hmac.compare_digest(digest, expected)
+
+
+@lru_cache(maxsize=32)
+def get_hmac_verifier(
+    key: bytes | str,
+    digestmod: str = "sha256",
+    encoding: SignatureEncoding = "hex",
+) -> HmacVerifier:
+    """Return a shared verifier for one key/algorithm configuration."""
+    return HmacVerifier(key, digestmod=digestmod, encoding=encoding)
@@ -0,0 +1,135 @@
+"""Incremental decoding of large JSON and NDJSON responses.
+
+Transaction lists and settlement reports can be hundreds of megabytes.
+Decoding them record by record from a streamed ``httpx.Response`` keeps
+memory proportional to the largest single record instead of the whole
+body.
+"""
+
+import codecs
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+from typing import Literal
+
+import httpx
+
+from .codec import loads
+
+
+type StreamFormat = Literal["json", "ndjson"]
+
+NDJSON_CONTENT_TYPES = (
+    "application/x-ndjson",
+    "application/ndjson",
+    "application/jsonl",
+    "application/json-seq",
+)
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class JsonArrayDecoder:
+    """Incrementally decode the elements of a top-level JSON array.
+
+    Feed text as it arrives; each call returns the elements completed so
+    far. Only the unparsed tail of the input is buffered.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._state: Literal["start", "value", "separator", "done"] = "start"
+
+    def feed(self, text: str) -> list[Any]:
+        """Consume ``text`` and return the newly completed elements."""
+        buffer = self._buffer + text
+        records: list[Any] = []
+        pos = 0
+        end = len(buffer)
+        while True:
+            while pos < end and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos == end or self._state == "done":
+                break
+            char = buffer[pos]
+            if self._state == "start":
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                self._state = "value"
+                pos += 1
+            elif self._state == "separator" or char == "]":
+                if char == "]":
+                    self._state = "done"
+                elif char != ",":
+                    raise ValueError(f"Unexpected {char!r} in JSON array")
+                else:
+                    self._state = "value"
+                pos += 1
+            else:
+                try:
+                    record, value_end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    break
+                # A value touching the end of the buffer may be truncated
+                # (e.g. the number ``12`` of ``123``); wait for more input.
+                if value_end == end:
+                    break
+                records.append(record)
+                self._state = "separator"
+                pos = value_end
+        self._buffer = buffer[pos:]
+        return records
+
+    def close(self) -> None:
+        """Check that the array was complete."""
+        if self._state != "done" or self._buffer.strip():
+            raise ValueError("Truncated or trailing data in JSON array")
+
+
+async def iter_json_array(
+    response: httpx.Response,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[Any]:
+    """Yield the elements of a streamed top-level JSON array."""
+    text_decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")()
+    array_decoder = JsonArrayDecoder()
+    async for chunk in response.aiter_bytes(chunk_size):
+        for record in array_decoder.feed(text_decoder.decode(chunk)):
+            yield record
+    for record in array_decoder.feed(text_decoder.decode(b"", final=True)):
+        yield record
+    array_decoder.close()
+
+
+async def iter_ndjson(response: httpx.Response) -> AsyncIterator[Any]:
+    """Yield one decoded record per non-empty line of a streamed body."""
+    async for line in response.aiter_lines():
+        line = line.strip().lstrip("\x1e")
+        if line:
+            yield loads(line)
+
+
+async def iter_records(
+    response: httpx.Response,
+    *,
+    stream_format: StreamFormat | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[Any]:
+    """Yield records from a streamed JSON array or NDJSON response.
+
+    The format is detected from the ``Content-Type`` header unless given
+    explicitly.
+    """
+    if stream_format is None:
+        content_type = response.headers.get("Content-Type", "")
+        is_ndjson = content_type.startswith(NDJSON_CONTENT_TYPES)
+        stream_format = "ndjson" if is_ndjson else "json"
+    if stream_format == "ndjson":
+        async for record in iter_ndjson(response):
+            yield record
+    else:
+        async for record in iter_json_array(response, chunk_size=chunk_size):
+            yield record
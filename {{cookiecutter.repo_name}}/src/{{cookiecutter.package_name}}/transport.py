@@ -0,0 +1,216 @@
+"""Shared, pooled HTTP transport for the {{ cookiecutter.gateway_name }} client.
+
+Opening a new ``httpx.AsyncClient`` per operation pays DNS, TCP and TLS
+setup on every call. The pool hands out one long-lived client per
+``(api_url, settings)`` pair and event loop, so keep-alive connections
+are reused across processor instances.
+
+Call :func:`aclose_pooled_clients` on application shutdown (e.g. from an
+ASGI lifespan handler) to close pooled connections cleanly.
+
+Sync clients (for WSGI deployments) share one thread-safe
+``httpx.Client`` per ``(api_url, settings)`` pair from
+:data:`default_sync_pool`; close them with :func:`close_pooled_clients`.
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+import weakref
+from dataclasses import dataclass
+
+import httpx
+
+from .metrics import default_metrics
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_TIMEOUT = 10.0
+
+
+@dataclass(frozen=True)
+class TransportSettings:
+    """Connection pool configuration for a pooled client."""
+
+    max_connections: int | None = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY
+    timeout: float | None = DEFAULT_TIMEOUT
+    http2: bool = False
+    instrumented: bool = True
+    # Replace the network transport, e.g. with ``httpx.ASGITransport``
+    # for the in-process mock gateway; ``sync_transport`` for sync clients.
+    transport: httpx.AsyncBaseTransport | None = None
+    sync_transport: httpx.BaseTransport | None = None
+
+    def limits(self) -> httpx.Limits:
+        """Return the ``httpx.Limits`` described by these settings."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def build_client(self) -> httpx.AsyncClient:
+        """Create a new ``httpx.AsyncClient`` using these settings.
+
+        HTTP/2 requires the optional ``h2`` dependency
+        (``pip install httpx[http2]``). Instrumented clients record
+        request timings in
+        :data:`{{ cookiecutter.package_name }}.metrics.default_metrics`.
+        """
+        return httpx.AsyncClient(
+            limits=self.limits(),
+            timeout=self.timeout,
+            http2=self.http2,
+            transport=self.transport,
+            event_hooks=(
+                default_metrics.event_hooks() if self.instrumented else None
+            ),
+        )
+
+    def build_sync_client(self) -> httpx.Client:
+        """Create a new sync ``httpx.Client`` using these settings."""
+        return httpx.Client(
+            limits=self.limits(),
+            timeout=self.timeout,
+            http2=self.http2,
+            transport=self.sync_transport,
+            event_hooks=(
+                default_metrics.sync_event_hooks()
+                if self.instrumented
+                else None
+            ),
+        )
+
+
+_PoolKey = tuple[str, TransportSettings]
+
+
+class TransportPool:
+    """Registry of pooled ``httpx.AsyncClient`` instances.
+
+    Clients are keyed by ``(api_url, settings)`` and by the running
+    event loop, because connections cannot be shared between loops.
+    Entries for a loop disappear when that loop is garbage collected.
+    """
+
+    def __init__(self) -> None:
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            dict[_PoolKey, httpx.AsyncClient],
+        ] = weakref.WeakKeyDictionary()
+
+    def get(
+        self,
+        api_url: str,
+        settings: TransportSettings | None = None,
+    ) -> httpx.AsyncClient:
+        """Return the pooled client for ``api_url``, creating it if needed.
+
+        Must be called from within a running event loop.
+        """
+        key = (api_url.rstrip("/"), settings or TransportSettings())
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            client = key[1].build_client()
+            clients[key] = client
+            logger.debug("Opened pooled HTTP client for %s", key[0])
+        return client
+
+    async def aclose(self) -> None:
+        """Close every pooled client owned by the running event loop."""
+        loop = asyncio.get_running_loop()
+        clients = self._clients.pop(loop, {})
+        for (api_url, _settings), client in clients.items():
+            if not client.is_closed:
+                await client.aclose()
+                logger.debug("Closed pooled HTTP client for %s", api_url)
+
+    def open_clients(self) -> int:
+        """Return the number of pooled clients that are still open."""
+        return sum(
+            not client.is_closed
+            for clients in list(self._clients.values())
+            for client in clients.values()
+        )
+
+
+class SyncTransportPool:
+    """Registry of pooled sync ``httpx.Client`` instances.
+
+    ``httpx.Client`` is thread-safe, so one client per
+    ``(api_url, settings)`` is shared by every thread of the process.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[_PoolKey, httpx.Client] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        api_url: str,
+        settings: TransportSettings | None = None,
+    ) -> httpx.Client:
+        """Return the pooled client for ``api_url``, creating it if needed."""
+        key = (api_url.rstrip("/"), settings or TransportSettings())
+        client = self._clients.get(key)
+        if client is not None and not client.is_closed:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                client = key[1].build_sync_client()
+                self._clients[key] = client
+                logger.debug("Opened pooled sync HTTP client for %s", key[0])
+        return client
+
+    def close(self) -> None:
+        """Close every pooled client."""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for (api_url, _settings), client in clients.items():
+            if not client.is_closed:
+                client.close()
+                logger.debug("Closed pooled sync HTTP client for %s", api_url)
+
+    def open_clients(self) -> int:
+        """Return the number of pooled clients that are still open."""
+        return sum(
+            not client.is_closed for client in list(self._clients.values())
+        )
+
+
+default_pool = TransportPool()
+default_sync_pool = SyncTransportPool()
+
+
+async def aclose_pooled_clients() -> None:
+    """Close the default pool's clients for the running event loop."""
+    await default_pool.aclose()
+
+
+def close_pooled_clients() -> None:
+    """Close the default sync pool's clients."""
+    default_sync_pool.close()
+
+
+def _warn_unclosed() -> None:
+    count = default_pool.open_clients()
+    if count:
+        logger.warning(
+            "%d pooled HTTP client(s) were not closed before exit; "
+            "call aclose_pooled_clients() on shutdown.",
+            count,
+        )
+    # Sync clients can be closed without an event loop.
+    close_pooled_clients()
+
+
+atexit.register(_warn_unclosed)
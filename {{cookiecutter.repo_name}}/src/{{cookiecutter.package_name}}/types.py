@@ -1,6 +1,22 @@
-"""{{ cookiecutter.gateway_name }} type definitions."""
+"""{{ cookiecutter.gateway_name }} type definitions.
+{%- if cookiecutter.json_backend == "msgspec" %}
+
+Gateway payloads are ``msgspec.Struct`` types deriving from
+:class:`Struct`. ``Notification.decode(response.content)`` validates the
+body while parsing it, straight into typed attributes: no intermediate
+dicts, no ``__dict__`` per object, ``AutoName`` enums converted on the way
+in and missing or mistyped fields reported as ``ValueError``. Structs need
+msgspec, installed with the ``json`` extra.
+"""
 
 from enum import StrEnum
+from enum import auto
+from functools import cache
+from typing import Any
+from typing import Self
+from typing import dataclass_transform
+
+import msgspec
 
 
 class AutoName(StrEnum):
@@ -16,26 +32,243 @@ class AutoName(StrEnum):
         return name
 
 
-# TODO: Define gateway-specific enums.
-# Example:
-#
-# class Currency(AutoName):
-#     CZK = auto()
-#     EUR = auto()
-#     PLN = auto()
-#     USD = auto()
-#
-# class TransactionStatus(AutoName):
-#     PENDING = auto()
-#     COMPLETED = auto()
-#     FAILED = auto()
-
-
-# TODO: Define gateway-specific TypedDicts.
-# Example:
-#
-# class PaymentResponse(TypedDict, total=False):
-#     id: str
-#     status: str
-#     amount: int
-#     currency: str
+def renamed(name: str, **kwargs: Any) -> Any:
+    """Declare a field read from the JSON member ``name``.
+
+    Like :func:`msgspec.field`, the field is required unless a
+    ``default`` or ``default_factory`` is passed.
+    """
+    return msgspec.field(name=name, **kwargs)
+
+
+def struct[T](cls: type[T]) -> type[T]:
+    """Declare a :class:`Struct` subclass.
+
+    msgspec structs need no decorator; it is kept so that payloads are
+    declared the same way whichever JSON backend the project uses.
+    """
+    return cls
+
+
+@dataclass_transform(field_specifiers=(msgspec.field, renamed))
+class Struct(msgspec.Struct):
+    """Base class for gateway payloads decoded from JSON.
+
+    A field is read from the JSON member named by :func:`renamed`, or by
+    the field name. Fields are type-checked, enum and nested ``Struct``
+    fields converted, and unknown members ignored.
+    """
+
+    @classmethod
+    def decode(cls, body: bytes | bytearray | str) -> Self:
+        """Decode a JSON object from a response or callback body."""
+        try:
+            return _decoder(cls).decode(body)
+        except msgspec.DecodeError as exc:
+            raise ValueError(f"Invalid {cls.__name__} payload: {exc}") from exc
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Build an instance from an already decoded JSON object."""
+        try:
+            return msgspec.convert(data, type=cls)
+        except msgspec.ValidationError as exc:
+            raise ValueError(f"Invalid {cls.__name__} payload: {exc}") from exc
+
+
+@cache
+def _decoder[S: Struct](cls: type[S]) -> msgspec.json.Decoder[S]:
+    return msgspec.json.Decoder(cls)
+{%- else %}
+
+Gateway payloads are slotted dataclasses deriving from :class:`Struct`,
+declared with :func:`struct`.
+``Notification.decode(response.content)`` parses the body once and keeps
+only typed attributes: no ``__dict__`` per object, ``AutoName`` enums
+converted on the way in, ``str``, ``int``, ``float`` and ``bool`` values
+type-checked and missing fields reported as ``ValueError``.
+"""
+
+from collections.abc import Callable
+from dataclasses import Field
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import fields
+from enum import Enum
+from enum import StrEnum
+from enum import auto
+from functools import cache
+from types import NoneType
+from types import UnionType
+from typing import Any
+from typing import ClassVar
+from typing import Self
+from typing import dataclass_transform
+from typing import get_args
+from typing import get_origin
+from typing import get_type_hints
+
+from .codec import loads
+
+
+type Converter = Callable[[Any], Any]
+
+# Scalar annotations and the JSON values accepted for them.
+_SCALARS: dict[type, tuple[type, ...]] = {
+    str: (str,),
+    int: (int,),
+    float: (int, float),
+    bool: (bool,),
+}
+
+
+class AutoName(StrEnum):
+    """StrEnum that uses the member name as its value."""
+
+    @staticmethod
+    def _generate_next_value_(
+        name: str,
+        start: int,
+        count: int,
+        last_values: list[str],
+    ) -> str:
+        return name
+
+
+def renamed(name: str, **kwargs: Any) -> Any:
+    """Declare a field read from the JSON member ``name``.
+
+    Like :func:`dataclasses.field`, the field is required unless a
+    ``default`` or ``default_factory`` is passed.
+    """
+    return field(metadata={"name": name}, **kwargs)
+
+
+@dataclass_transform(field_specifiers=(field, renamed))
+def struct[T](cls: type[T]) -> type[T]:
+    """Turn a :class:`Struct` subclass into a slotted dataclass.
+
+    Use it instead of ``@dataclass(slots=True)`` so type checkers know
+    that :func:`renamed` fields without a default are required.
+    """
+    return dataclass(slots=True)(cls)
+
+
+class Struct:
+    """Base class for gateway payloads decoded from JSON.
+
+    Subclasses are declared with :func:`struct`. A field is read from
+    the JSON member named by its ``metadata["name"]`` (see
+    :func:`renamed`), or by the field name. Enum and nested ``Struct``
+    fields, optionally ``| None`` or in a ``list``, are converted and
+    scalar fields type-checked; unknown members are ignored.
+    """
+
+    __slots__ = ()
+    __dataclass_fields__: ClassVar[dict[str, Field[Any]]]
+
+    @classmethod
+    def decode(cls, body: bytes | bytearray | str) -> Self:
+        """Decode a JSON object from a response or callback body."""
+        data = loads(body)
+        if not isinstance(data, dict):
+            raise ValueError(f"{cls.__name__} payload must be an object")
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Build an instance from an already decoded JSON object."""
+        values = {}
+        for key, name, convert in _decode_plan(cls):
+            if key in data:
+                value = data[key]
+                if convert is not None and value is not None:
+                    value = convert(value)
+                values[name] = value
+        try:
+            return cls(**values)
+        except TypeError as exc:
+            raise ValueError(f"Invalid {cls.__name__} payload: {exc}") from exc
+
+
+@cache
+def _decode_plan(
+    cls: type[Struct],
+) -> tuple[tuple[str, str, Converter | None], ...]:
+    hints = get_type_hints(cls)
+    return tuple(
+        (
+            item.metadata.get("name", item.name),
+            item.name,
+            _converter(hints[item.name]),
+        )
+        for item in fields(cls)
+    )
+
+
+def _converter(annotation: Any) -> Converter | None:
+    origin = get_origin(annotation)
+    if origin is UnionType:
+        members = [arg for arg in get_args(annotation) if arg is not NoneType]
+        return _converter(members[0]) if len(members) == 1 else None
+    if origin is list:
+        item_converter = _converter(get_args(annotation)[0])
+        if item_converter is None:
+            return None
+        convert: Converter = item_converter
+        return lambda items: [convert(item) for item in items]
+    if annotation in _SCALARS:
+        return _scalar_checker(annotation)
+    if isinstance(annotation, type):
+        if issubclass(annotation, Enum):
+            return annotation
+        if issubclass(annotation, Struct):
+            return annotation.from_dict
+    return None
+
+
+def _scalar_checker(annotation: type) -> Converter:
+    accepted = _SCALARS[annotation]
+
+    def check(value: Any) -> Any:
+        # bool is an int subclass, but JSON keeps them apart.
+        if not isinstance(value, accepted) or (
+            isinstance(value, bool) and annotation is not bool
+        ):
+            raise ValueError(
+                f"Expected {annotation.__name__}, got {type(value).__name__}"
+            )
+        return value
+
+    return check
+{%- endif %}
+
+
+# TODO: Adjust the enums and structs below to the gateway's payloads.
+
+
+class TransactionStatus(AutoName):
+    PENDING = auto()
+    COMPLETED = auto()
+    FAILED = auto()
+    CANCELED = auto()
+
+
+@struct
+class PaymentResponse(Struct):
+    """Payment registered by ``POST /payments``."""
+
+    id: str
+    redirect_url: str | None = renamed("redirectUrl", default=None)
+    status: TransactionStatus | None = None
+
+
+@struct
+class Notification(Struct):
+    """Payment status callback."""
+
+    notification_id: str = renamed("notificationId")
+    payment_id: str = renamed("paymentId")
+    status: TransactionStatus
+    amount: int | None = None
+    currency: str | None = None
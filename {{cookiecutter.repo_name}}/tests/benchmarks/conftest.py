@@ -0,0 +1,117 @@
+"""Benchmark fixtures for {{ cookiecutter.package_name }}."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+import pytest
+
+from {{ cookiecutter.package_name }}.transport import aclose_pooled_clients
+
+
+SIGNATURE_KEY = "benchmark-signature-key"
+
+
+RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: 2\r\n"
+    b"\r\n"
+    b"{}"
+)
+
+
+async def _handle_connection(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    """Answer every request on a keep-alive connection with ``{}``."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            for line in head.split(b"\r\n"):
+                name, _, value = line.partition(b":")
+                if name.lower() == b"content-length" and int(value):
+                    await reader.readexactly(int(value))
+            writer.write(RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+@pytest.fixture
+def loop():
+    """Provide a private event loop for driving async benchmarks."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def local_gateway(loop: asyncio.AbstractEventLoop):
+    """Serve a minimal HTTP/1.1 gateway on localhost; yield its URL."""
+    server = loop.run_until_complete(
+        asyncio.start_server(_handle_connection, "127.0.0.1", 0)
+    )
+    host, port = server.sockets[0].getsockname()[:2]
+    yield f"http://{host}:{port}"
+    server.close()
+    loop.run_until_complete(server.wait_closed())
+
+
+@pytest.fixture
+def threaded_gateway():
+    """Serve the local gateway from a background thread; yield its URL.
+
+    Unlike ``local_gateway`` it answers while the test blocks, so it can
+    serve sync clients and calls bridged through ``asyncio.run``.
+    """
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(
+        asyncio.start_server(_handle_connection, "127.0.0.1", 0)
+    )
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    host, port = server.sockets[0].getsockname()[:2]
+    yield f"http://{host}:{port}"
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    server.close()
+    loop.run_until_complete(server.wait_closed())
+    loop.close()
+
+
+@pytest.fixture
+def processor_config(processor_config: dict) -> dict:
+    """Extend the default config for benchmarking callbacks.
+
+    Duplicate suppression is disabled so that repeated deliveries of the
+    same callback measure the full handling cost.
+    """
+    return {
+        **processor_config,
+        "signature_key": SIGNATURE_KEY,
+        "callback_dedup": None,
+    }
+
+
+@pytest.fixture
+def run_async(benchmark, loop: asyncio.AbstractEventLoop):
+    """Benchmark an async call on ``loop``.
+
+    The call runs once first; benchmarks of methods that still raise
+    ``NotImplementedError`` are skipped rather than failed.
+    """
+
+    def run(call: Callable[[], Awaitable[object]]) -> object:
+        try:
+            loop.run_until_complete(call())
+        except NotImplementedError:
+            pytest.skip("not implemented yet")
+        return benchmark(lambda: loop.run_until_complete(call()))
+
+    yield run
+    loop.run_until_complete(aclose_pooled_clients())
@@ -0,0 +1,50 @@
+"""Encoding and decoding a payment listing, per body.
+
+Compares the generated codec (``BACKEND`` is recorded in the extra
+info) with the standard library ``json`` module.
+"""
+
+import json
+
+import pytest
+
+from {{ cookiecutter.package_name }}.codec import BACKEND
+from {{ cookiecutter.package_name }}.codec import dumps
+from {{ cookiecutter.package_name }}.codec import loads
+
+
+LISTING = {
+    "payments": [
+        {
+            "paymentId": f"pay-{index}",
+            "status": "COMPLETED",
+            "amount": 10000 + index,
+            "currency": "PLN",
+            "description": f"Order {index}",
+        }
+        for index in range(1000)
+    ],
+}
+BODY = json.dumps(LISTING).encode()
+
+
+@pytest.mark.benchmark(group="encode")
+def test_codec_dumps(benchmark) -> None:
+    benchmark.extra_info["backend"] = BACKEND
+    assert loads(benchmark(dumps, LISTING)) == LISTING
+
+
+@pytest.mark.benchmark(group="encode")
+def test_stdlib_dumps(benchmark) -> None:
+    assert json.loads(benchmark(json.dumps, LISTING)) == LISTING
+
+
+@pytest.mark.benchmark(group="decode-listing")
+def test_codec_loads(benchmark) -> None:
+    benchmark.extra_info["backend"] = BACKEND
+    assert benchmark(loads, BODY) == LISTING
+
+
+@pytest.mark.benchmark(group="decode-listing")
+def test_stdlib_loads(benchmark) -> None:
+    assert benchmark(json.loads, BODY) == LISTING
@@ -0,0 +1,37 @@
+"""Decimal to minor-unit conversion, per amount.
+
+Compares the generated integer converter with the usual
+``quantize``-per-request approach.
+"""
+
+from decimal import ROUND_HALF_UP
+from decimal import Decimal
+
+import pytest
+
+from {{ cookiecutter.package_name }}.currency import MINOR_UNIT_EXPONENTS
+from {{ cookiecutter.package_name }}.currency import from_minor_units
+from {{ cookiecutter.package_name }}.currency import to_minor_units
+
+
+CURRENCY = next(iter(MINOR_UNIT_EXPONENTS))
+AMOUNT = from_minor_units(123456, CURRENCY)
+
+
+@pytest.mark.benchmark(group="currency")
+def test_to_minor_units(benchmark) -> None:
+    assert benchmark(to_minor_units, AMOUNT, CURRENCY) == 123456
+
+
+@pytest.mark.benchmark(group="currency")
+def test_quantize_per_request(benchmark) -> None:
+    def convert() -> int:
+        scale = Decimal(10) ** MINOR_UNIT_EXPONENTS[CURRENCY]
+        return int((AMOUNT * scale).quantize(Decimal(1), ROUND_HALF_UP))
+
+    assert benchmark(convert) == 123456
+
+
+@pytest.mark.benchmark(group="currency")
+def test_from_minor_units(benchmark) -> None:
+    assert benchmark(from_minor_units, 123456, CURRENCY) == AMOUNT
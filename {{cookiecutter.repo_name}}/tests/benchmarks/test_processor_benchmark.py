@@ -0,0 +1,82 @@
+"""Latency of the processor operations against a mocked gateway.
+
+Run with ``pytest tests/benchmarks --benchmark-enable``. Save a baseline
+with ``--benchmark-save=baseline`` and compare later runs against it with
+``--benchmark-compare``; a compared run fails when any benchmark regresses
+beyond ``benchmark_max_regression`` in ``pyproject.toml``.
+"""
+
+import hashlib
+import hmac
+import json
+from decimal import Decimal
+
+import pytest
+import respx
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.processor_class_name }}
+
+from .conftest import SIGNATURE_KEY
+
+
+CALLBACK = {"orderId": "ext-1", "status": "COMPLETED"}
+CALLBACK_BODY = json.dumps(CALLBACK).encode()
+CALLBACK_SIGNATURE = hmac.new(
+    SIGNATURE_KEY.encode(), CALLBACK_BODY, hashlib.sha256
+).hexdigest()
+
+
+@pytest.fixture
+def gateway():
+    """Mock the sandbox API.
+
+    TODO: adjust the routes and payloads to the endpoints your processor
+    calls, so that benchmarks exercise real request and response handling.
+    """
+    processor_class = {{ cookiecutter.processor_class_name }}
+    with respx.mock(
+        base_url=processor_class.sandbox_url, assert_all_called=False
+    ) as router:
+        router.post("/oauth/token").respond(
+            json={"access_token": "token", "expires_in": 3600}
+        )
+        router.post("/payments").respond(
+            json={"id": "ext-1", "redirectUrl": "https://pay.example.com/1"}
+        )
+        router.post(path__regex=r"/payments/[^/]+/refunds$").respond(
+            json={"id": "refund-1", "status": "PENDING"}
+        )
+        router.get(path__startswith="/payments/").respond(
+            json={"id": "ext-1", "status": "COMPLETED"}
+        )
+        yield router
+
+
+@pytest.mark.benchmark(group="processor")
+def test_prepare_transaction(run_async, processor, gateway) -> None:
+    run_async(processor.prepare_transaction)
+
+
+@pytest.mark.benchmark(group="processor")
+def test_verify_callback(run_async, processor) -> None:
+    headers = {"X-Signature": CALLBACK_SIGNATURE}
+    run_async(
+        lambda: processor.verify_callback(
+            CALLBACK, headers, raw_body=CALLBACK_BODY
+        )
+    )
+
+
+@pytest.mark.benchmark(group="processor")
+def test_handle_callback(run_async, processor) -> None:
+    run_async(lambda: processor.handle_callback(CALLBACK, {}))
+
+
+@pytest.mark.benchmark(group="processor")
+def test_fetch_payment_status(run_async, processor, gateway) -> None:
+    run_async(processor.fetch_payment_status)
+
+
+@pytest.mark.benchmark(group="processor")
+def test_start_refund(run_async, processor, gateway) -> None:
+    run_async(lambda: processor.start_refund(amount=Decimal("10.00")))
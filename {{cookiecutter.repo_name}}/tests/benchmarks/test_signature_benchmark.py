@@ -0,0 +1,39 @@
+"""Callback signature verification throughput at 1 KB and 1 MB.
+
+Compare the ``ops`` column: it is callbacks verified per second.
+"""
+
+import hashlib
+import hmac
+
+import pytest
+
+from {{ cookiecutter.package_name }}.signature import HmacVerifier
+
+
+KEY = b"secret-key"
+SIZES = {"1KB": 1024, "1MB": 1024 * 1024}
+
+
+@pytest.fixture(params=list(SIZES))
+def signed_body(request) -> tuple[bytes, str]:
+    body = b"x" * SIZES[request.param]
+    return body, hmac.new(KEY, body, hashlib.sha256).hexdigest()
+
+
+@pytest.mark.benchmark(group="signature")
+def test_precomputed_key_raw_body(benchmark, signed_body) -> None:
+    body, signature = signed_body
+    verifier = HmacVerifier(KEY)
+    assert benchmark(verifier.verify, memoryview(body), signature)
+
+
+@pytest.mark.benchmark(group="signature")
+def test_fresh_key_per_callback(benchmark, signed_body) -> None:
+    body, signature = signed_body
+
+    def verify() -> bool:
+        digest = hmac.new(KEY, body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(digest, signature)
+
+    assert benchmark(verify)
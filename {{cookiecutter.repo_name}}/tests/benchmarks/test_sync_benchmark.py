@@ -0,0 +1,48 @@
+"""Calls per second from sync code: pooled sync client vs. bridging.
+
+The bridged benchmark runs each call through ``asyncio.run``, as sync
+(WSGI) code calling the async client has to, which costs a new event
+loop and a new connection pool per call. Compare the ``OPS`` column.
+
+Run with ``pytest tests/benchmarks --benchmark-enable``.
+"""
+
+import asyncio
+
+import pytest
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.client_class_name }}
+from {{ cookiecutter.package_name }} import {{ cookiecutter.__sync_client_class_name }}
+from {{ cookiecutter.package_name }}.api import ApiCall
+from {{ cookiecutter.package_name }}.transport import SyncTransportPool
+from {{ cookiecutter.package_name }}.transport import TransportPool
+
+
+STATUS = ApiCall("GET", "/status", lambda response: response.json())
+
+
+@pytest.mark.benchmark(group="sync")
+def test_sync_client(benchmark, threaded_gateway) -> None:
+    pool = SyncTransportPool()
+
+    def call() -> dict:
+        client = {{ cookiecutter.__sync_client_class_name }}(threaded_gateway, pool=pool)
+        return client.call(STATUS)
+
+    try:
+        assert benchmark(call) == {}
+    finally:
+        pool.close()
+
+
+@pytest.mark.benchmark(group="sync")
+def test_async_client_bridged(benchmark, threaded_gateway) -> None:
+    async def call() -> dict:
+        pool = TransportPool()
+        client = {{ cookiecutter.client_class_name }}(threaded_gateway, pool=pool)
+        try:
+            return await client.call(STATUS)
+        finally:
+            await pool.aclose()
+
+    assert benchmark(lambda: asyncio.run(call())) == {}
@@ -0,0 +1,36 @@
+"""Per-call latency with and without the pooled transport.
+
+Run with ``pytest tests/benchmarks --benchmark-enable``.
+"""
+
+import httpx
+import pytest
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.client_class_name }}
+from {{ cookiecutter.package_name }}.transport import TransportPool
+
+
+@pytest.mark.benchmark(group="transport")
+def test_pooled_transport(benchmark, loop, local_gateway) -> None:
+    pool = TransportPool()
+
+    async def call() -> None:
+        async with {{ cookiecutter.client_class_name }}(local_gateway, pool=pool) as client:
+            response = await client.client.get(f"{client.api_url}/status")
+            response.raise_for_status()
+
+    try:
+        benchmark(lambda: loop.run_until_complete(call()))
+    finally:
+        loop.run_until_complete(pool.aclose())
+
+
+@pytest.mark.benchmark(group="transport")
+def test_client_per_call(benchmark, loop, local_gateway) -> None:
+    async def call() -> None:
+        async with httpx.AsyncClient() as http_client:
+            client = {{ cookiecutter.client_class_name }}(local_gateway, client=http_client)
+            response = await client.client.get(f"{client.api_url}/status")
+            response.raise_for_status()
+
+    benchmark(lambda: loop.run_until_complete(call()))
@@ -0,0 +1,69 @@
+"""Decoding 100k callback payloads into dicts and into slotted structs.
+
+Compare the ``mean`` column for decode time; ``retained_bytes`` in the
+extra info (``--benchmark-json``) is the memory held by the decoded
+payloads. It is only measured when benchmarks are enabled.
+"""
+
+import json
+import tracemalloc
+
+import pytest
+
+from {{ cookiecutter.package_name }}.types import Notification
+
+
+PAYLOADS = 100_000
+
+
+@pytest.fixture(scope="module")
+def bodies() -> list[bytes]:
+    return [
+        json.dumps(
+            {
+                "notificationId": f"ntf-{index}",
+                "paymentId": f"pay-{index}",
+                "status": "COMPLETED",
+                "amount": 10000 + index,
+                "currency": "PLN",
+            }
+        ).encode()
+        for index in range(PAYLOADS)
+    ]
+
+
+def _decode_dicts(bodies: list[bytes]) -> list[dict]:
+    return [json.loads(body) for body in bodies]
+
+
+def _decode_structs(bodies: list[bytes]) -> list[Notification]:
+    return [Notification.decode(body) for body in bodies]
+
+
+def _retained_bytes(decode, bodies: list[bytes]) -> int:
+    tracemalloc.start()
+    try:
+        decoded = decode(bodies)
+        retained, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del decoded
+    return retained
+
+
+@pytest.mark.benchmark(group="decode")
+def test_decode_dicts(benchmark, bodies) -> None:
+    if not benchmark.disabled:
+        benchmark.extra_info["retained_bytes"] = _retained_bytes(
+            _decode_dicts, bodies
+        )
+    assert len(benchmark(_decode_dicts, bodies)) == PAYLOADS
+
+
+@pytest.mark.benchmark(group="decode")
+def test_decode_structs(benchmark, bodies) -> None:
+    if not benchmark.disabled:
+        benchmark.extra_info["retained_bytes"] = _retained_bytes(
+            _decode_structs, bodies
+        )
+    assert len(benchmark(_decode_structs, bodies)) == PAYLOADS
@@ -8,6 +8,32 @@ from getpaid_core.enums import PaymentStatus
 
 from {{ cookiecutter.package_name }} import {{ cookiecutter.processor_class_name }}
 
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addini(
+        "benchmark_max_regression",
+        "Regression checks applied to runs using --benchmark-compare.",
+        type="linelist",
+        default=["median:20%"],
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Applied before pytest-benchmark reads its options; an explicit
+    # --benchmark-compare-fail takes precedence.
+    if config.getoption("benchmark_compare", None) and not config.getoption(
+        "benchmark_compare_fail", None
+    ):
+        from pytest_benchmark.utils import parse_compare_fail
+
+        config.option.benchmark_compare_fail = [
+            parse_compare_fail(check)
+            for check in config.getini("benchmark_max_regression")
+        ]
+{%- endif %}
+
 
 class MockOrder:
     """Mock order satisfying the getpaid_core Order protocol."""
@@ -0,0 +1,253 @@
+"""Tests for the access-token cache."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.client_class_name }}
+from {{ cookiecutter.package_name }}.auth import AccessToken
+from {{ cookiecutter.package_name }}.auth import TokenCache
+from {{ cookiecutter.package_name }}.concurrency import SingleFlight
+
+
+API_URL = "https://sandbox.example.com"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TokenIssuer:
+    """Token fetcher counting how often it is called."""
+
+    def __init__(self, clock: FakeClock, lifetime: float = 300) -> None:
+        self.clock = clock
+        self.lifetime = lifetime
+        self.calls = 0
+
+    async def __call__(self) -> AccessToken:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return AccessToken(f"token-{self.calls}", self.clock() + self.lifetime)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> TokenCache:
+    return TokenCache(refresh_margin=60, clock=clock)
+
+
+class TestSingleFlight:
+    """Test call sharing between concurrent callers."""
+
+    async def test_concurrent_calls_share_result(self) -> None:
+        flight: SingleFlight[str, int] = SingleFlight()
+        calls = 0
+
+        async def call() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        waiters = [flight.do("k", call) for _ in range(5)]
+        results = await asyncio.gather(*waiters)
+        assert results == [1] * 5
+        assert not flight.in_flight("k")
+        assert await flight.do("k", call) == 2
+
+    async def test_waiter_cancellation_does_not_cancel_call(self) -> None:
+        flight: SingleFlight[str, str] = SingleFlight()
+
+        async def call() -> str:
+            await asyncio.sleep(0.02)
+            return "done"
+
+        waiter = asyncio.ensure_future(flight.do("k", call))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        assert await flight.do("k", call) == "done"
+
+    def test_calls_not_shared_across_event_loops(self) -> None:
+        flight: SingleFlight[str, int] = SingleFlight()
+        barrier = threading.Barrier(2)
+
+        async def call() -> int:
+            await asyncio.sleep(0.02)
+            return threading.get_ident()
+
+        async def run() -> int:
+            task = asyncio.ensure_future(flight.do("k", call))
+            await asyncio.sleep(0)
+            barrier.wait(1)
+            return await task
+
+        results: list[int] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(asyncio.run(run())))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(1)
+        assert len(set(results)) == 2
+
+
+class TestTokenCache:
+    """Test token caching, refresh and invalidation."""
+
+    async def test_concurrent_callers_fetch_once(self, cache, clock) -> None:
+        issuer = TokenIssuer(clock)
+        tokens = await asyncio.gather(
+            *(cache.get("creds", issuer) for _ in range(10))
+        )
+        assert {token.value for token in tokens} == {"token-1"}
+        assert issuer.calls == 1
+
+    async def test_cached_until_refresh_margin(self, cache, clock) -> None:
+        issuer = TokenIssuer(clock)
+        await cache.get("creds", issuer)
+        clock.now += 200
+        assert (await cache.get("creds", issuer)).value == "token-1"
+        assert issuer.calls == 1
+
+    async def test_proactive_refresh(self, cache, clock) -> None:
+        issuer = TokenIssuer(clock)
+        await cache.get("creds", issuer)
+        clock.now += 250
+        token = await cache.get("creds", issuer)
+        assert token.value == "token-1"
+        await cache.get("creds", issuer)
+        await asyncio.sleep(0.05)
+        assert issuer.calls == 2
+        assert (await cache.get("creds", issuer)).value == "token-2"
+
+    async def test_expired_token_is_refetched(self, cache, clock) -> None:
+        issuer = TokenIssuer(clock)
+        await cache.get("creds", issuer)
+        clock.now += 301
+        assert (await cache.get("creds", issuer)).value == "token-2"
+
+    async def test_short_lived_token_refreshed_halfway(
+        self, cache, clock
+    ) -> None:
+        # A 30 s token is entirely within the 60 s refresh margin.
+        issuer = TokenIssuer(clock, lifetime=30)
+        await cache.get("creds", issuer)
+        clock.now += 10
+        await cache.get("creds", issuer)
+        await asyncio.sleep(0.05)
+        assert issuer.calls == 1
+        clock.now += 6
+        await cache.get("creds", issuer)
+        await asyncio.sleep(0.05)
+        assert issuer.calls == 2
+
+    def test_short_lived_token_cached_sync(self, cache, clock) -> None:
+        calls = 0
+
+        def fetch() -> AccessToken:
+            nonlocal calls
+            calls += 1
+            return AccessToken(f"token-{calls}", clock() + 30)
+
+        assert cache.get_sync("creds", fetch).value == "token-1"
+        clock.now += 10
+        assert cache.get_sync("creds", fetch).value == "token-1"
+        clock.now += 6
+        assert cache.get_sync("creds", fetch).value == "token-2"
+
+    async def test_cached_per_credentials(self, cache, clock) -> None:
+        issuer = TokenIssuer(clock)
+        first = await cache.get("creds-a", issuer)
+        second = await cache.get("creds-b", issuer)
+        assert first != second
+
+    async def test_invalidate_keeps_newer_token(self, cache, clock) -> None:
+        issuer = TokenIssuer(clock)
+        stale = await cache.get("creds", issuer)
+        cache.invalidate("creds", stale)
+        fresh = await cache.get("creds", issuer)
+        cache.invalidate("creds", stale)
+        assert await cache.get("creds", issuer) is fresh
+
+    async def test_fetch_failure_is_not_cached(self, cache, clock) -> None:
+        issuer = TokenIssuer(clock)
+
+        async def failing() -> AccessToken:
+            raise httpx.ConnectError("down")
+
+        with pytest.raises(httpx.ConnectError):
+            await cache.get("creds", failing)
+        assert (await cache.get("creds", issuer)).value == "token-1"
+
+
+class TestClientAuthentication:
+    """Test authenticated client requests."""
+
+    def _client(self, handler, cache) -> {{ cookiecutter.client_class_name }}:
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return {{ cookiecutter.client_class_name }}(
+            API_URL,
+            client_id="id",
+            client_secret="secret",
+            client=http_client,
+            token_cache=cache,
+        )
+
+    async def test_token_fetched_once_and_attached(self, cache) -> None:
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/oauth/token":
+                seen.append("token")
+                return httpx.Response(
+                    200, json={"access_token": "abc", "expires_in": 3600}
+                )
+            seen.append(request.headers["Authorization"])
+            return httpx.Response(200)
+
+        client = self._client(handler, cache)
+        await client.request("GET", "/orders", authenticated=True)
+        await client.request("GET", "/orders", authenticated=True)
+        assert seen == ["token", "Bearer abc", "Bearer abc"]
+
+    async def test_single_retry_on_401(self, cache) -> None:
+        issued = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal issued
+            if request.url.path == "/oauth/token":
+                issued += 1
+                return httpx.Response(200, json={"access_token": f"t{issued}"})
+            if request.headers["Authorization"] == "Bearer t1":
+                return httpx.Response(401)
+            return httpx.Response(200)
+
+        client = self._client(handler, cache)
+        response = await client.request("POST", "/payments", authenticated=True)
+        assert response.status_code == 200
+        assert issued == 2
+
+    async def test_persistent_401_is_returned(self, cache) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/oauth/token":
+                return httpx.Response(200, json={"access_token": "revoked"})
+            return httpx.Response(401)
+
+        client = self._client(handler, cache)
+        response = await client.request("GET", "/orders", authenticated=True)
+        assert response.status_code == 401
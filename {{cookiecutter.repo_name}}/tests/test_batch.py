@@ -0,0 +1,363 @@
+"""Tests for batch status fetching and callback ingestion."""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+
+import pytest
+from getpaid_core.exceptions import InvalidCallbackError
+
+from {{ cookiecutter.package_name }}.concurrency import bounded_as_completed
+from {{ cookiecutter.package_name }}.concurrency import ordered_by_key
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from {{ cookiecutter.package_name }}.dedup import MemoryDedupStore
+{%- endif %}
+from {{ cookiecutter.package_name }}.processor import {{ cookiecutter.processor_class_name }}
+
+from .conftest import MockPayment
+
+
+class DelayedProcessor({{ cookiecutter.processor_class_name }}):
+    """Processor whose status fetch sleeps for ``payment.delay`` seconds."""
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fetch_payment_status(self, **kwargs):
+        cls = type(self)
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            await asyncio.sleep(self.payment.delay)
+            if self.payment.external_id == "broken":
+                raise RuntimeError("gateway error")
+            return self.payment.external_id
+        finally:
+            cls.in_flight -= 1
+
+
+class BulkProcessor({{ cookiecutter.processor_class_name }}):
+    """Processor using a fake bulk-status endpoint."""
+
+    bulk_status_batch_size = 2
+    requests: list[list[str]] = []
+
+    @classmethod
+    async def fetch_bulk_status(cls, payments, config=None):
+        ids = [payment.external_id for payment in payments]
+        cls.requests.append(ids)
+        return {external_id: f"bulk-{external_id}" for external_id in ids}
+
+
+def _payment(external_id: str, delay: float = 0.0) -> MockPayment:
+    payment = MockPayment()
+    payment.external_id = external_id
+    payment.delay = delay
+    return payment
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestBoundedAsCompleted:
+    """Test the bounded fan-out helper."""
+
+    async def test_yields_in_completion_order(self) -> None:
+        async def job(delay: float, value: str) -> str:
+            await asyncio.sleep(delay)
+            return value
+
+        jobs = [
+            lambda: job(0.03, "slow"),
+            lambda: job(0.0, "fast"),
+        ]
+        results = await _collect(bounded_as_completed(jobs, limit=2))
+        assert results == ["fast", "slow"]
+
+    async def test_cancels_pending_jobs_on_early_exit(self) -> None:
+        cancelled = asyncio.Event()
+
+        async def hang() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def quick() -> str:
+            return "done"
+
+        iterator = bounded_as_completed([quick, hang], limit=2)
+        assert await anext(iterator) == "done"
+        await iterator.aclose()
+        assert cancelled.is_set()
+
+    async def test_rejects_invalid_limit(self) -> None:
+        with pytest.raises(ValueError):
+            await _collect(bounded_as_completed([], limit=0))
+
+
+class TestFetchPaymentStatuses:
+    """Test the batch PULL flow."""
+
+    async def test_concurrency_limit(self, processor_config) -> None:
+        DelayedProcessor.max_in_flight = 0
+        payments = [_payment(str(i), delay=0.01) for i in range(20)]
+        results = await _collect(
+            DelayedProcessor.fetch_payment_statuses(
+                payments, processor_config, concurrency=4
+            )
+        )
+        assert len(results) == 20
+        assert DelayedProcessor.max_in_flight == 4
+
+    async def test_concurrency_from_settings(self, processor_config) -> None:
+        DelayedProcessor.max_in_flight = 0
+        processor_config["status_concurrency"] = 3
+        payments = [_payment(str(i), delay=0.01) for i in range(10)]
+        await _collect(
+            DelayedProcessor.fetch_payment_statuses(payments, processor_config)
+        )
+        assert DelayedProcessor.max_in_flight == 3
+
+    async def test_completion_order(self, processor_config) -> None:
+        payments = [_payment("slow", delay=0.05), _payment("fast")]
+        results = await _collect(
+            DelayedProcessor.fetch_payment_statuses(payments, processor_config)
+        )
+        assert [result.update for result in results] == ["fast", "slow"]
+
+    async def test_errors_do_not_abort_batch(self, processor_config) -> None:
+        payments = [_payment("broken"), _payment("ok")]
+        results = await _collect(
+            DelayedProcessor.fetch_payment_statuses(payments, processor_config)
+        )
+        by_id = {result.payment.external_id: result for result in results}
+        assert isinstance(by_id["broken"].error, RuntimeError)
+        assert by_id["ok"].update == "ok"
+        assert by_id["ok"].error is None
+
+    async def test_bulk_endpoint(self, processor_config) -> None:
+        BulkProcessor.requests = []
+        payments = [_payment(external_id) for external_id in "abcde"]
+        results = await _collect(
+            BulkProcessor.fetch_payment_statuses(payments, processor_config)
+        )
+        assert sorted(BulkProcessor.requests) == [["a", "b"], ["c", "d"], ["e"]]
+        assert {result.update for result in results} == {
+            f"bulk-{external_id}" for external_id in "abcde"
+        }
+
+
+SIGNATURE_KEY = "batch-signature-key"
+
+
+class CallbackProcessor({{ cookiecutter.processor_class_name }}):
+    """Processor checking that callbacks arrive in order per payment.
+
+    The update is the callback's ``seq``; the consumer stores it on the
+    payment as ``applied`` before taking the next result.
+    """
+
+    @classmethod
+    def _get_callback_payment_id(cls, data: dict, headers: dict) -> str:
+        return data.get("paymentId", "")
+
+    def _verify_callback(self, data: dict, headers: dict, **kwargs) -> None:
+        self._verify_signature(kwargs["raw_body"], headers["X-Signature"])
+
+    def _handle_callback(self, data: dict, headers: dict, **kwargs):
+        assert self.payment.applied == data["seq"] - 1
+        return data["seq"]
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+
+class DedupCallbackProcessor(CallbackProcessor):
+    """Callback processor with one notification ID per ``seq``."""
+
+    def _get_callback_id(self, data: dict, headers: dict) -> str:
+        return f"{data['paymentId']}-{data['seq']}"
+{%- endif %}
+
+
+def _callback(payment_id: str, seq: int, key: str = SIGNATURE_KEY):
+    body = json.dumps({"paymentId": payment_id, "seq": seq}).encode()
+    signature = hmac.new(key.encode(), body, hashlib.sha256).hexdigest()
+    return body, {"X-Signature": signature}
+
+
+def _backlog(payments: int, per_payment: int) -> list:
+    # Interleaved, as gateways deliver notifications.
+    return [
+        _callback(f"pay-{payment}", seq)
+        for seq in range(1, per_payment + 1)
+        for payment in range(payments)
+    ]
+
+
+class PaymentStore:
+    """Payments looked up by gateway ID, with simulated database latency."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.payments: dict[str, MockPayment] = {}
+
+    async def __call__(self, payment_id: str) -> MockPayment:
+        await asyncio.sleep(self.delay)
+        payment = self.payments.get(payment_id)
+        if payment is None:
+            payment = self.payments[payment_id] = MockPayment()
+            payment.applied = 0
+        return payment
+
+
+class TestOrderedByKey:
+    """Test the per-key ordered fan-out helper."""
+
+    async def test_orders_per_key(self) -> None:
+        async def job(item: tuple[str, float]) -> str:
+            await asyncio.sleep(item[1])
+            return item[0]
+
+        items = [("a", ("a1", 0.02)), ("b", ("b1", 0.0)), ("a", ("a2", 0.0))]
+        results = await _collect(
+            ordered_by_key(items, job, limit=2, max_pending=10)
+        )
+        assert results == ["b1", "a1", "a2"]
+
+    async def test_backpressure(self) -> None:
+        read = 0
+
+        def items():
+            nonlocal read
+            for index in range(50):
+                read += 1
+                yield index % 5, index
+
+        async def job(item: int) -> int:
+            await asyncio.sleep(0)
+            return item
+
+        consumed = 0
+        async for _ in ordered_by_key(items(), job, limit=5, max_pending=8):
+            consumed += 1
+            assert read - consumed < 8
+        assert consumed == 50
+
+    async def test_errors_propagate(self) -> None:
+        async def job(item: int) -> int:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await _collect(
+                ordered_by_key([(1, 1)], job, limit=1, max_pending=1)
+            )
+
+    async def test_rejects_invalid_limits(self) -> None:
+        with pytest.raises(ValueError):
+            await _collect(ordered_by_key([], None, limit=1, max_pending=0))
+
+
+class TestIngestCallbacks:
+    """Test batch callback ingestion."""
+
+    @pytest.fixture
+    def config(self, processor_config) -> dict:
+        return {
+            **processor_config,
+            "signature_key": SIGNATURE_KEY,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+            "callback_dedup": None,
+{%- endif %}
+        }
+
+    async def _ingest(self, callbacks, store, config, **kwargs) -> list:
+        results = []
+        async for result in CallbackProcessor.ingest_callbacks(
+            callbacks, store, config, **kwargs
+        ):
+            if result.error is None:
+                payment = store.payments[result.payment_id]
+                payment.applied = result.update
+            results.append(result)
+        return results
+
+    async def test_in_order_per_payment(self, config) -> None:
+        store = PaymentStore()
+        results = await self._ingest(_backlog(20, 5), store, config)
+        assert len(results) == 100
+        assert not [result.error for result in results if result.error]
+        assert {payment.applied for payment in store.payments.values()} == {5}
+
+    async def test_accepts_async_iterables(self, config) -> None:
+        async def callbacks():
+            for callback in _backlog(3, 3):
+                yield callback
+
+        store = PaymentStore()
+        results = await self._ingest(callbacks(), store, config)
+        assert sorted(result.index for result in results) == list(range(9))
+
+    async def test_failures_are_reported_per_callback(self, config) -> None:
+        callbacks = [
+            _callback("pay-1", 1),
+            _callback("pay-2", 1, key="forged"),
+            (b"not json", {}),
+        ]
+        results = await self._ingest(callbacks, PaymentStore(), config)
+        by_index = {result.index: result for result in results}
+        assert by_index[0].update == 1
+        assert isinstance(by_index[1].error, InvalidCallbackError)
+        assert by_index[2].payment_id is None
+        assert isinstance(by_index[2].error, ValueError)
+
+    async def test_callback_without_payment_id_rejected(self, config) -> None:
+        callbacks = [(json.dumps({"seq": 1}).encode(), {})]
+        results = await self._ingest(callbacks, PaymentStore(), config)
+        assert results[0].payment_id is None
+        assert isinstance(results[0].error, InvalidCallbackError)
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+    async def test_acknowledged_callbacks_are_skipped(
+        self, config, monkeypatch
+    ) -> None:
+        dedup = MemoryDedupStore()
+        monkeypatch.setattr(
+            DedupCallbackProcessor, "_get_dedup_store", lambda self: dedup
+        )
+        callbacks = [_callback("pay-1", 1), _callback("pay-2", 1)]
+        store = PaymentStore()
+        results = []
+        async for result in DedupCallbackProcessor.ingest_callbacks(
+            callbacks, store, config
+        ):
+            results.append(result)
+            if result.payment_id == "pay-1":
+                result.acknowledge()
+        assert [result.update for result in results] == [1, 1]
+        assert len(dedup) == 1
+
+        results = []
+        async for result in DedupCallbackProcessor.ingest_callbacks(
+            callbacks, store, config
+        ):
+            results.append(result)
+        updates = {result.payment_id: result.update for result in results}
+        assert updates == {"pay-1": None, "pay-2": 1}
+{%- endif %}
+
+    async def test_throughput(self, config) -> None:
+        # 400 callbacks with 10 ms of lookup latency each take 4 s one at
+        # a time; 50 payments in parallel finish in about 0.1 s.
+        store = PaymentStore(delay=0.01)
+        started = time.perf_counter()
+        results = await self._ingest(
+            _backlog(50, 8), store, config, concurrency=50
+        )
+        elapsed = time.perf_counter() - started
+        assert len(results) == 400
+        assert not [result.error for result in results if result.error]
+        assert elapsed < 1.0
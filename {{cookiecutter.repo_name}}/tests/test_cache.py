@@ -0,0 +1,220 @@
+"""Tests for the GET response cache."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.client_class_name }}
+from {{ cookiecutter.package_name }} import {{ cookiecutter.__sync_client_class_name }}
+from {{ cookiecutter.package_name }}.cache import ResponseCache
+
+
+API_URL = "https://sandbox.example.com"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StaticGateway:
+    """Mock gateway serving a versioned payment-method list."""
+
+    def __init__(self) -> None:
+        self.version = 1
+        self.requests: list[httpx.Request] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.release.wait()
+        etag = f'"v{self.version}"'
+        if request.url.path == "/no-store":
+            return httpx.Response(
+                200, json={}, headers={"Cache-Control": "no-store"}
+            )
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(
+            200,
+            json={"version": self.version},
+            headers={
+                "ETag": etag,
+                "Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT",
+            },
+        )
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> ResponseCache:
+    return ResponseCache(
+        {"/payment-methods": 60, "/payment-methods/cards": 5, "/no-store": 60},
+        stale=30,
+        clock=clock,
+    )
+
+
+@pytest.fixture
+def gateway() -> StaticGateway:
+    return StaticGateway()
+
+
+@pytest.fixture
+def client(gateway, cache) -> {{ cookiecutter.client_class_name }}:
+    return {{ cookiecutter.client_class_name }}(
+        API_URL,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(gateway)),
+        response_cache=cache,
+    )
+
+
+async def _version(client, path: str = "/payment-methods") -> int:
+    response = await client.request("GET", path)
+    return response.json()["version"]
+
+
+async def _drain_revalidations() -> None:
+    from {{ cookiecutter.package_name }}.client import _revalidations
+
+    await asyncio.gather(*_revalidations)
+
+
+class TestResponseCache:
+    """Test TTL lookup and eviction."""
+
+    def test_longest_prefix_ttl(self, cache) -> None:
+        assert cache.ttl("/payment-methods?country=PL") == 60
+        assert cache.ttl("/payment-methods/cards") == 5
+        assert cache.ttl("/payments/pay-1") is None
+
+    def test_lru_eviction(self, clock) -> None:
+        cache = ResponseCache({"/": 60}, max_entries=2, clock=clock)
+        request = httpx.Request("GET", API_URL)
+        for key in "abc":
+            if key == "c":
+                cache.lookup("a")
+            cache.update(key, None, httpx.Response(200, request=request), 60)
+        assert cache.lookup("b") == (None, "miss")
+        assert cache.lookup("a")[1] == "fresh"
+        assert cache.stats()["entries"] == 2
+
+
+class TestCachedClient:
+    """Test cached GET requests through the client."""
+
+    async def test_fresh_hits_skip_the_gateway(self, client, gateway) -> None:
+        assert await _version(client) == 1
+        gateway.version = 2
+        assert await _version(client) == 1
+        assert len(gateway.requests) == 1
+        assert client.response_cache.stats()["hits"] == 1
+
+    async def test_only_configured_gets_are_cached(
+        self, client, gateway
+    ) -> None:
+        await client.request("POST", "/payment-methods")
+        await client.request("POST", "/payment-methods")
+        await client.request("GET", "/payments/pay-1")
+        await client.request("GET", "/payments/pay-1")
+        assert len(gateway.requests) == 4
+
+    async def test_query_params_are_part_of_the_key(
+        self, client, gateway
+    ) -> None:
+        for country in ["PL", "DE", "PL"]:
+            await client.request(
+                "GET", "/payment-methods", params={"country": country}
+            )
+        assert len(gateway.requests) == 2
+
+    async def test_expired_entry_is_revalidated(
+        self, client, gateway, clock
+    ) -> None:
+        await _version(client)
+        clock.now = 100
+        assert await _version(client) == 1
+        revalidation = gateway.requests[-1]
+        assert revalidation.headers["If-None-Match"] == '"v1"'
+        assert "If-Modified-Since" in revalidation.headers
+        assert client.response_cache.stats()["revalidated"] == 1
+
+    async def test_changed_entry_is_replaced(
+        self, client, gateway, clock
+    ) -> None:
+        await _version(client)
+        gateway.version = 2
+        clock.now = 100
+        assert await _version(client) == 2
+        assert await _version(client) == 2
+        assert len(gateway.requests) == 2
+
+    async def test_stale_entry_served_while_revalidating(
+        self, client, gateway, clock
+    ) -> None:
+        await _version(client)
+        gateway.version = 2
+        clock.now = 70
+        assert await _version(client) == 1
+        assert await _version(client) == 1
+        await _drain_revalidations()
+        assert len(gateway.requests) == 2
+        assert await _version(client) == 2
+
+    async def test_no_store_is_not_cached(self, client, gateway) -> None:
+        await client.request("GET", "/no-store")
+        await client.request("GET", "/no-store")
+        assert len(gateway.requests) == 2
+
+
+class TestCachedSyncClient:
+    """Test cached GET requests through the sync client."""
+
+    def test_stale_entry_revalidated_in_background(
+        self, gateway, cache, clock
+    ) -> None:
+        client = {{ cookiecutter.__sync_client_class_name }}(
+            API_URL,
+            client=httpx.Client(transport=httpx.MockTransport(gateway)),
+            response_cache=cache,
+        )
+        client.request("GET", "/payment-methods")
+        gateway.version = 2
+        gateway.release.clear()
+        clock.now = 70
+        stale = client.request("GET", "/payment-methods")
+        assert stale.json() == {"version": 1}
+        gateway.release.set()
+        deadline = time.monotonic() + 1
+        while cache._refreshing and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert client.request("GET", "/payment-methods").json() == {
+            "version": 2
+        }
+        assert len(gateway.requests) == 2
+
+
+class TestProcessorCache:
+    """Test the response cache settings."""
+
+    def test_disabled_by_default(self, processor) -> None:
+        assert processor._get_client().response_cache is None
+
+    def test_shared_between_processors(self, processor) -> None:
+        processor.config["response_cache"] = {"/payment-methods": 300}
+        cache = processor._get_client().response_cache
+        assert cache.ttl("/payment-methods") == 300
+        assert processor._get_sync_client().response_cache is cache
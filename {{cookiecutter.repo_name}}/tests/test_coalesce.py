@@ -0,0 +1,324 @@
+"""Tests for coalescing concurrent payment status fetches."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+from getpaid_core.types import PaymentUpdate
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.processor_class_name }}
+from {{ cookiecutter.package_name }} import {{ cookiecutter.__sync_processor_class_name }}
+from {{ cookiecutter.package_name }}.api import ApiCall
+from {{ cookiecutter.package_name }}.coalesce import StatusCoalescer
+from {{ cookiecutter.package_name }}.coalesce import get_status_coalescer
+from {{ cookiecutter.package_name }}.transport import aclose_pooled_clients
+from {{ cookiecutter.package_name }}.transport import close_pooled_clients
+
+from .conftest import MockPayment
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StatusGateway:
+    """Mock gateway counting status requests per payment."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.requests: list[str] = []
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url.path)
+        await asyncio.sleep(self.delay)
+        return httpx.Response(200, json={"status": "COMPLETED"})
+
+    def handle_sync(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url.path)
+        threading.Event().wait(self.delay)
+        return httpx.Response(200, json={"status": "COMPLETED"})
+
+
+class StatusProcessor({{ cookiecutter.processor_class_name }}):
+    """Processor reading the payment status with one gateway call."""
+
+    def _fetch_payment_status_call(self, **kwargs):
+        return ApiCall(
+            "GET",
+            f"/payments/{self.payment.external_id}",
+            lambda response: PaymentUpdate(payment_event="payment_captured"),
+            operation="fetch_payment_status",
+            options={"params": kwargs},
+        )
+
+
+class StatusSyncProcessor({{ cookiecutter.__sync_processor_class_name }}):
+    """Sync adapter for :class:`StatusProcessor`."""
+
+    processor_class = StatusProcessor
+
+
+def make_payment(external_id: str) -> MockPayment:
+    payment = MockPayment()
+    payment.external_id = external_id
+    return payment
+
+
+@pytest.fixture(autouse=True)
+def fresh_coalescers():
+    get_status_coalescer.cache_clear()
+    yield
+    get_status_coalescer.cache_clear()
+
+
+@pytest.fixture
+async def async_config():
+    gateway = StatusGateway()
+    yield gateway, {"transport": httpx.MockTransport(gateway.handle_async)}
+    await aclose_pooled_clients()
+
+
+@pytest.fixture
+def sync_config():
+    gateway = StatusGateway()
+    transport = httpx.MockTransport(gateway.handle_sync)
+    yield gateway, {"sync_transport": transport}
+    close_pooled_clients()
+
+
+class TestStatusCoalescer:
+    """Test sharing, caching and counting of fetches."""
+
+    async def test_concurrent_calls_share_one_fetch(self) -> None:
+        coalescer = StatusCoalescer()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(
+            *(coalescer.do("pay-1", fetch) for _ in range(10))
+        )
+        assert results == [1] * 10
+        assert calls == 1
+        assert coalescer.stats() == {
+            "fetches": 1,
+            "coalesced": 9,
+            "cache_hits": 0,
+            "saved": 9,
+        }
+
+    def test_event_loops_in_threads_fetch_separately(self) -> None:
+        coalescer = StatusCoalescer()
+        barrier = threading.Barrier(2)
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "COMPLETED"
+
+        async def run():
+            task = asyncio.ensure_future(coalescer.do("pay-1", fetch))
+            await asyncio.sleep(0)
+            barrier.wait(1)
+            return await task
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(asyncio.run(run())))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(1)
+        assert results == ["COMPLETED", "COMPLETED"]
+
+    async def test_error_shared_and_not_cached(self) -> None:
+        coalescer = StatusCoalescer(ttl=60)
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("gateway down")
+
+        results = await asyncio.gather(
+            coalescer.do("pay-1", fetch),
+            coalescer.do("pay-1", fetch),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert calls == 1
+        with pytest.raises(RuntimeError):
+            await coalescer.do("pay-1", fetch)
+        assert calls == 2
+
+    async def test_ttl_cache_absorbs_bursts(self) -> None:
+        clock = FakeClock()
+        coalescer = StatusCoalescer(ttl=2, clock=clock)
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await coalescer.do("pay-1", fetch) == 1
+        clock.now = 1.9
+        assert await coalescer.do("pay-1", fetch) == 1
+        clock.now = 2.0
+        assert await coalescer.do("pay-1", fetch) == 2
+        assert coalescer.stats()["cache_hits"] == 1
+
+    async def test_invalidate_drops_cached_result(self) -> None:
+        coalescer = StatusCoalescer(ttl=60, clock=FakeClock())
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        await coalescer.do("pay-1", fetch)
+        coalescer.invalidate("pay-1")
+        assert await coalescer.do("pay-1", fetch) == 2
+
+    async def test_cache_bounded(self) -> None:
+        coalescer = StatusCoalescer(ttl=60, max_entries=2, clock=FakeClock())
+
+        async def fetch():
+            return "COMPLETED"
+
+        for key in ("pay-1", "pay-2", "pay-3"):
+            await coalescer.do(key, fetch)
+        assert list(coalescer._results) == ["pay-2", "pay-3"]
+
+    def test_threads_share_one_fetch(self) -> None:
+        coalescer = StatusCoalescer()
+        started = threading.Event()
+        release = threading.Event()
+        calls = 0
+
+        def fetch():
+            nonlocal calls
+            calls += 1
+            started.set()
+            release.wait(1)
+            return "COMPLETED"
+
+        results: list[str] = []
+        leader = threading.Thread(
+            target=lambda: results.append(coalescer.do_sync("pay-1", fetch))
+        )
+        leader.start()
+        started.wait(1)
+        followers = [
+            threading.Thread(
+                target=lambda: results.append(coalescer.do_sync("pay-1", fetch))
+            )
+            for _ in range(4)
+        ]
+        for thread in followers:
+            thread.start()
+        while coalescer.coalesced < 4:
+            threading.Event().wait(0.001)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(1)
+        assert results == ["COMPLETED"] * 5
+        assert calls == 1
+
+    def test_prometheus_export(self) -> None:
+        coalescer = StatusCoalescer()
+        coalescer.fetches = 3
+        coalescer.coalesced = 5
+        text = coalescer.to_prometheus("gw")
+        assert "# TYPE gw_status_calls_total counter" in text
+        assert 'gw_status_calls_total{result="fetched"} 3' in text
+        assert 'gw_status_calls_total{result="coalesced"} 5' in text
+        assert 'gw_status_calls_total{result="cached"} 0' in text
+
+
+class TestProcessorCoalescing:
+    """Test ``fetch_payment_status`` sharing gateway requests."""
+
+    async def test_same_payment_fetched_once(self, async_config) -> None:
+        gateway, config = async_config
+        processors = [
+            StatusProcessor(make_payment("pay-1"), config) for _ in range(5)
+        ]
+        updates = await asyncio.gather(
+            *(processor.fetch_payment_status() for processor in processors)
+        )
+        assert all(
+            update.payment_event == "payment_captured" for update in updates
+        )
+        assert gateway.requests == ["/payments/pay-1"]
+        assert processors[0]._get_status_coalescer().stats()["saved"] == 4
+
+    async def test_different_payments_not_coalesced(self, async_config) -> None:
+        gateway, config = async_config
+        processors = [
+            StatusProcessor(make_payment(external_id), config)
+            for external_id in ("pay-1", "pay-2")
+        ]
+        await asyncio.gather(
+            *(processor.fetch_payment_status() for processor in processors)
+        )
+        assert sorted(gateway.requests) == [
+            "/payments/pay-1",
+            "/payments/pay-2",
+        ]
+
+    async def test_disabled_by_setting(self, async_config) -> None:
+        gateway, config = async_config
+        config["status_coalescing"] = False
+        processor = StatusProcessor(make_payment("pay-1"), config)
+        assert processor._get_status_coalescer() is None
+        await asyncio.gather(
+            processor.fetch_payment_status(), processor.fetch_payment_status()
+        )
+        assert len(gateway.requests) == 2
+
+    async def test_calls_with_arguments_not_coalesced(
+        self, async_config
+    ) -> None:
+        gateway, config = async_config
+        processor = StatusProcessor(make_payment("pay-1"), config)
+        await asyncio.gather(
+            processor.fetch_payment_status(expand="refunds"),
+            processor.fetch_payment_status(expand="refunds"),
+        )
+        assert len(gateway.requests) == 2
+
+    async def test_cache_ttl_from_settings(self, async_config) -> None:
+        gateway, config = async_config
+        config["status_cache_ttl"] = 60
+        processor = StatusProcessor(make_payment("pay-1"), config)
+        await processor.fetch_payment_status()
+        await processor.fetch_payment_status()
+        assert len(gateway.requests) == 1
+
+    def test_sync_adapter_coalesces_threads(self, sync_config) -> None:
+        gateway, config = sync_config
+        adapter = StatusSyncProcessor(make_payment("pay-1"), config)
+        threads = [
+            threading.Thread(target=adapter.fetch_payment_status)
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(1)
+        assert 1 <= len(gateway.requests) < 5
@@ -0,0 +1,108 @@
+"""Tests for the JSON codec."""
+
+{% if cookiecutter.json_backend != "stdlib" %}import importlib
+import sys
+{% endif %}from decimal import Decimal
+
+import httpx
+import pytest
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.client_class_name }}
+from {{ cookiecutter.package_name }} import codec
+from {{ cookiecutter.package_name }}.codec import dumps
+from {{ cookiecutter.package_name }}.codec import loads
+
+
+API_URL = "https://sandbox.example.com"
+PAYLOAD = {
+    "paymentId": "pay-1",
+    "amount": 10000,
+    "description": "Zamówienie",
+    "items": [{"sku": "A-1", "quantity": 2}],
+    "refunded": None,
+}
+
+
+class TestCodec:
+    """Test the behaviour shared by all backends."""
+
+    def test_round_trip(self) -> None:
+        assert loads(dumps(PAYLOAD)) == PAYLOAD
+
+    def test_dumps_compact_utf8(self) -> None:
+        encoded = dumps({"a": [1, "ż"]})
+        assert isinstance(encoded, bytes)
+        assert encoded == '{"a":[1,"ż"]}'.encode()
+
+    def test_decimal_as_string(self) -> None:
+        encoded = dumps({"amount": Decimal("12.50")})
+        assert loads(encoded) == {"amount": "12.50"}
+
+    def test_unsupported_type(self) -> None:
+        with pytest.raises(TypeError):
+            dumps({"value": object()})
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_loads_buffers(self, wrap) -> None:
+        assert loads(wrap(b'{"id": "pay-1"}')) == {"id": "pay-1"}
+
+    def test_loads_text(self) -> None:
+        assert loads('{"id": "pay-1"}') == {"id": "pay-1"}
+
+    @pytest.mark.parametrize("body", [b"", b"{", b'{"id": }', b"[1] 2"])
+    def test_invalid_json_raises_value_error(self, body) -> None:
+        with pytest.raises(ValueError):
+            loads(body)
+
+
+class TestRequestBody:
+    """Test encoding ``json=`` request bodies with the codec."""
+
+    async def test_json_sent_as_encoded_content(self) -> None:
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200)
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = {{ cookiecutter.client_class_name }}(API_URL, client=http_client)
+        payload = {"amount": Decimal("1.5")}
+        await client.request("POST", "/payments", json=payload)
+        assert loads(sent[0].content) == {"amount": "1.5"}
+        assert sent[0].headers["Content-Type"] == "application/json"
+
+    def test_json_replaced_by_content(self) -> None:
+        client = {{ cookiecutter.client_class_name }}(API_URL)
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        *_, kwargs = client._prepare("POST", "/p", None, None, {"json": {}})
+{%- else %}
+        *_, kwargs = client._prepare("POST", "/p", {"json": {}})
+{%- endif %}
+        assert "json" not in kwargs
+        assert kwargs["content"] == b"{}"
+{%- if cookiecutter.json_backend != "stdlib" %}
+
+
+class TestBackend:
+    """Test the selection of the {{ cookiecutter.json_backend }} backend."""
+
+    def test_uses_{{ cookiecutter.json_backend }}_when_installed(self) -> None:
+        pytest.importorskip("{{ cookiecutter.json_backend }}")
+        assert codec.BACKEND == "{{ cookiecutter.json_backend }}"
+
+    def test_falls_back_to_stdlib(self, monkeypatch) -> None:
+        monkeypatch.setitem(sys.modules, "{{ cookiecutter.json_backend }}", None)
+        try:
+            fallback = importlib.reload(codec)
+            assert fallback.BACKEND == "stdlib"
+            assert fallback.loads(fallback.dumps(PAYLOAD)) == PAYLOAD
+        finally:
+            monkeypatch.undo()
+            importlib.reload(codec)
+{%- else %}
+
+
+def test_backend() -> None:
+    assert codec.BACKEND == "stdlib"
+{%- endif %}
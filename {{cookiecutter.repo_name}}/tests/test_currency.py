@@ -0,0 +1,91 @@
+"""Tests for currency metadata and minor-unit conversion."""
+
+from decimal import ROUND_HALF_EVEN
+from decimal import ROUND_HALF_UP
+from decimal import Decimal
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.processor_class_name }}
+from {{ cookiecutter.package_name }}.currency import MINOR_UNIT_EXPONENTS
+from {{ cookiecutter.package_name }}.currency import from_minor_units
+from {{ cookiecutter.package_name }}.currency import minor_unit_exponent
+from {{ cookiecutter.package_name }}.currency import to_minor_units
+
+
+currencies = st.sampled_from(sorted(MINOR_UNIT_EXPONENTS))
+minor_amounts = st.integers(min_value=-(10**15), max_value=10**15)
+
+
+def _decimals(places: int) -> st.SearchStrategy[Decimal]:
+    return st.decimals(
+        min_value=-(10**9),
+        max_value=10**9,
+        places=places,
+        allow_nan=False,
+        allow_infinity=False,
+    )
+
+
+class TestCurrencyMetadata:
+    """Test the generated exponent table."""
+
+    def test_accepted_currencies_have_exponents(self) -> None:
+        accepted = {{ cookiecutter.processor_class_name }}.accepted_currencies
+        assert set(accepted) <= set(MINOR_UNIT_EXPONENTS)
+
+    def test_unsupported_currency(self) -> None:
+        with pytest.raises(ValueError, match="Unsupported currency"):
+            minor_unit_exponent("XXX")
+        with pytest.raises(ValueError, match="Unsupported currency"):
+            to_minor_units(Decimal("1.00"), "XXX")
+
+
+class TestMinorUnits:
+    """Property tests for the Decimal/minor-unit converter."""
+
+    @given(minor=minor_amounts, currency=currencies)
+    def test_round_trip_from_minor_units(
+        self, minor: int, currency: str
+    ) -> None:
+        amount = from_minor_units(minor, currency)
+        assert to_minor_units(amount, currency) == minor
+
+    @given(data=st.data(), currency=currencies)
+    def test_round_trip_exact_amounts(self, data, currency: str) -> None:
+        places = MINOR_UNIT_EXPONENTS[currency]
+        amount = data.draw(_decimals(places))
+        assert from_minor_units(to_minor_units(amount, currency), currency) == (
+            amount
+        )
+
+    @given(
+        amount=_decimals(6),
+        currency=currencies,
+        rounding=st.sampled_from([ROUND_HALF_UP, ROUND_HALF_EVEN]),
+    )
+    def test_matches_quantize(
+        self, amount: Decimal, currency: str, rounding: str
+    ) -> None:
+        scale = Decimal(10) ** MINOR_UNIT_EXPONENTS[currency]
+        expected = int((amount * scale).quantize(Decimal(1), rounding))
+        assert to_minor_units(amount, currency, rounding=rounding) == expected
+
+    def test_excess_precision_rejected(self) -> None:
+        currency = next(iter(MINOR_UNIT_EXPONENTS))
+        places = MINOR_UNIT_EXPONENTS[currency] + 1
+        amount = Decimal(1).scaleb(-places)
+        with pytest.raises(ValueError, match="more decimal places"):
+            to_minor_units(amount, currency)
+
+    def test_invalid_amount(self) -> None:
+        currency = next(iter(MINOR_UNIT_EXPONENTS))
+        with pytest.raises(ValueError, match="Invalid amount"):
+            to_minor_units(Decimal("NaN"), currency)
+
+    def test_keeps_currency_precision(self) -> None:
+        currency = next(iter(MINOR_UNIT_EXPONENTS))
+        places = MINOR_UNIT_EXPONENTS[currency]
+        assert from_minor_units(0, currency).as_tuple().exponent == -places
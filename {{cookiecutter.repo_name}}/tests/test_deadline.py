@@ -0,0 +1,204 @@
+"""Tests for deadline propagation from processor operations to requests."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.processor_class_name }}
+from {{ cookiecutter.package_name }} import {{ cookiecutter.__sync_processor_class_name }}
+from {{ cookiecutter.package_name }}.api import ApiCall
+from {{ cookiecutter.package_name }}.concurrency import SingleFlight
+from {{ cookiecutter.package_name }}.deadline import Deadline
+from {{ cookiecutter.package_name }}.deadline import DeadlineExceededError
+from {{ cookiecutter.package_name }}.deadline import current_deadline
+from {{ cookiecutter.package_name }}.deadline import deadline_scope
+from {{ cookiecutter.package_name }}.deadline import within_deadline
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from {{ cookiecutter.package_name }}.transport import aclose_pooled_clients
+from {{ cookiecutter.package_name }}.transport import close_pooled_clients
+{%- endif %}
+
+from .conftest import MockPayment
+
+
+class SlowGateway:
+    """Mock gateway answering after ``delay`` seconds.
+
+    Like a network transport, it gives up with ``ReadTimeout`` once the
+    request's read timeout has passed.
+    """
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.timeouts: list[float] = []
+
+    def _wait(self, request: httpx.Request) -> float | None:
+        timeout = request.extensions["timeout"]["read"]
+        self.timeouts.append(timeout)
+        if timeout is not None and timeout < self.delay:
+            return timeout
+        return None
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/oauth/token":
+            return httpx.Response(200, json={"access_token": "t"})
+        return httpx.Response(200, json={"id": "pay-1"})
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        timeout = self._wait(request)
+        await asyncio.sleep(self.delay if timeout is None else timeout)
+        if timeout is not None:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return self._respond(request)
+
+    def handle_sync(self, request: httpx.Request) -> httpx.Response:
+        timeout = self._wait(request)
+        time.sleep(self.delay if timeout is None else timeout)
+        if timeout is not None:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return self._respond(request)
+
+
+class RegisteringProcessor({{ cookiecutter.processor_class_name }}):
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+    """Processor registering payments with one idempotent gateway call."""
+{%- else %}
+    """Processor registering payments with one gateway call."""
+{%- endif %}
+
+    def _prepare_transaction_call(self, **kwargs):
+        return ApiCall(
+            "POST",
+            "/payments",
+            lambda response: {"redirect_url": response.json()["id"]},
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+            idempotent=True,
+            operation="prepare_transaction",
+{%- endif %}
+        )
+
+
+class RegisteringSyncProcessor({{ cookiecutter.__sync_processor_class_name }}):
+    """Sync adapter for :class:`RegisteringProcessor`."""
+
+    processor_class = RegisteringProcessor
+
+
+@pytest.fixture
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+async def async_config():
+    yield {"retry_backoff_base": 0}
+    await aclose_pooled_clients()
+{%- else %}
+def async_config():
+    return {}
+{%- endif %}
+
+
+@pytest.fixture
+def sync_config():
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+    yield {"retry_backoff_base": 0}
+    close_pooled_clients()
+{%- else %}
+    return {}
+{%- endif %}
+
+
+class TestDeadline:
+    """Test budgets, timeouts and nesting."""
+
+    def test_timeout_capped_at_remaining(self) -> None:
+        timeout = Deadline.after(0.5).timeout(httpx.Timeout(10.0, connect=0.1))
+        assert timeout.read is not None
+        assert timeout.read <= 0.5
+        assert timeout.connect == 0.1
+
+    def test_unbounded_timeout_capped(self) -> None:
+        read = Deadline.after(0.5).timeout(httpx.Timeout(None)).read
+        assert read is not None
+        assert read <= 0.5
+
+    def test_expired_deadline_refuses_requests(self) -> None:
+        with pytest.raises(DeadlineExceededError):
+            Deadline.after(-1).timeout(httpx.Timeout(10.0))
+
+    def test_nested_scope_cannot_extend(self) -> None:
+        with deadline_scope(0.5) as outer:
+            with deadline_scope(60) as inner:
+                assert inner is outer
+            with deadline_scope(0.1) as shorter:
+                assert shorter.expires_at < outer.expires_at
+            assert current_deadline() is outer
+        assert current_deadline() is None
+
+    async def test_within_deadline_cancels(self) -> None:
+        with pytest.raises(DeadlineExceededError):
+            async with within_deadline(0.01):
+                await asyncio.sleep(1)
+
+    async def test_shared_calls_are_detached(self) -> None:
+        async def call():
+            return current_deadline()
+
+        async with within_deadline(1):
+            assert await SingleFlight().do("key", call) is None
+
+
+class TestProcessorDeadline:
+    """Test deadlines passed to processor operations."""
+
+    async def test_operation_cancelled_when_budget_runs_out(
+        self, async_config
+    ) -> None:
+        gateway = SlowGateway(delay=1)
+        async_config["transport"] = httpx.MockTransport(gateway.handle_async)
+        processor = RegisteringProcessor(MockPayment(), async_config)
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            await processor.prepare_transaction(deadline=0.05)
+        assert time.monotonic() - started < 0.5
+        assert len(gateway.timeouts) == 1
+        assert gateway.timeouts[0] <= 0.05
+
+    async def test_fast_gateway_within_budget(self, async_config) -> None:
+        gateway = SlowGateway(delay=0.01)
+        async_config["transport"] = httpx.MockTransport(gateway.handle_async)
+        processor = RegisteringProcessor(MockPayment(), async_config)
+        result = await processor.prepare_transaction(deadline=1)
+        assert result == {"redirect_url": "pay-1"}
+
+    async def test_default_from_settings(self, async_config) -> None:
+        gateway = SlowGateway(delay=1)
+        async_config["transport"] = httpx.MockTransport(gateway.handle_async)
+        async_config["operation_deadline"] = 0.05
+        processor = RegisteringProcessor(MockPayment(), async_config)
+        with pytest.raises(DeadlineExceededError):
+            await processor.prepare_transaction()
+
+    async def test_no_deadline_uses_client_timeout(self, async_config) -> None:
+        gateway = SlowGateway(delay=0)
+        async_config["transport"] = httpx.MockTransport(gateway.handle_async)
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        async_config["timeout"] = 7.0
+        processor = RegisteringProcessor(MockPayment(), async_config)
+        await processor.prepare_transaction()
+        assert gateway.timeouts == [7.0]
+{%- else %}
+        processor = RegisteringProcessor(MockPayment(), async_config)
+        await processor.prepare_transaction()
+        # httpx's default timeout.
+        assert gateway.timeouts == [5.0]
+{%- endif %}
+
+    def test_sync_adapter_bounds_requests(self, sync_config) -> None:
+        gateway = SlowGateway(delay=1)
+        sync_config["sync_transport"] = httpx.MockTransport(gateway.handle_sync)
+        adapter = RegisteringSyncProcessor(MockPayment(), sync_config)
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            adapter.prepare_transaction(deadline=0.05)
+        assert time.monotonic() - started < 0.5
+        assert len(gateway.timeouts) == 1
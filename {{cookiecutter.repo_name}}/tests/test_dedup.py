@@ -0,0 +1,180 @@
+"""Tests for duplicate-callback suppression."""
+
+import threading
+
+import pytest
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.processor_class_name }}
+from {{ cookiecutter.package_name }}.dedup import MemoryDedupStore
+from {{ cookiecutter.package_name }}.dedup import SqliteDedupStore
+from {{ cookiecutter.package_name }}.dedup import get_dedup_store
+
+from .conftest import MockPayment
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMemoryDedupStore:
+    """Test the in-process store."""
+
+    def test_counts_hits_and_misses(self) -> None:
+        store = MemoryDedupStore()
+        assert not store.seen("a")
+        store.add("a")
+        assert store.seen("a")
+        assert store.stats() == {"hits": 1, "misses": 1}
+
+    def test_entries_expire(self) -> None:
+        clock = FakeClock()
+        store = MemoryDedupStore(ttl=60, clock=clock)
+        store.add("a")
+        clock.now += 61
+        assert not store.seen("a")
+        assert len(store) == 0
+
+    def test_oldest_entries_evicted(self) -> None:
+        store = MemoryDedupStore(max_entries=2)
+        for key in ["a", "b", "c"]:
+            store.add(key)
+        assert len(store) == 2
+        assert not store.seen("a")
+        assert store.seen("c")
+
+    def test_discard(self) -> None:
+        store = MemoryDedupStore()
+        store.add("a")
+        store.discard("a")
+        assert not store.seen("a")
+
+    def test_shared_by_threads(self) -> None:
+        store = MemoryDedupStore(max_entries=100)
+
+        def deliver(worker: int) -> None:
+            for index in range(2000):
+                key = f"{worker}-{index % 150}"
+                if not store.seen(key):
+                    store.add(key)
+
+        threads = [
+            threading.Thread(target=deliver, args=(worker,))
+            for worker in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = store.stats()
+        assert stats["hits"] + stats["misses"] == 8000
+        assert len(store) == 100
+
+
+class TestSqliteDedupStore:
+    """Test the SQLite-backed store."""
+
+    def test_shared_between_instances(self, tmp_path) -> None:
+        path = str(tmp_path / "callbacks.db")
+        SqliteDedupStore(path).add("a")
+        other = SqliteDedupStore(path)
+        assert other.seen("a")
+        assert not other.seen("b")
+
+    def test_entries_expire(self, tmp_path) -> None:
+        clock = FakeClock()
+        path = str(tmp_path / "callbacks.db")
+        store = SqliteDedupStore(path, ttl=60, clock=clock)
+        store.add("a")
+        clock.now += 61
+        assert not store.seen("a")
+
+    def test_pruned_to_max_entries(self, tmp_path) -> None:
+        path = str(tmp_path / "callbacks.db")
+        store = SqliteDedupStore(path, max_entries=10)
+        for index in range(100):
+            store.add(f"key-{index}")
+        assert len(store) == 10
+        assert store.seen("key-99")
+        assert not store.seen("key-0")
+
+
+class TestGetDedupStore:
+    """Test backend selection."""
+
+    def test_memory_store_is_shared(self) -> None:
+        assert get_dedup_store("memory") is get_dedup_store("memory")
+
+    def test_sqlite_requires_path(self) -> None:
+        with pytest.raises(ValueError, match="requires a path"):
+            get_dedup_store("sqlite")
+
+    def test_unknown_backend(self) -> None:
+        with pytest.raises(ValueError, match="Unknown"):
+            get_dedup_store("redis")
+
+
+class DedupProcessor({{ cookiecutter.processor_class_name }}):
+    """Processor reading the notification ID from the payload."""
+
+    def _get_callback_id(self, data: dict, headers: dict) -> str | None:
+        return data.get("event_id")
+
+
+class TestProcessorDedup:
+    """Test duplicate suppression in the callback flow."""
+
+    @pytest.fixture
+    def store(self, monkeypatch) -> MemoryDedupStore:
+        store = MemoryDedupStore()
+        monkeypatch.setattr(
+            DedupProcessor, "_get_dedup_store", lambda self: store
+        )
+        return store
+
+    async def _deliver(self, data: dict) -> bool:
+        processor = DedupProcessor(payment=MockPayment(), config={})
+        await processor.verify_callback(data, {})
+        await processor.handle_callback(data, {})
+        processor.acknowledge_callback(data, {})
+        return processor._duplicate_callback
+
+    async def test_redelivery_is_suppressed(self, store) -> None:
+        assert not await self._deliver({"event_id": "evt-1"})
+        assert await self._deliver({"event_id": "evt-1"})
+        assert not await self._deliver({"event_id": "evt-2"})
+        assert store.stats() == {"hits": 1, "misses": 2}
+
+    async def test_duplicate_short_circuits(self, store) -> None:
+        store.add("{{ cookiecutter.gateway_slug }}:evt-1")
+        data = {"event_id": "evt-1"}
+        processor = DedupProcessor(payment=MockPayment(), config={})
+        await processor.verify_callback(data, {})
+        assert processor._duplicate_callback
+        assert await processor.handle_callback(data, {}) is None
+
+    async def test_unacknowledged_callback_is_processed_again(
+        self, store
+    ) -> None:
+        data = {"event_id": "evt-1"}
+        processor = DedupProcessor(payment=MockPayment(), config={})
+        await processor.verify_callback(data, {})
+        await processor.handle_callback(data, {})
+        # Saving the update failed, so the callback is not acknowledged.
+        assert not await self._deliver(data)
+        assert await self._deliver(data)
+
+    async def test_callbacks_without_id_are_processed(self, store) -> None:
+        assert not await self._deliver({})
+        assert not await self._deliver({})
+        assert store.stats() == {"hits": 0, "misses": 0}
+
+    async def test_disabled(self) -> None:
+        config = {"callback_dedup": None}
+        processor = DedupProcessor(payment=MockPayment(), config=config)
+        assert processor._get_dedup_store() is None
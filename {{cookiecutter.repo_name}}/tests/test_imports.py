@@ -0,0 +1,67 @@
+"""Tests for the lazy package import."""
+
+import subprocess
+import sys
+
+import pytest
+
+import {{ cookiecutter.package_name }}
+from {{ cookiecutter.package_name }}.client import {{ cookiecutter.client_class_name }}
+from {{ cookiecutter.package_name }}.processor import {{ cookiecutter.processor_class_name }}
+
+
+# Upper bound for the package's own import time, excluding the modules it
+# imports; the interpreter's startup imports vary too much to budget for.
+IMPORT_SELF_TIME_BUDGET_US = 5_000
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+class TestLazyImport:
+    """Test that importing the package stays cheap."""
+
+    def test_bare_import_skips_heavy_dependencies(self) -> None:
+        proc = _run_python(
+            "-c",
+            "import sys; before = set(sys.modules); "
+            "import {{ cookiecutter.package_name }}; "
+            "heavy = {'httpx', 'getpaid_core', 'typing'}; "
+            "print(sorted(heavy & (set(sys.modules) - before)))",
+        )
+        assert proc.stdout.strip() == "[]"
+
+    def test_import_time_budget(self) -> None:
+        proc = _run_python(
+            "-X",
+            "importtime",
+            "-c",
+            "import {{ cookiecutter.package_name }}",
+        )
+        for line in proc.stderr.splitlines():
+            _, self_time, _, module = (
+                part.strip() for part in line.replace(":", "|", 1).split("|")
+            )
+            if module == "{{ cookiecutter.package_name }}":
+                assert int(self_time) < IMPORT_SELF_TIME_BUDGET_US
+                return
+        pytest.fail("Package import not found in -X importtime output.")
+
+    def test_exports_resolve(self) -> None:
+        package = {{ cookiecutter.package_name }}
+        assert package.{{ cookiecutter.client_class_name }} is {{ cookiecutter.client_class_name }}
+        assert package.{{ cookiecutter.processor_class_name }} is {{ cookiecutter.processor_class_name }}
+
+    def test_dir_lists_exports(self) -> None:
+        package = {{ cookiecutter.package_name }}
+        assert set(package.__all__) <= set(dir(package))
+
+    def test_unknown_attribute(self) -> None:
+        with pytest.raises(AttributeError):
+            _ = {{ cookiecutter.package_name }}.does_not_exist
@@ -0,0 +1,339 @@
+"""Tests for the cached gateway key store, on a fake clock."""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.processor_class_name }}
+from {{ cookiecutter.package_name }} import {{ cookiecutter.__sync_processor_class_name }}
+from {{ cookiecutter.package_name }} import keys
+from {{ cookiecutter.package_name }}.keys import KeyNotFoundError
+from {{ cookiecutter.package_name }}.keys import KeyStore
+from {{ cookiecutter.package_name }}.transport import aclose_pooled_clients
+from {{ cookiecutter.package_name }}.transport import close_pooled_clients
+
+from .conftest import MockPayment
+
+
+def jwks(*kids: str) -> dict:
+    return {"keys": [{"kid": kid, "kty": "oct", "k": kid} for kid in kids]}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class KeyServer:
+    """Mock key endpoint publishing a replaceable key set."""
+
+    def __init__(self, *kids: str, delay: float = 0.0) -> None:
+        self.document = jwks(*kids)
+        self.delay = delay
+        self.requests = 0
+        self.fail = False
+
+    async def fetch(self) -> dict:
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise httpx.ConnectError("unreachable")
+        return self.document
+
+    def fetch_sync(self) -> dict:
+        self.requests += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise httpx.ConnectError("unreachable")
+        return self.document
+
+
+class KeyProcessor({{ cookiecutter.processor_class_name }}):
+    """Processor recording the signing key passed to verification."""
+
+    signing_keys: list = []
+
+    def _get_callback_key_id(self, data, headers):
+        return headers["X-Key-Id"]
+
+    @classmethod
+    def _parse_callback_key(cls, jwk):
+        return jwk["k"].upper()
+
+    def _verify_callback(self, data, headers, **kwargs):
+        type(self).signing_keys.append(kwargs["signing_key"])
+
+
+class KeySyncProcessor({{ cookiecutter.__sync_processor_class_name }}):
+    """Sync adapter for :class:`KeyProcessor`."""
+
+    processor_class = KeyProcessor
+
+
+@pytest.fixture(autouse=True)
+def fresh_stores(monkeypatch):
+    monkeypatch.setattr(keys, "_stores", {})
+    KeyProcessor.signing_keys = []
+
+
+class TestKeyStore:
+    """Test caching, refreshing and rotation."""
+
+    async def test_keys_cached_by_kid(self) -> None:
+        server = KeyServer("a", "b")
+        store = KeyStore(lambda jwk: jwk["k"], clock=FakeClock())
+        assert await store.get("a", server.fetch) == "a"
+        assert await store.get("b", server.fetch) == "b"
+        assert server.requests == 1
+        assert store.get_cached("a") == "a"
+
+    async def test_unknown_kid_refetched_once_for_all_callers(self) -> None:
+        clock = FakeClock()
+        server = KeyServer("a", delay=0.01)
+        store = KeyStore(clock=clock)
+        await store.get("a", server.fetch)
+        server.document = jwks("a", "b")
+        clock.now += 120
+        found = await asyncio.gather(
+            *(store.get("b", server.fetch) for _ in range(10))
+        )
+        assert all(key["kid"] == "b" for key in found)
+        assert server.requests == 2
+
+    async def test_unknown_kid_refetch_rate_limited(self) -> None:
+        clock = FakeClock()
+        server = KeyServer("a")
+        store = KeyStore(refetch_interval=60, clock=clock)
+        await store.get("a", server.fetch)
+        for _ in range(3):
+            with pytest.raises(KeyNotFoundError):
+                await store.get("forged", server.fetch)
+        assert server.requests == 1
+        clock.now += 60
+        with pytest.raises(KeyNotFoundError):
+            await store.get("forged", server.fetch)
+        assert server.requests == 2
+
+    async def test_failed_first_fetch_retried_at_once(self) -> None:
+        server = KeyServer("a")
+        server.fail = True
+        store = KeyStore(refetch_interval=60, clock=FakeClock())
+        with pytest.raises(httpx.ConnectError):
+            await store.get("a", server.fetch)
+        server.fail = False
+        assert await store.get("a", server.fetch)
+        assert server.requests == 2
+
+    def test_failed_first_fetch_retried_at_once_sync(self) -> None:
+        server = KeyServer("a")
+        server.fail = True
+        store = KeyStore(refetch_interval=60, clock=FakeClock())
+        with pytest.raises(httpx.ConnectError):
+            store.get_sync("a", server.fetch_sync)
+        server.fail = False
+        assert store.get_sync("a", server.fetch_sync)
+
+    async def test_rotation_drops_retired_keys(self) -> None:
+        clock = FakeClock()
+        server = KeyServer("old")
+        store = KeyStore(refetch_interval=0, clock=clock)
+        await store.get("old", server.fetch)
+        server.document = jwks("new")
+        await store.get("new", server.fetch)
+        assert store.get_cached("old") is None
+
+    async def test_stale_keys_served_while_refreshing(self) -> None:
+        clock = FakeClock()
+        server = KeyServer("a", delay=0.01)
+        store = KeyStore(lambda jwk: jwk["k"], ttl=300, clock=clock)
+        await store.get("a", server.fetch)
+        server.document = {"keys": [{"kid": "a", "k": "rotated"}]}
+        clock.now += 300
+        assert await store.get("a", server.fetch) == "a"
+        assert await store.get("a", server.fetch) == "a"
+        await asyncio.sleep(0.05)
+        assert await store.get("a", server.fetch) == "rotated"
+        assert server.requests == 2
+
+    async def test_background_failure_logged(self, caplog) -> None:
+        clock = FakeClock()
+        server = KeyServer("a")
+        store = KeyStore(ttl=300, clock=clock)
+        await store.get("a", server.fetch)
+        server.fail = True
+        clock.now += 300
+        with caplog.at_level(logging.WARNING):
+            assert await store.get("a", server.fetch)
+            await asyncio.sleep(0.01)
+        assert "Background key refresh failed" in caplog.text
+
+    async def test_unusable_keys_skipped(self) -> None:
+        server = KeyServer("a")
+        server.document["keys"].append({"kid": "b"})
+        store = KeyStore(lambda jwk: jwk["k"], clock=FakeClock())
+        assert await store.get("a", server.fetch) == "a"
+        assert store.get_cached("b") is None
+
+    async def test_invalid_document_rejected(self) -> None:
+        async def fetch():
+            return {"error": "not found"}
+
+        with pytest.raises(ValueError):
+            await KeyStore(clock=FakeClock()).get("a", fetch)
+
+    def test_sync_threads_share_one_refetch(self) -> None:
+        server = KeyServer("a", delay=0.02)
+        store = KeyStore(clock=FakeClock())
+        found = []
+
+        def verify():
+            found.append(store.get_sync("a", server.fetch_sync))
+
+        threads = [threading.Thread(target=verify) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(1)
+        assert len(found) == 5
+        assert server.requests == 1
+
+    def test_sync_stale_refreshed_in_thread(self) -> None:
+        clock = FakeClock()
+        server = KeyServer("a")
+        store = KeyStore(ttl=300, clock=clock)
+        store.get_sync("a", server.fetch_sync)
+        clock.now += 300
+        assert store.get_sync("a", server.fetch_sync)
+        for _ in range(100):
+            if server.requests == 2:
+                break
+            time.sleep(0.01)
+        assert server.requests == 2
+
+
+class TestKeyBundle:
+    """Test starting from an on-disk key bundle."""
+
+    async def test_bundle_written_and_preloaded(self, tmp_path) -> None:
+        path = tmp_path / "keys.json"
+        server = KeyServer("a")
+        await KeyStore(bundle_path=path).get("a", server.fetch)
+        store = KeyStore(bundle_path=path)
+        assert await store.get("a", server.fetch) == {
+            "kid": "a",
+            "kty": "oct",
+            "k": "a",
+        }
+        assert server.requests == 1
+        assert store.fetches == 0
+
+    async def test_old_bundle_refreshed(self, tmp_path) -> None:
+        path = tmp_path / "keys.json"
+        path.write_text(json.dumps(jwks("a")))
+        an_hour_ago = time.time() - 3600
+        os.utime(path, (an_hour_ago, an_hour_ago))
+        server = KeyServer("a", delay=0.01)
+        store = KeyStore(ttl=600, bundle_path=path)
+        assert await store.get("a", server.fetch)
+        await asyncio.sleep(0.05)
+        assert server.requests == 1
+
+    def test_corrupt_bundle_ignored(self, tmp_path) -> None:
+        path = tmp_path / "keys.json"
+        path.write_text("{not json")
+        store = KeyStore(bundle_path=path)
+        assert store.get_cached("a") is None
+
+    async def test_concurrent_dumps(self, tmp_path) -> None:
+        path = tmp_path / "keys.json"
+        store = KeyStore()
+        await store.get("a", KeyServer("a").fetch)
+
+        def dump() -> None:
+            for _ in range(50):
+                store.dump_bundle(path)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for future in [pool.submit(dump) for _ in range(4)]:
+                future.result()
+        assert json.loads(path.read_text()) == jwks("a")
+        assert [entry.name for entry in tmp_path.iterdir()] == ["keys.json"]
+
+    def test_dump_without_keys_fails(self, tmp_path) -> None:
+        with pytest.raises(ValueError):
+            KeyStore().dump_bundle(tmp_path / "keys.json")
+
+
+class TestProcessorKeys:
+    """Test ``verify_callback`` with ``callback_keys_path``."""
+
+    @staticmethod
+    def _config(requests: list[str], **config) -> dict:
+        def handler(request):
+            requests.append(request.url.path)
+            return httpx.Response(200, json=jwks("a", "b"))
+
+        transport = httpx.MockTransport(handler)
+        return {
+            "callback_keys_path": "/.well-known/jwks.json",
+            "transport": transport,
+            "sync_transport": transport,
+            **config,
+        }
+
+    async def test_signing_key_passed_to_verification(self) -> None:
+        requests: list[str] = []
+        config = self._config(requests)
+        try:
+            for kid in ("a", "b", "a"):
+                processor = KeyProcessor(MockPayment(), config)
+                await processor.verify_callback({}, {"X-Key-Id": kid})
+        finally:
+            await aclose_pooled_clients()
+        assert KeyProcessor.signing_keys == ["A", "B", "A"]
+        assert requests == ["/.well-known/jwks.json"]
+
+    async def test_unknown_key_rejected(self) -> None:
+        processor = KeyProcessor(MockPayment(), self._config([]))
+        try:
+            with pytest.raises(KeyNotFoundError):
+                await processor.verify_callback({}, {"X-Key-Id": "c"})
+        finally:
+            await aclose_pooled_clients()
+
+    def test_sync_adapter_passes_signing_key(self) -> None:
+        requests: list[str] = []
+        adapter = KeySyncProcessor(MockPayment(), self._config(requests))
+        try:
+            adapter.verify_callback({}, {"X-Key-Id": "b"})
+            adapter.verify_callback({}, {"X-Key-Id": "b"})
+        finally:
+            close_pooled_clients()
+        assert KeyProcessor.signing_keys == ["B", "B"]
+        assert len(requests) == 1
+
+    def test_duplicate_skips_key_fetch(self, monkeypatch) -> None:
+        requests: list[str] = []
+        adapter = KeySyncProcessor(MockPayment(), self._config(requests))
+        monkeypatch.setattr(
+            adapter.processor, "_is_duplicate_callback", lambda *args: True
+        )
+        adapter.verify_callback({}, {"X-Key-Id": "a"})
+        assert requests == []
+        assert KeyProcessor.signing_keys == []
+
+    def test_disabled_by_default(self) -> None:
+        processor = KeyProcessor(MockPayment())
+        assert processor._get_key_store() is None
@@ -0,0 +1,171 @@
+"""Tests for request timing instrumentation."""
+
+import threading
+
+import httpx
+import pytest
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.client_class_name }}
+from {{ cookiecutter.package_name }}.metrics import Histogram
+from {{ cookiecutter.package_name }}.metrics import RequestMetrics
+from {{ cookiecutter.package_name }}.resilience import ResiliencePolicy
+
+
+API_URL = "https://sandbox.example.com"
+
+
+class FakeClock:
+    """Clock advancing by a fixed step on every read."""
+
+    def __init__(self, step: float = 0.1) -> None:
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+async def _body():
+    for _ in range(2):
+        yield b"x" * 1000
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/missing":
+        return httpx.Response(404)
+    if request.url.path == "/buffered":
+        return httpx.Response(200, content=b"x" * 10)
+    return httpx.Response(200, content=_body())
+
+
+@pytest.fixture
+def metrics() -> RequestMetrics:
+    return RequestMetrics(clock=FakeClock())
+
+
+@pytest.fixture
+async def client(metrics):
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        event_hooks=metrics.event_hooks(),
+    )
+    policy = ResiliencePolicy()
+    yield {{ cookiecutter.client_class_name }}(API_URL, client=http_client, policy=policy)
+    await http_client.aclose()
+
+
+class TestHistogram:
+    """Test bucketed quantile estimates."""
+
+    def test_empty(self) -> None:
+        assert Histogram((1.0, 2.0)).quantile(0.5) is None
+
+    def test_quantiles_interpolate_within_bucket(self) -> None:
+        histogram = Histogram((0.1, 0.2, 0.4))
+        for value in [0.05] * 50 + [0.3] * 50:
+            histogram.observe(value)
+        assert histogram.quantile(0.5) == pytest.approx(0.1)
+        assert histogram.quantile(0.99) == pytest.approx(0.396)
+
+    def test_overflow_reports_last_bound(self) -> None:
+        histogram = Histogram((0.1, 0.2))
+        histogram.observe(5.0)
+        assert histogram.quantile(0.99) == 0.2
+        assert histogram.snapshot()["sum"] == 5.0
+
+
+class TestRequestMetrics:
+    """Test metrics recorded through httpx event hooks."""
+
+    async def test_records_per_operation(self, client, metrics) -> None:
+        await client.request("GET", "/orders", operation="list_orders")
+        await client.request("GET", "/missing", operation="list_orders")
+        await client.request("POST", "/payments")
+        snapshot = metrics.snapshot()
+        assert set(snapshot) == {"list_orders", "POST"}
+        orders = snapshot["list_orders"]
+        assert orders["status"] == {200: 1, 404: 1}
+        assert orders["ttfb_seconds"]["count"] == 2
+        assert orders["total_seconds"]["count"] == 2
+        assert orders["response_bytes"]["sum"] == 2000
+        assert orders["total_seconds"]["p50"] is not None
+
+    async def test_total_includes_body(self, client, metrics) -> None:
+        await client.request("GET", "/orders")
+        timings = metrics.snapshot()["GET"]
+        total = timings["total_seconds"]["sum"]
+        assert total > timings["ttfb_seconds"]["sum"]
+
+    async def test_buffered_response(self, client, metrics) -> None:
+        await client.request("GET", "/buffered")
+        timings = metrics.snapshot()["GET"]
+        assert timings["response_bytes"]["sum"] == 10
+
+    async def test_streamed_response_recorded_on_close(
+        self, client, metrics
+    ) -> None:
+        url = f"{API_URL}/orders"
+        async with client.client.stream("GET", url) as response:
+            assert "total_seconds" not in metrics.snapshot()["GET"]
+            await response.aread()
+        assert metrics.snapshot()["GET"]["response_bytes"]["count"] == 1
+
+    async def test_connect_time_from_trace(self, metrics) -> None:
+        request = httpx.Request("GET", API_URL)
+        await metrics._on_request(request)
+        trace = request.extensions["trace"]
+        await trace("connection.connect_tcp.started", {})
+        await trace("connection.start_tls.complete", {})
+        await metrics._on_response(httpx.Response(200, request=request))
+        connect = metrics.snapshot()["GET"]["connect_seconds"]
+        assert connect["count"] == 1
+        assert connect["sum"] == pytest.approx(0.1)
+
+    async def test_instrument_existing_client(self, metrics) -> None:
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as http_client:
+            metrics.instrument(http_client)
+            await http_client.get(API_URL)
+        assert metrics.snapshot()["GET"]["status"] == {200: 1}
+
+    async def test_prometheus_export(self, client, metrics) -> None:
+        await client.request("GET", "/orders", operation="list_orders")
+        lines = metrics.to_prometheus("gw").splitlines()
+        labels = '{operation="list_orders"'
+        expected = [
+            "# TYPE gw_request_ttfb_seconds histogram",
+            "gw_request_ttfb_seconds_bucket" + labels + ',le="+Inf"} 1',
+            "gw_request_response_bytes_sum" + labels + "} 2000.0",
+            "gw_responses_total" + labels + ',status="200"} 1',
+        ]
+        for line in expected:
+            assert line in lines
+
+    def test_reset(self, metrics) -> None:
+        metrics.observe("op", "ttfb_seconds", 0.1)
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    def test_read_while_recording_from_threads(self, metrics) -> None:
+        done = threading.Event()
+
+        def record(worker: int) -> None:
+            for index in range(2000):
+                metrics.observe(f"op-{worker}-{index}", "ttfb_seconds", 0.1)
+            done.set()
+
+        threads = [
+            threading.Thread(target=record, args=(worker,))
+            for worker in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        while not done.is_set():
+            for summary in metrics.snapshot().values():
+                assert summary["ttfb_seconds"]["count"] == 1
+            metrics.to_prometheus()
+        for thread in threads:
+            thread.join()
+        assert len(metrics.snapshot()) == 8000
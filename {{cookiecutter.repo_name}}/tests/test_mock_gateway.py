@@ -0,0 +1,142 @@
+"""Tests for the in-process mock gateway and the load-test command."""
+
+import json
+import random
+
+import httpx
+import pytest
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.processor_class_name }}
+from {{ cookiecutter.package_name }}.api import ApiCall
+from {{ cookiecutter.package_name }}.loadtest import main
+from {{ cookiecutter.package_name }}.loadtest import run_load_test
+from {{ cookiecutter.package_name }}.mock_gateway import MOCK_GATEWAY_URL
+from {{ cookiecutter.package_name }}.mock_gateway import MockGateway
+from {{ cookiecutter.package_name }}.mock_gateway import parse_latency
+from {{ cookiecutter.package_name }}.signature import HmacVerifier
+
+
+class ImplementedProcessor({{ cookiecutter.processor_class_name }}):
+    """Processor registering payments with the mock gateway."""
+
+    def _prepare_transaction_call(self, **kwargs):
+        return ApiCall(
+            "POST",
+            "/payments",
+            self._parse_transaction,
+            authenticated=True,
+            operation="prepare_transaction",
+        )
+
+    def _parse_transaction(self, response: httpx.Response):
+        data = response.json()
+        self.payment.external_id = data["id"]
+        return {"redirect_url": data["redirectUrl"], "method": "GET"}
+
+
+async def _request(
+    gateway: MockGateway, method: str, path: str
+) -> httpx.Response:
+    async with httpx.AsyncClient(
+        transport=gateway.transport(), base_url=MOCK_GATEWAY_URL
+    ) as client:
+        return await client.request(method, path)
+
+
+class TestMockGateway:
+    """Test the mock gateway's routes and failure injection."""
+
+    async def test_routes(self) -> None:
+        gateway = MockGateway()
+        created = await _request(gateway, "POST", "/payments")
+        assert created.status_code == 201
+        payment_id = created.json()["id"]
+        status = await _request(gateway, "GET", f"/payments/{payment_id}")
+        assert status.json() == {"id": payment_id, "status": "COMPLETED"}
+        refund = await _request(
+            gateway, "POST", f"/payments/{payment_id}/refunds"
+        )
+        assert refund.json()["paymentId"] == payment_id
+        missing = await _request(gateway, "GET", "/orders")
+        assert missing.status_code == 404
+        assert gateway.requests == 4
+
+    async def test_error_rate(self) -> None:
+        gateway = MockGateway(error_rate=1.0)
+        response = await _request(gateway, "POST", "/payments")
+        assert response.status_code == 503
+
+    async def test_payload_size(self) -> None:
+        gateway = MockGateway(payload_size=4096)
+        response = await _request(gateway, "POST", "/payments")
+        assert len(response.content) == 4096
+
+    def test_signed_callback(self) -> None:
+        gateway = MockGateway()
+        data, headers, body = gateway.signed_callback("pay-1")
+        assert json.loads(body) == data
+        verifier = HmacVerifier(gateway.signature_key)
+        assert verifier.verify(body, headers["X-Signature"])
+
+
+class TestParseLatency:
+    """Test latency specifications."""
+
+    def test_fixed(self) -> None:
+        assert parse_latency("0.25")() == 0.25
+
+    def test_uniform(self) -> None:
+        latency = parse_latency("uniform:0.1,0.2", rng=random.Random(1))
+        assert all(0.1 <= latency() <= 0.2 for _ in range(100))
+
+    def test_lognormal(self) -> None:
+        latency = parse_latency("lognormal:0.05,0.5", rng=random.Random(1))
+        samples = sorted(latency() for _ in range(1001))
+        assert samples[500] == pytest.approx(0.05, rel=0.1)
+
+    @pytest.mark.parametrize(
+        "spec", ["gamma:1,2", "uniform:0.1", "lognormal:0,1", "fast"]
+    )
+    def test_invalid(self, spec: str) -> None:
+        with pytest.raises(ValueError):
+            parse_latency(spec)
+
+
+class TestLoadTest:
+    """Test load test runs through the real processor."""
+
+    async def test_full_flow(self) -> None:
+        gateway = MockGateway()
+        report = await run_load_test(
+            gateway,
+            flows=20,
+            concurrency=5,
+            processor_class=ImplementedProcessor,
+        )
+        assert report.flows == 20
+        assert len(report.latencies) == 20
+        assert not report.errors
+        median, p99 = report.percentile(0.5), report.percentile(0.99)
+        assert median is not None
+        assert p99 is not None
+        assert median <= p99
+        assert "throughput:" in report.format()
+
+    async def test_errors_are_counted(self) -> None:
+        gateway = MockGateway(error_rate=1.0)
+        report = await run_load_test(
+            gateway,
+            flows=3,
+            concurrency=3,
+            flow="prepare",
+            processor_class=ImplementedProcessor,
+            config={"retry_max_attempts": 1},
+        )
+        assert report.flows == 3
+        assert report.latencies == []
+        assert report.errors.total() == 3
+
+    def test_main_fails_when_every_flow_fails(self, capsys) -> None:
+        # The processor skeleton does not implement prepare_transaction.
+        assert main(["--flows", "2", "--latency", "0"]) == 1
+        assert "NotImplementedError" in capsys.readouterr().out
@@ -0,0 +1,180 @@
+"""Tests for offloading callback verification from the event loop."""
+
+import asyncio
+import hashlib
+import hmac
+import threading
+
+import pytest
+from getpaid_core.exceptions import InvalidCallbackError
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.processor_class_name }}
+from {{ cookiecutter.package_name }}.deadline import current_deadline
+from {{ cookiecutter.package_name }}.deadline import deadline_scope
+from {{ cookiecutter.package_name }}.offload import VerificationPool
+from {{ cookiecutter.package_name }}.offload import body_size
+from {{ cookiecutter.package_name }}.offload import shutdown_verification_pools
+from {{ cookiecutter.package_name }}.signature import HmacVerifier
+
+from .conftest import MockPayment
+
+
+KEY = "secret-key"
+LARGE_BODY = b"x" * 64 * 1024
+LARGE_SIGNATURE = hmac.new(KEY.encode(), LARGE_BODY, hashlib.sha256).hexdigest()
+
+
+class SignedProcessor({{ cookiecutter.processor_class_name }}):
+    """Processor verifying the ``X-Signature`` header over the raw body."""
+
+    threads: list[int] = []
+
+    def _verify_callback(self, data, headers, **kwargs):
+        type(self).threads.append(threading.get_ident())
+        self._verify_signature(kwargs.get("raw_body"), headers["X-Signature"])
+
+
+@pytest.fixture
+def pool():
+    pool = VerificationPool(max_workers=2, inline_max_bytes=1024)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def signed_processor():
+    SignedProcessor.threads = []
+    config = {"signature_key": KEY, "callback_verify_executor": "thread"}
+    yield SignedProcessor(MockPayment(), config)
+    shutdown_verification_pools()
+
+
+class TestVerificationPool:
+    """Test the inline path, offloading and the bounded queue."""
+
+    async def test_small_bodies_run_inline(self, pool) -> None:
+        ident = await pool.run(threading.get_ident, size=1024)
+        assert ident == threading.get_ident()
+
+    async def test_large_bodies_run_on_a_worker(self, pool) -> None:
+        ident = await pool.run(threading.get_ident, size=1025)
+        assert ident != threading.get_ident()
+
+    async def test_worker_sees_callers_context(self, pool) -> None:
+        with deadline_scope(5) as deadline:
+            assert await pool.run(current_deadline, size=2048) is deadline
+
+    async def test_errors_propagate(self, pool) -> None:
+        def fail():
+            raise InvalidCallbackError("bad signature")
+
+        with pytest.raises(InvalidCallbackError):
+            await pool.run(fail, size=2048)
+
+    async def test_pending_jobs_bounded(self) -> None:
+        pool = VerificationPool(max_workers=8, max_pending=2)
+        release = threading.Event()
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def job():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            release.wait(1)
+            with lock:
+                running -= 1
+
+        try:
+            jobs = [
+                asyncio.ensure_future(pool.run(job, size=1 << 20))
+                for _ in range(6)
+            ]
+            await asyncio.sleep(0.05)
+            assert peak == 2
+            release.set()
+            await asyncio.gather(*jobs)
+        finally:
+            pool.shutdown()
+
+    def test_compute_in_process_pool(self) -> None:
+        pool = VerificationPool("process", max_workers=1, inline_max_bytes=0)
+        verifier = HmacVerifier(KEY)
+        try:
+            assert pool.compute(
+                verifier.verify,
+                memoryview(LARGE_BODY),
+                LARGE_SIGNATURE,
+                size=len(LARGE_BODY),
+            )
+        finally:
+            pool.shutdown()
+
+    def test_thread_pool_computes_inline(self, pool) -> None:
+        assert pool.compute(threading.get_ident, size=1 << 20) == (
+            threading.get_ident()
+        )
+
+    def test_rejects_invalid_configuration(self) -> None:
+        with pytest.raises(ValueError):
+            VerificationPool("fork")
+        with pytest.raises(ValueError):
+            VerificationPool(max_pending=0)
+
+    @pytest.mark.parametrize(
+        ("body", "size"),
+        [(b"abc", 3), (memoryview(b"abcd")[1:], 3), (None, 0), ([b"a"], 0)],
+    )
+    def test_body_size(self, body, size) -> None:
+        assert body_size(body) == size
+
+
+class TestProcessorOffload:
+    """Test ``verify_callback`` with ``callback_verify_executor``."""
+
+    async def test_large_callback_verified_off_loop(
+        self, signed_processor
+    ) -> None:
+        headers = {"X-Signature": LARGE_SIGNATURE}
+        await signed_processor.verify_callback({}, headers, raw_body=LARGE_BODY)
+        assert SignedProcessor.threads != [threading.get_ident()]
+
+    async def test_invalid_signature_rejected(self, signed_processor) -> None:
+        with pytest.raises(InvalidCallbackError):
+            await signed_processor.verify_callback(
+                {}, {"X-Signature": "00" * 32}, raw_body=LARGE_BODY
+            )
+
+    async def test_small_callback_verified_inline(
+        self, signed_processor
+    ) -> None:
+        body = b'{"status": "COMPLETED"}'
+        signature = hmac.new(KEY.encode(), body, hashlib.sha256).hexdigest()
+        await signed_processor.verify_callback(
+            {}, {"X-Signature": signature}, raw_body=body
+        )
+        assert SignedProcessor.threads == [threading.get_ident()]
+
+    async def test_duplicate_skips_offloaded_verification(
+        self, signed_processor, monkeypatch
+    ) -> None:
+        monkeypatch.setattr(
+            signed_processor, "_get_callback_id", lambda data, headers: "evt"
+        )
+        signed_processor.acknowledge_callback({}, {})
+        await signed_processor.verify_callback(
+            {}, {"X-Signature": "00" * 32}, raw_body=LARGE_BODY
+        )
+        assert signed_processor._duplicate_callback
+        assert SignedProcessor.threads == []
+
+    async def test_inline_without_executor(self) -> None:
+        SignedProcessor.threads = []
+        processor = SignedProcessor(MockPayment(), {"signature_key": KEY})
+        assert processor._get_verification_pool() is None
+        await processor.verify_callback(
+            {}, {"X-Signature": LARGE_SIGNATURE}, raw_body=LARGE_BODY
+        )
+        assert SignedProcessor.threads == [threading.get_ident()]
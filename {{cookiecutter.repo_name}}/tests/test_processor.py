@@ -55,7 +55,8 @@ class TestProcessorInit:
             payment=mock_payment,
             config=processor_config,
         )
-        assert proc.get_paywall_baseurl() == {{ cookiecutter.processor_class_name }}.production_url
+        production_url = {{ cookiecutter.processor_class_name }}.production_url
+        assert proc.get_paywall_baseurl() == production_url
 
 
 class TestImplementationContract:
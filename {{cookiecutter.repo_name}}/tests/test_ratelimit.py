@@ -0,0 +1,279 @@
+"""Tests for the token-bucket rate limiter, on a fake clock."""
+
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.client_class_name }}
+from {{ cookiecutter.package_name }} import {{ cookiecutter.processor_class_name }}
+from {{ cookiecutter.package_name }} import ratelimit
+from {{ cookiecutter.package_name }}.deadline import DeadlineExceededError
+from {{ cookiecutter.package_name }}.deadline import deadline_scope
+from {{ cookiecutter.package_name }}.ratelimit import Priority
+from {{ cookiecutter.package_name }}.ratelimit import RateLimiter
+from {{ cookiecutter.package_name }}.ratelimit import current_priority
+from {{ cookiecutter.package_name }}.ratelimit import parse_retry_after
+from {{ cookiecutter.package_name }}.ratelimit import request_priority
+from {{ cookiecutter.package_name }}.resilience import ResiliencePolicy
+from {{ cookiecutter.package_name }}.resilience import RetryPolicy
+
+from .conftest import MockPayment
+
+
+API_URL = "https://sandbox.example.com"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock whose ``sleep`` advances it."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock: FakeClock, rate=10.0, **kwargs) -> RateLimiter:
+    return RateLimiter(rate, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def _response(status: int = 200, **headers: str) -> httpx.Response:
+    return httpx.Response(status, headers=headers)
+
+
+class PriorityProcessor({{ cookiecutter.processor_class_name }}):
+    """Processor reporting the priority its status fetch runs with."""
+
+    async def fetch_payment_status(self, **kwargs):
+        return current_priority()
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiters(monkeypatch):
+    monkeypatch.setattr(ratelimit, "_limiters", {})
+
+
+class TestTokenBucket:
+    """Test token accounting and priorities."""
+
+    def test_burst_then_rate(self) -> None:
+        limiter = _limiter(FakeClock(), rate=10, burst=3)
+        waits = [limiter.try_acquire() for _ in range(4)]
+        assert waits[:3] == [0, 0, 0]
+        assert waits[3] == pytest.approx(0.1)
+
+    def test_refills_up_to_burst(self) -> None:
+        clock = FakeClock()
+        limiter = _limiter(clock, rate=10, burst=2)
+        limiter.try_acquire()
+        limiter.try_acquire()
+        clock.now = 60
+        waits = [limiter.try_acquire() for _ in range(3)]
+        assert waits[:2] == [0, 0]
+        assert waits[2] > 0
+
+    def test_batch_leaves_reserve_for_interactive(self) -> None:
+        limiter = _limiter(FakeClock(), rate=10, interactive_reserve=0.2)
+        batch = [limiter.try_acquire(Priority.BATCH) for _ in range(9)]
+        assert batch[:8] == [0] * 8
+        assert batch[8] > 0
+        assert limiter.try_acquire(Priority.INTERACTIVE) == 0
+        assert limiter.try_acquire(Priority.INTERACTIVE) == 0
+
+    def test_interactive_waits_less_than_batch(self) -> None:
+        limiter = _limiter(FakeClock(), rate=10, burst=2)
+        limiter.try_acquire()
+        limiter.try_acquire()
+        interactive = limiter.try_acquire(Priority.INTERACTIVE)
+        batch = limiter.try_acquire(Priority.BATCH)
+        assert interactive < batch
+
+    @pytest.mark.parametrize(("rate", "burst"), [(1, None), (2, 1), (5, 1.1)])
+    def test_batch_served_by_small_buckets(self, rate, burst) -> None:
+        clock = FakeClock()
+        limiter = _limiter(clock, rate=rate, burst=burst)
+        assert limiter.try_acquire(Priority.BATCH) == 0
+        wait = limiter.try_acquire(Priority.BATCH)
+        assert 0 < wait <= 1
+        clock.now += wait
+        assert limiter.try_acquire(Priority.BATCH) == 0
+
+    def test_unlimited_by_default(self) -> None:
+        limiter = RateLimiter(clock=FakeClock())
+        assert all(limiter.try_acquire() == 0 for _ in range(1000))
+
+    async def test_acquire_paces_requests(self) -> None:
+        clock = FakeClock()
+        limiter = _limiter(clock, rate=2, burst=1)
+        for _ in range(5):
+            await limiter.acquire()
+        assert clock.now == pytest.approx(2.0)
+
+    async def test_acquire_uses_context_priority(self) -> None:
+        clock = FakeClock()
+        limiter = _limiter(clock, rate=10, interactive_reserve=0.5)
+        with request_priority(Priority.BATCH):
+            for _ in range(6):
+                await limiter.acquire()
+        assert clock.now > 0
+        assert current_priority() is Priority.INTERACTIVE
+
+    async def test_wait_beyond_deadline_fails_fast(self) -> None:
+        clock = FakeClock()
+        limiter = _limiter(clock, rate=1, burst=1)
+        await limiter.acquire()
+        with deadline_scope(0.5), pytest.raises(DeadlineExceededError):
+            await limiter.acquire()
+        assert clock.sleeps == []
+
+
+class TestAdaptation:
+    """Test adapting to the gateway's rate-limit headers."""
+
+    def test_retry_after_pauses_all_priorities(self) -> None:
+        clock = FakeClock()
+        limiter = _limiter(clock)
+        limiter.observe(_response(429, **{"Retry-After": "3"}))
+        assert limiter.try_acquire(Priority.INTERACTIVE) == 3
+        assert limiter.try_acquire(Priority.BATCH) == 3
+        clock.now = 3
+        assert limiter.try_acquire() == 0
+
+    def test_pause_capped(self) -> None:
+        limiter = _limiter(FakeClock(), max_pause=30)
+        limiter.observe(_response(429, **{"Retry-After": "86400"}))
+        assert limiter.try_acquire() == 30
+
+    def test_retry_after_ignored_on_success(self) -> None:
+        limiter = _limiter(FakeClock())
+        limiter.observe(_response(200, **{"Retry-After": "3"}))
+        assert limiter.try_acquire() == 0
+
+    def test_429_drains_bucket(self) -> None:
+        limiter = _limiter(FakeClock(), rate=10)
+        limiter.observe(_response(429))
+        assert limiter.try_acquire() == pytest.approx(0.1)
+
+    def test_remaining_caps_tokens(self) -> None:
+        limiter = _limiter(FakeClock(), rate=10)
+        limiter.observe(_response(**{"RateLimit-Remaining": "2"}))
+        waits = [limiter.try_acquire() for _ in range(3)]
+        assert waits[:2] == [0, 0]
+        assert waits[2] > 0
+
+    def test_exhausted_quota_pauses_until_reset(self) -> None:
+        limiter = _limiter(FakeClock())
+        limiter.observe(
+            _response(
+                **{"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "5"}
+            )
+        )
+        assert limiter.try_acquire() == 5
+
+    def test_reset_as_timestamp(self) -> None:
+        reset = datetime.now(UTC).timestamp() + 30
+        limiter = _limiter(FakeClock())
+        limiter.observe(
+            _response(
+                **{"RateLimit-Remaining": "0", "RateLimit-Reset": str(reset)}
+            )
+        )
+        assert 25 < limiter.try_acquire() <= 30
+
+    def test_unlimited_limiter_still_honours_retry_after(self) -> None:
+        limiter = RateLimiter(clock=FakeClock())
+        limiter.observe(_response(503, **{"Retry-After": "2"}))
+        assert limiter.try_acquire() == 2
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("120", 120.0), ("0", 0.0), ("-5", 0.0), (None, None), ("soon", None)],
+    )
+    def test_parse_retry_after_seconds(self, value, expected) -> None:
+        assert parse_retry_after(value) == expected
+
+    def test_parse_retry_after_date(self) -> None:
+        retry_at = datetime.now(UTC) + timedelta(seconds=60)
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert delay is not None
+        assert 55 < delay <= 60
+
+
+class TestPolicyIntegration:
+    """Test the limiter inside the resilience policy."""
+
+    def _client(self, handler, clock: FakeClock):
+        policy = ResiliencePolicy(
+            retry=RetryPolicy(max_attempts=3, backoff_base=0),
+            limiter=_limiter(clock, rate=None),
+        )
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return {{ cookiecutter.client_class_name }}(API_URL, client=http_client, policy=policy)
+
+    async def test_throttled_get_retried_after_retry_after(self) -> None:
+        clock = FakeClock()
+        responses = iter([_response(429, **{"Retry-After": "2"}), _response()])
+        client = self._client(lambda request: next(responses), clock)
+        response = await client.request("GET", "/status")
+        assert response.status_code == 200
+        assert clock.sleeps == [2]
+
+    async def test_throttled_post_returned_but_pauses_next(self) -> None:
+        clock = FakeClock()
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            return _response(429, **{"Retry-After": "1"})
+
+        client = self._client(handler, clock)
+        response = await client.request("POST", "/payments")
+        assert response.status_code == 429
+        assert calls == ["POST"]
+        await client.request("POST", "/payments")
+        assert clock.sleeps == [1]
+
+    async def test_429_does_not_open_circuit(self) -> None:
+        clock = FakeClock()
+        client = self._client(lambda request: _response(429), clock)
+        for _ in range(5):
+            await client.request("GET", "/status")
+        assert client.policy.breaker.state == "closed"
+
+
+class TestProcessorRateLimit:
+    """Test rate limit settings and batch priority."""
+
+    def test_limits_from_settings(self) -> None:
+        processor = {{ cookiecutter.processor_class_name }}(
+            MockPayment(),
+            {
+                "rate_limit": 5,
+                "rate_limit_burst": 10,
+                "rate_limit_max_pause": 3,
+            },
+        )
+        limiter = processor._get_resilience_policy().limiter
+        assert (limiter.rate, limiter.burst, limiter.max_pause) == (5, 10, 3)
+
+    async def test_batch_fetches_use_batch_priority(self) -> None:
+        payment = MockPayment()
+        payment.external_id = "pay-1"
+        results = [
+            result
+            async for result in PriorityProcessor.fetch_payment_statuses(
+                [payment]
+            )
+        ]
+        assert results[0].update is Priority.BATCH
+        processor = PriorityProcessor(payment)
+        assert await processor.fetch_payment_status() is Priority.INTERACTIVE
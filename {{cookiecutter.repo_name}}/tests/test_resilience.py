@@ -0,0 +1,227 @@
+"""Tests for retries, hedging and circuit breaking."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.client_class_name }}
+from {{ cookiecutter.package_name }}.resilience import CircuitBreaker
+from {{ cookiecutter.package_name }}.resilience import CircuitOpenError
+from {{ cookiecutter.package_name }}.resilience import LatencyWindow
+from {{ cookiecutter.package_name }}.resilience import ResiliencePolicy
+from {{ cookiecutter.package_name }}.resilience import RetryPolicy
+
+
+API_URL = "https://sandbox.example.com"
+NO_BACKOFF = RetryPolicy(max_attempts=3, backoff_base=0)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FlakyGateway:
+    """Mock gateway failing the first ``failures`` requests."""
+
+    def __init__(self, failures: int, error: Exception | int = 503) -> None:
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.calls <= self.failures:
+            if isinstance(self.error, Exception):
+                raise self.error
+            return httpx.Response(self.error)
+        return httpx.Response(200, json={"ok": True})
+
+
+class ClosingStream(httpx.AsyncByteStream):
+    """Response body recording whether it was closed."""
+
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def __aiter__(self):
+        yield b""
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def _client(handler, **policy_kwargs) -> {{ cookiecutter.client_class_name }}:
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    policy = ResiliencePolicy(retry=NO_BACKOFF, **policy_kwargs)
+    return {{ cookiecutter.client_class_name }}(API_URL, client=http_client, policy=policy)
+
+
+class TestRetry:
+    """Test jittered exponential retries."""
+
+    async def test_retries_idempotent_request(self) -> None:
+        gateway = FlakyGateway(failures=2)
+        response = await _client(gateway).request("GET", "/status")
+        assert response.status_code == 200
+        assert gateway.calls == 3
+
+    async def test_returns_last_response_when_exhausted(self) -> None:
+        gateway = FlakyGateway(failures=5)
+        response = await _client(gateway).request("GET", "/status")
+        assert response.status_code == 503
+        assert gateway.calls == 3
+
+    async def test_does_not_retry_non_idempotent_request(self) -> None:
+        gateway = FlakyGateway(failures=1)
+        response = await _client(gateway).request("POST", "/payments")
+        assert response.status_code == 503
+        assert gateway.calls == 1
+
+    async def test_explicitly_idempotent_post_is_retried(self) -> None:
+        gateway = FlakyGateway(failures=1)
+        client = _client(gateway)
+        response = await client.request("POST", "/payments", idempotent=True)
+        assert response.status_code == 200
+
+    async def test_retries_transport_errors(self) -> None:
+        gateway = FlakyGateway(failures=2, error=httpx.ReadTimeout("slow"))
+        response = await _client(gateway).request("GET", "/status")
+        assert response.status_code == 200
+
+    async def test_connect_errors_are_retried_for_any_method(self) -> None:
+        gateway = FlakyGateway(failures=1, error=httpx.ConnectError("down"))
+        response = await _client(gateway).request("POST", "/payments")
+        assert response.status_code == 200
+
+    async def test_read_errors_not_retried_for_post(self) -> None:
+        gateway = FlakyGateway(failures=1, error=httpx.ReadError("reset"))
+        with pytest.raises(httpx.ReadError):
+            await _client(gateway).request("POST", "/payments")
+
+    def test_backoff_is_bounded(self) -> None:
+        policy = RetryPolicy(backoff_base=0.1, backoff_max=0.5)
+        for attempt in range(1, 10):
+            assert 0 <= policy.backoff(attempt) <= 0.5
+
+
+class TestCircuitBreaker:
+    """Test the per-endpoint circuit breaker."""
+
+    def test_opens_after_threshold(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+    def test_half_open_allows_single_trial(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_failed_trial_reopens(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+    def test_abandoned_trial_expires(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.allow()
+        clock.now = 20
+        assert breaker.allow()
+
+    async def test_fails_fast_while_open(self) -> None:
+        gateway = FlakyGateway(failures=100)
+        breaker = CircuitBreaker(failure_threshold=3, clock=FakeClock())
+        client = _client(gateway, breaker=breaker)
+        await client.request("GET", "/status")
+        with pytest.raises(CircuitOpenError):
+            await client.request("GET", "/status")
+        assert gateway.calls == 3
+
+    async def test_processor_policy_from_settings(self, processor) -> None:
+        processor.config.update(
+            retry_max_attempts=5,
+            circuit_failure_threshold=2,
+            hedge_percentile=0.9,
+        )
+        policy = processor._get_client().policy
+        assert policy.retry.max_attempts == 5
+        assert policy.hedge_percentile == 0.9
+
+
+class TestHedging:
+    """Test hedged duplicate requests."""
+
+    async def test_hedge_wins_over_slow_request(self) -> None:
+        calls = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(1)
+                return httpx.Response(200, json={"winner": "original"})
+            return httpx.Response(200, json={"winner": "hedge"})
+
+        latencies = LatencyWindow()
+        for _ in range(50):
+            latencies.record(0.01)
+        client = _client(handler, latencies=latencies, hedge_percentile=0.95)
+        response = await asyncio.wait_for(client.request("GET", "/s"), 0.5)
+        assert response.json() == {"winner": "hedge"}
+        assert calls == 2
+
+    async def test_closes_responses_finishing_together(self) -> None:
+        released = asyncio.Event()
+        responses = []
+
+        async def send() -> httpx.Response:
+            response = httpx.Response(200, stream=ClosingStream())
+            responses.append(response)
+            if len(responses) == 2:
+                asyncio.get_running_loop().call_soon(released.set)
+            await released.wait()
+            return response
+
+        latencies = LatencyWindow()
+        for _ in range(50):
+            latencies.record(0.01)
+        policy = ResiliencePolicy(latencies=latencies, hedge_percentile=0.95)
+        response = await policy.execute(send, idempotent=True)
+        others = [other for other in responses if other is not response]
+        assert len(others) == 1
+        assert others[0].stream.closed
+        assert not response.stream.closed
+
+    async def test_no_hedge_without_latency_data(self) -> None:
+        gateway = FlakyGateway(failures=0)
+        client = _client(gateway, hedge_percentile=0.95)
+        await client.request("GET", "/status")
+        assert gateway.calls == 1
+
+    def test_percentile(self) -> None:
+        window = LatencyWindow()
+        for value in range(100):
+            window.record(value / 100)
+        assert window.percentile(0.95) == pytest.approx(0.95)
@@ -0,0 +1,147 @@
+"""Tests for the bounded response log."""
+
+import gc
+import tracemalloc
+
+import httpx
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.client_class_name }}
+from {{ cookiecutter.package_name }} import {{ cookiecutter.processor_class_name }}
+from {{ cookiecutter.package_name }} import response_log
+from {{ cookiecutter.package_name }}.api import ApiCall
+from {{ cookiecutter.package_name }}.resilience import ResiliencePolicy
+from {{ cookiecutter.package_name }}.response_log import ResponseLog
+from {{ cookiecutter.package_name }}.transport import aclose_pooled_clients
+
+from .conftest import MockPayment
+
+
+API_URL = "https://sandbox.example.com"
+BODY_SIZE = 1024 * 1024
+
+
+async def _body(size: int, chunk: bytes = b"x"):
+    yield chunk * size
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    size = int(request.url.params.get("size", BODY_SIZE))
+    headers = {"X-Request-Id": "req-1", "Set-Cookie": "secret"}
+    return httpx.Response(200, headers=headers, content=_body(size))
+
+
+def _client(
+    response_log: ResponseLog | None,
+) -> {{ cookiecutter.client_class_name }}:
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return {{ cookiecutter.client_class_name }}(
+        API_URL,
+        client=http_client,
+        policy=ResiliencePolicy(),
+        response_log=response_log,
+    )
+
+
+class TestResponseLog:
+    """Test response summaries and ring buffer bounds."""
+
+    async def test_summary_fields(self) -> None:
+        log = ResponseLog()
+        await _client(log).request("GET", "/orders", params={"size": 10})
+        summary = log.last
+        assert summary.method == "GET"
+        assert summary.url == f"{API_URL}/orders?size=10"
+        assert summary.status_code == 200
+        assert summary.size == 10
+        assert summary.elapsed is not None
+        assert summary.headers == {"x-request-id": "req-1"}
+        assert summary.body is None
+
+    async def test_ring_buffer_is_bounded(self) -> None:
+        log = ResponseLog(3)
+        client = _client(log)
+        for size in range(5):
+            await client.request("GET", "/orders", params={"size": size})
+        assert [summary.size for summary in log] == [2, 3, 4]
+
+    async def test_bodies_kept_in_debug_mode(self) -> None:
+        log = ResponseLog(keep_bodies=True)
+        await _client(log).request("GET", "/orders", params={"size": 4})
+        assert log.last.body == b"xxxx"
+
+    async def test_streamed_response_logged_after_close(self) -> None:
+        log = ResponseLog(keep_bodies=True)
+
+        def ndjson(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={"Content-Type": "application/x-ndjson"},
+                content=_body(2, b'{"id": 1}\n'),
+            )
+
+        client = {{ cookiecutter.client_class_name }}(
+            API_URL,
+            client=httpx.AsyncClient(transport=httpx.MockTransport(ndjson)),
+            response_log=log,
+        )
+        records = [record async for record in client.stream_records("GET", "/")]
+        assert len(records) == 2
+        assert len(log) == 1
+        assert log.last.body is None
+
+    async def test_disabled_by_default(self) -> None:
+        client = _client(None)
+        await client.request("GET", "/orders", params={"size": 1})
+        assert client.response_log is None
+
+
+class TestProcessorResponseLog:
+    """Test the shared log behind ``get_response_log()``."""
+
+    async def test_log_outlives_operation_clients(self, monkeypatch) -> None:
+        monkeypatch.setattr(response_log, "_logs", {})
+        config = {
+            "transport": httpx.MockTransport(handler),
+            "response_log_size": 5,
+        }
+        call = ApiCall(
+            "GET",
+            "/orders",
+            lambda response: response.status_code,
+            options={"params": {"size": 1}},
+        )
+        processors = []
+        try:
+            for _ in range(2):
+                processor = {{ cookiecutter.processor_class_name }}(MockPayment(), config)
+                await processor._call(call)
+                processors.append(processor)
+        finally:
+            await aclose_pooled_clients()
+        log = processors[0].get_response_log()
+        assert log is processors[1].get_response_log()
+        assert len(log) == 2
+        assert log.last.headers == {"x-request-id": "req-1"}
+
+    def test_disabled_by_default(self) -> None:
+        processor = {{ cookiecutter.processor_class_name }}(MockPayment())
+        assert processor.get_response_log() is None
+
+
+class TestResponseLogMemory:
+    """Memory regression test: responses must not be pinned."""
+
+    async def test_large_bodies_are_not_retained(self) -> None:
+        client = _client(ResponseLog(50))
+        tracemalloc.start()
+        try:
+            for _ in range(20):
+                response = await client.request("GET", "/report")
+                assert len(response.content) == BODY_SIZE
+            del response
+            gc.collect()
+            retained, _peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert len(client.response_log) == 20
+        assert retained < BODY_SIZE // 4
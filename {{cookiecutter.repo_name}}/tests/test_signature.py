@@ -0,0 +1,94 @@
+"""Tests for raw-body callback signature verification."""
+
+import base64
+import hashlib
+import hmac
+import pickle
+
+import pytest
+from getpaid_core.exceptions import CredentialsError
+from getpaid_core.exceptions import InvalidCallbackError
+
+from {{ cookiecutter.package_name }}.signature import HmacVerifier
+from {{ cookiecutter.package_name }}.signature import get_hmac_verifier
+
+
+KEY = b"secret-key"
+BODY = b'{"orderId": "123", "status": "COMPLETED"}'
+SIGNATURE = hmac.new(KEY, BODY, hashlib.sha256).hexdigest()
+
+
+async def _achunks(body: bytes, size: int):
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+class TestHmacVerifier:
+    """Test HMAC verification over raw bytes."""
+
+    def test_valid_signature(self) -> None:
+        assert HmacVerifier(KEY).verify(BODY, SIGNATURE)
+
+    def test_str_key_and_bytes_signature(self) -> None:
+        verifier = HmacVerifier(KEY.decode())
+        assert verifier.verify(BODY, SIGNATURE.encode())
+
+    def test_invalid_signature(self) -> None:
+        assert not HmacVerifier(KEY).verify(BODY + b" ", SIGNATURE)
+
+    def test_malformed_signature(self) -> None:
+        assert not HmacVerifier(KEY).verify(BODY, "not-hex")
+
+    def test_memoryview_body(self) -> None:
+        assert HmacVerifier(KEY).verify(memoryview(BODY), SIGNATURE)
+
+    def test_chunked_body(self) -> None:
+        chunks = [BODY[:10], memoryview(BODY)[10:]]
+        assert HmacVerifier(KEY).verify(chunks, SIGNATURE)
+
+    async def test_streamed_body(self) -> None:
+        verifier = HmacVerifier(KEY)
+        assert await verifier.averify(_achunks(BODY, 7), SIGNATURE)
+
+    def test_base64_encoding(self) -> None:
+        digest = hmac.new(KEY, BODY, hashlib.sha512).digest()
+        verifier = HmacVerifier(KEY, digestmod="sha512", encoding="base64")
+        assert verifier.verify(BODY, base64.b64encode(digest))
+
+    def test_verifier_is_reusable(self) -> None:
+        verifier = HmacVerifier(KEY)
+        assert not verifier.verify(b"other", SIGNATURE)
+        assert verifier.verify(BODY, SIGNATURE)
+
+    def test_verifiers_are_shared_per_config(self) -> None:
+        assert get_hmac_verifier(KEY) is get_hmac_verifier(KEY)
+        assert get_hmac_verifier(KEY) is not get_hmac_verifier(b"other")
+
+    def test_pickled_by_configuration(self) -> None:
+        verifier = HmacVerifier(KEY, digestmod="sha512", encoding="base64")
+        restored = pickle.loads(pickle.dumps(verifier))
+        assert restored.digestmod == "sha512"
+        assert restored.encoding == "base64"
+        assert restored.digest(BODY) == verifier.digest(BODY)
+
+
+class TestProcessorSignature:
+    """Test the processor's raw-body signature helper."""
+
+    def test_valid_signature(self, processor) -> None:
+        processor.config["signature_key"] = KEY.decode()
+        processor._verify_signature(BODY, SIGNATURE)
+
+    def test_invalid_signature(self, processor) -> None:
+        processor.config["signature_key"] = KEY.decode()
+        with pytest.raises(InvalidCallbackError):
+            processor._verify_signature(BODY, "00" * 32)
+
+    def test_missing_body(self, processor) -> None:
+        processor.config["signature_key"] = KEY.decode()
+        with pytest.raises(InvalidCallbackError):
+            processor._verify_signature(None, SIGNATURE)
+
+    def test_missing_key(self, processor) -> None:
+        with pytest.raises(CredentialsError):
+            processor._verify_signature(BODY, SIGNATURE)
@@ -0,0 +1,175 @@
+"""Tests for streamed JSON/NDJSON record decoding."""
+
+import json
+import resource
+import sys
+
+import httpx
+import pytest
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.client_class_name }}
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from {{ cookiecutter.package_name }}.resilience import ResiliencePolicy
+from {{ cookiecutter.package_name }}.resilience import RetryPolicy
+{%- endif %}
+from {{ cookiecutter.package_name }}.streaming import JsonArrayDecoder
+
+
+API_URL = "https://sandbox.example.com"
+RECORDS = [
+    {"id": 1, "amount": "10.00", "tags": ["a", "b"]},
+    {"id": 2, "note": "comma, bracket ] and brace }"},
+    123,
+    "text",
+    None,
+]
+RECORD = b'{"id": 123456, "amount": "100.00", "currency": "PLN"}'
+# Peak RSS growth allowed while streaming a large response.
+RSS_CEILING_BYTES = 64 * 1024 * 1024
+
+
+def _client(handler, **kwargs) -> {{ cookiecutter.client_class_name }}:
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return {{ cookiecutter.client_class_name }}(
+        API_URL,
+        client=http_client,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        policy=ResiliencePolicy(retry=RetryPolicy(backoff_base=0)),
+{%- endif %}
+        **kwargs,
+    )
+
+
+def _max_rss_bytes() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+async def _synthetic_array(total_bytes: int, chunk_records: int = 1000):
+    """Yield a JSON array of ``RECORD`` copies, about ``total_bytes`` long."""
+    chunk = b"," + b",".join([RECORD] * chunk_records)
+    yield b"[" + RECORD
+    for _ in range(total_bytes // len(chunk)):
+        yield chunk
+    yield b"]"
+
+
+class TestJsonArrayDecoder:
+    """Test incremental JSON array decoding."""
+
+    def test_every_split_point(self) -> None:
+        text = json.dumps(RECORDS, indent=1)
+        for split in range(len(text) + 1):
+            decoder = JsonArrayDecoder()
+            records = decoder.feed(text[:split]) + decoder.feed(text[split:])
+            decoder.close()
+            assert records == RECORDS, f"split at {split}"
+
+    def test_empty_array(self) -> None:
+        decoder = JsonArrayDecoder()
+        assert decoder.feed(" [ ] ") == []
+        decoder.close()
+
+    def test_truncated_number_is_not_emitted_early(self) -> None:
+        decoder = JsonArrayDecoder()
+        assert decoder.feed("[12") == []
+        assert decoder.feed("3]") == [123]
+
+    def test_truncated_input(self) -> None:
+        decoder = JsonArrayDecoder()
+        decoder.feed('[{"id": 1}, {"id"')
+        with pytest.raises(ValueError):
+            decoder.close()
+
+    def test_not_an_array(self) -> None:
+        with pytest.raises(ValueError):
+            JsonArrayDecoder().feed('{"id": 1}')
+
+    def test_missing_separator(self) -> None:
+        with pytest.raises(ValueError):
+            JsonArrayDecoder().feed("[1 2]")
+
+
+class TestStreamRecords:
+    """Test the client's streaming record iterator."""
+
+    async def test_json_array(self) -> None:
+        body = json.dumps(RECORDS).encode()
+
+        async def chunks():
+            for start in range(0, len(body), 5):
+                yield body[start : start + 5]
+
+        client = _client(lambda request: httpx.Response(200, content=chunks()))
+        records = [
+            record async for record in client.stream_records("GET", "/list")
+        ]
+        assert records == RECORDS
+
+    async def test_ndjson_detected_from_content_type(self) -> None:
+        body = "\n".join(json.dumps(record) for record in RECORDS) + "\n"
+        client = _client(
+            lambda request: httpx.Response(
+                200,
+                content=body.encode(),
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+        )
+        records = [
+            record async for record in client.stream_records("GET", "/list")
+        ]
+        assert records == RECORDS
+
+    async def test_http_error(self) -> None:
+        client = _client(lambda request: httpx.Response(503))
+        with pytest.raises(httpx.HTTPStatusError):
+            async for _ in client.stream_records("GET", "/list"):
+                pass
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+    async def test_retried_through_policy(self) -> None:
+        statuses = iter([503, 200])
+        client = _client(
+            lambda request: httpx.Response(next(statuses), json=RECORDS)
+        )
+        records = [
+            record async for record in client.stream_records("GET", "/list")
+        ]
+        assert records == RECORDS
+{%- endif %}
+
+    async def test_authenticated(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/oauth/token":
+                return httpx.Response(200, json={"access_token": "abc"})
+            assert request.headers["Authorization"] == "Bearer abc"
+            return httpx.Response(200, json=RECORDS)
+
+        client = _client(handler, client_id="id", client_secret="secret")
+        records = [
+            record
+            async for record in client.stream_records(
+                "GET", "/list", authenticated=True
+            )
+        ]
+        assert records == RECORDS
+
+    @pytest.mark.parametrize(
+        "total_bytes",
+        [
+            pytest.param(20 * 1024 * 1024, id="20MB"),
+            pytest.param(500 * 1024 * 1024, id="500MB", marks=pytest.mark.slow),
+        ],
+    )
+    async def test_memory_stays_bounded(self, total_bytes: int) -> None:
+        client = _client(
+            lambda request: httpx.Response(
+                200, content=_synthetic_array(total_bytes)
+            )
+        )
+        rss_before = _max_rss_bytes()
+        count = 0
+        async for _ in client.stream_records("GET", "/report"):
+            count += 1
+        assert count * len(RECORD) >= total_bytes * 0.9
+        assert _max_rss_bytes() - rss_before < RSS_CEILING_BYTES
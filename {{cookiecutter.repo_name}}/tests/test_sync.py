@@ -0,0 +1,262 @@
+"""Tests for the sync client and processor adapter."""
+
+import threading
+import time
+
+import httpx
+import pytest
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.processor_class_name }}
+from {{ cookiecutter.package_name }} import {{ cookiecutter.__sync_client_class_name }}
+from {{ cookiecutter.package_name }} import {{ cookiecutter.__sync_processor_class_name }}
+from {{ cookiecutter.package_name }}.api import ApiCall
+from {{ cookiecutter.package_name }}.auth import AccessToken
+from {{ cookiecutter.package_name }}.auth import TokenCache
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from {{ cookiecutter.package_name }}.metrics import RequestMetrics
+from {{ cookiecutter.package_name }}.resilience import ResiliencePolicy
+from {{ cookiecutter.package_name }}.resilience import RetryPolicy
+from {{ cookiecutter.package_name }}.transport import SyncTransportPool
+from {{ cookiecutter.package_name }}.transport import aclose_pooled_clients
+from {{ cookiecutter.package_name }}.transport import close_pooled_clients
+{%- endif %}
+
+from .conftest import MockPayment
+
+
+API_URL = "https://sandbox.example.com"
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+NO_BACKOFF = RetryPolicy(max_attempts=3, backoff_base=0)
+{%- endif %}
+
+
+class Gateway:
+    """Mock gateway issuing tokens and rejecting the first one."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.calls = 0
+        self.tokens = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/oauth/token":
+            self.tokens += 1
+            return httpx.Response(
+                200, json={"access_token": f"t{self.tokens}", "expires_in": 60}
+            )
+        self.calls += 1
+        if self.calls <= self.failures:
+            return httpx.Response(503)
+        if request.headers.get("Authorization") == "Bearer t1":
+            return httpx.Response(401)
+        return httpx.Response(200, json={"id": "pay-1"})
+
+
+def _client(gateway: Gateway) -> {{ cookiecutter.__sync_client_class_name }}:
+    return {{ cookiecutter.__sync_client_class_name }}(
+        API_URL,
+        client=httpx.Client(transport=httpx.MockTransport(gateway)),
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        policy=ResiliencePolicy(retry=NO_BACKOFF),
+{%- endif %}
+        token_cache=TokenCache(),
+    )
+
+
+def _payment_id(response: httpx.Response) -> str:
+    return response.raise_for_status().json()["id"]
+
+
+class TestSyncClient:
+    """Test the blocking client."""
+
+    def test_request(self) -> None:
+        gateway = Gateway()
+        with _client(gateway) as client:
+            response = client.request("GET", "/payments/pay-1")
+        assert response.json() == {"id": "pay-1"}
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+    def test_retries_idempotent_request(self) -> None:
+        gateway = Gateway(failures=2)
+        response = _client(gateway).request("GET", "/payments/pay-1")
+        assert response.status_code == 200
+        assert gateway.calls == 3
+{%- endif %}
+
+    def test_refreshes_rejected_token(self) -> None:
+        gateway = Gateway()
+        response = _client(gateway).request(
+            "GET", "/payments/pay-1", authenticated=True
+        )
+        assert response.status_code == 200
+        assert gateway.tokens == 2
+
+    def test_call(self) -> None:
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        call = ApiCall("POST", "/payments", _payment_id, idempotent=True)
+        assert _client(Gateway(failures=1)).call(call) == "pay-1"
+{%- else %}
+        call = ApiCall("POST", "/payments", _payment_id)
+        assert _client(Gateway()).call(call) == "pay-1"
+{%- endif %}
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+    def test_uses_pooled_client(self) -> None:
+        pool = SyncTransportPool()
+        client = {{ cookiecutter.__sync_client_class_name }}(API_URL, pool=pool)
+        assert client.client is pool.get(API_URL)
+        pool.close()
+
+
+class TestSyncTransportPool:
+    """Test pooled sync client reuse and lifecycle."""
+
+    def test_reuses_client_across_threads(self) -> None:
+        pool = SyncTransportPool()
+        clients = []
+        threads = [
+            threading.Thread(target=lambda: clients.append(pool.get(API_URL)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(set(map(id, clients))) == 1
+        assert pool.open_clients() == 1
+        pool.close()
+
+    def test_close(self) -> None:
+        pool = SyncTransportPool()
+        client = pool.get(API_URL)
+        pool.close()
+        assert client.is_closed
+        assert pool.open_clients() == 0
+        assert pool.get(API_URL) is not client
+        pool.close()
+
+
+class TestSyncMetrics:
+    """Test metrics recorded through sync event hooks."""
+
+    def test_records_per_operation(self) -> None:
+        metrics = RequestMetrics()
+        http_client = httpx.Client(
+            transport=httpx.MockTransport(Gateway()),
+            event_hooks=metrics.sync_event_hooks(),
+        )
+        client = {{ cookiecutter.__sync_client_class_name }}(API_URL, client=http_client)
+        client.request("GET", "/payments/pay-1", operation="get_payment")
+        snapshot = metrics.snapshot()["get_payment"]
+        assert snapshot["status"] == {200: 1}
+        assert snapshot["total_seconds"]["count"] == 1
+        http_client.close()
+{%- else %}
+
+    def test_closes_own_client(self) -> None:
+        transport = httpx.MockTransport(Gateway())
+        with {{ cookiecutter.__sync_client_class_name }}(API_URL, transport=transport) as client:
+            http_client = client.client
+            client.request("GET", "/payments/pay-1")
+        assert http_client.is_closed
+{%- endif %}
+
+
+class TestSyncTokenCache:
+    """Test the blocking token cache."""
+
+    def test_single_fetch_across_threads(self) -> None:
+        cache = TokenCache()
+        calls = []
+
+        def fetch() -> AccessToken:
+            calls.append(1)
+            time.sleep(0.05)
+            return AccessToken("t", time.monotonic() + 300)
+
+        tokens = []
+        threads = [
+            threading.Thread(
+                target=lambda: tokens.append(cache.get_sync("key", fetch))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 1
+        assert {token.value for token in tokens} == {"t"}
+
+    def test_failed_refresh_serves_current_token(self) -> None:
+        cache = TokenCache(refresh_margin=60)
+        current = AccessToken("old", time.monotonic() + 30)
+        cache.get_sync("key", lambda: current)
+
+        def fail() -> AccessToken:
+            raise httpx.ConnectError("down")
+
+        assert cache.get_sync("key", fail) is current
+
+
+class RegisteringProcessor({{ cookiecutter.processor_class_name }}):
+    """Processor registering payments with one gateway call."""
+
+    def _prepare_transaction_call(self, **kwargs):
+        return ApiCall(
+            "POST",
+            "/payments",
+            lambda response: {"redirect_url": _payment_id(response)},
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+            idempotent=True,
+            operation="prepare_transaction",
+{%- endif %}
+        )
+
+
+class RegisteringSyncProcessor({{ cookiecutter.__sync_processor_class_name }}):
+    """Sync adapter for :class:`RegisteringProcessor`."""
+
+    processor_class = RegisteringProcessor
+
+
+class TestSyncProcessor:
+    """Test the blocking processor adapter."""
+
+    @pytest.fixture
+    def config(self):
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        yield {"sync_transport": httpx.MockTransport(Gateway())}
+        close_pooled_clients()
+{%- else %}
+        return {"sync_transport": httpx.MockTransport(Gateway())}
+{%- endif %}
+
+    def test_prepare_transaction(self, config) -> None:
+        adapter = RegisteringSyncProcessor(MockPayment(), config)
+        assert adapter.prepare_transaction() == {"redirect_url": "pay-1"}
+
+    async def test_shares_api_call_with_async_processor(self) -> None:
+        config = {"transport": httpx.MockTransport(Gateway())}
+        processor = RegisteringProcessor(MockPayment(), config)
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        try:
+            result = await processor.prepare_transaction()
+        finally:
+            await aclose_pooled_clients()
+{%- else %}
+        result = await processor.prepare_transaction()
+{%- endif %}
+        assert result == {"redirect_url": "pay-1"}
+
+    def test_unimplemented_operations(self, config) -> None:
+        adapter = {{ cookiecutter.__sync_processor_class_name }}(MockPayment(), config)
+        with pytest.raises(NotImplementedError):
+            adapter.fetch_payment_status()
+
+    def test_callbacks(self, config) -> None:
+        adapter = {{ cookiecutter.__sync_processor_class_name }}(MockPayment(), config)
+        adapter.verify_callback({}, {})
+        assert adapter.handle_callback({}, {}) is None
+        assert adapter.payment is adapter.processor.payment
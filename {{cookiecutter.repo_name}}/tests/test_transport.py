@@ -0,0 +1,100 @@
+"""Tests for the pooled HTTP transport."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from {{ cookiecutter.package_name }} import {{ cookiecutter.client_class_name }}
+from {{ cookiecutter.package_name }}.transport import TransportPool
+from {{ cookiecutter.package_name }}.transport import TransportSettings
+
+
+API_URL = "https://sandbox.example.com"
+
+
+@pytest.fixture
+async def pool():
+    """Provide an isolated transport pool, closed after the test."""
+    pool = TransportPool()
+    yield pool
+    await pool.aclose()
+
+
+class TestTransportSettings:
+    """Test connection pool settings."""
+
+    def test_limits(self) -> None:
+        settings = TransportSettings(
+            max_connections=10,
+            max_keepalive_connections=5,
+            keepalive_expiry=1.5,
+        )
+        limits = settings.limits()
+        assert limits.max_connections == 10
+        assert limits.max_keepalive_connections == 5
+        assert limits.keepalive_expiry == 1.5
+
+    def test_settings_are_hashable(self) -> None:
+        assert TransportSettings() == TransportSettings()
+        assert hash(TransportSettings()) == hash(TransportSettings())
+
+
+class TestTransportPool:
+    """Test pooled client reuse and lifecycle."""
+
+    async def test_reuses_client_for_same_url(self, pool) -> None:
+        assert pool.get(API_URL) is pool.get(f"{API_URL}/")
+        assert pool.open_clients() == 1
+
+    async def test_separate_client_per_url(self, pool) -> None:
+        assert pool.get(API_URL) is not pool.get("https://api.example.com")
+        assert pool.open_clients() == 2
+
+    async def test_separate_client_per_settings(self, pool) -> None:
+        default = pool.get(API_URL)
+        tuned = pool.get(API_URL, TransportSettings(max_connections=5))
+        assert default is not tuned
+
+    async def test_aclose_closes_clients(self, pool) -> None:
+        client = pool.get(API_URL)
+        await pool.aclose()
+        assert client.is_closed
+        assert pool.open_clients() == 0
+        assert pool.get(API_URL) is not client
+
+    def test_separate_client_per_event_loop(self) -> None:
+        pool = TransportPool()
+
+        async def get_and_close() -> httpx.AsyncClient:
+            client = pool.get(API_URL)
+            await pool.aclose()
+            return client
+
+        assert asyncio.run(get_and_close()) is not asyncio.run(get_and_close())
+
+
+class TestClientTransport:
+    """Test how the API client borrows pooled transports."""
+
+    async def test_clients_share_pooled_transport(self, pool) -> None:
+        first = {{ cookiecutter.client_class_name }}(API_URL, pool=pool)
+        second = {{ cookiecutter.client_class_name }}(API_URL, pool=pool)
+        assert first.client is second.client
+
+    async def test_context_exit_keeps_pooled_transport_open(self, pool) -> None:
+        async with {{ cookiecutter.client_class_name }}(API_URL, pool=pool) as client:
+            http_client = client.client
+        assert not http_client.is_closed
+
+    async def test_injected_client_is_used(self, pool) -> None:
+        async with httpx.AsyncClient() as http_client:
+            client = {{ cookiecutter.client_class_name }}(API_URL, client=http_client, pool=pool)
+            assert client.client is http_client
+        assert pool.open_clients() == 0
+
+    async def test_processor_settings_reach_transport(self, processor) -> None:
+        processor.config.update(max_connections=7, http2=False)
+        settings = processor._get_client()._transport_settings
+        assert settings.max_connections == 7
+        assert settings.http2 is False
@@ -0,0 +1,101 @@
+"""Tests for the gateway payload structs."""
+
+import json
+import tracemalloc
+
+import pytest
+
+from {{ cookiecutter.package_name }}.types import Notification
+from {{ cookiecutter.package_name }}.types import PaymentResponse
+from {{ cookiecutter.package_name }}.types import Struct
+from {{ cookiecutter.package_name }}.types import TransactionStatus
+from {{ cookiecutter.package_name }}.types import renamed
+from {{ cookiecutter.package_name }}.types import struct
+
+
+CALLBACK = {
+    "notificationId": "ntf-1",
+    "paymentId": "pay-1",
+    "status": "COMPLETED",
+    "amount": 10000,
+    "currency": "PLN",
+}
+
+
+@struct
+class Refund(Struct):
+    id: str
+    status: TransactionStatus
+
+
+@struct
+class RefundList(Struct):
+    refunds: list[Refund]
+    payment: PaymentResponse | None = None
+    total: int = renamed("totalCount", default=0)
+
+
+def _retained(build) -> int:
+    tracemalloc.start()
+    try:
+        objects = build()
+        retained, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert objects
+    return retained
+
+
+class TestStruct:
+    """Test decoding payloads into slotted structs."""
+
+    def test_decode_from_bytes(self) -> None:
+        notification = Notification.decode(json.dumps(CALLBACK).encode())
+        assert notification.notification_id == "ntf-1"
+        assert notification.payment_id == "pay-1"
+        assert notification.status is TransactionStatus.COMPLETED
+        assert notification.amount == 10000
+
+    def test_is_slotted(self) -> None:
+        notification = Notification.from_dict(CALLBACK)
+        assert not hasattr(notification, "__dict__")
+
+    def test_optional_and_unknown_members(self) -> None:
+        payment = PaymentResponse.decode(b'{"id": "pay-1", "extra": 1}')
+        assert payment == PaymentResponse(id="pay-1")
+
+    def test_nested_structs(self) -> None:
+        body = json.dumps(
+            {
+                "refunds": [{"id": "ref-1", "status": "PENDING"}],
+                "payment": {"id": "pay-1", "status": "COMPLETED"},
+                "totalCount": 1,
+            }
+        )
+        refunds = RefundList.decode(body)
+        assert refunds.refunds == [Refund("ref-1", TransactionStatus.PENDING)]
+        assert refunds.payment.status is TransactionStatus.COMPLETED
+        assert refunds.total == 1
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            b'{"notificationId": "ntf-1", "status": "COMPLETED"}',
+            b'{"notificationId": "n", "paymentId": "p", "status": "LOST"}',
+            b'{"notificationId": "n", "paymentId": 1, "status": "PENDING"}',
+            b'{"notificationId": "n", "paymentId": "p", "status": "PENDING",'
+            b' "amount": true}',
+            b"[]",
+        ],
+    )
+    def test_invalid_payloads(self, body: bytes) -> None:
+        with pytest.raises(ValueError):
+            Notification.decode(body)
+
+    def test_smaller_than_dicts(self) -> None:
+        body = json.dumps(CALLBACK).encode()
+        dicts = _retained(lambda: [json.loads(body) for _ in range(1000)])
+        structs = _retained(
+            lambda: [Notification.decode(body) for _ in range(1000)]
+        )
+        assert structs < dicts / 2